@@ -1,10 +1,44 @@
 import re
-from math import sqrt
+import os
+import hashlib
+import json
+import time
+import traceback
+from math import sqrt, isnan
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime as dt
+import numpy
+import scipy.io
 
 from .INCA_i import inca_i
 from .INCA_o import inca_o
-
+from .INCA_atomMapping import inca_atomMapping
+from .INCA_profiler import null_profiler
+from .INCA_cache import inca_scriptCache
+
+def _make_isotopomerRxnEquations_chunk(rxns_I, memoize_I=False):
+    '''generate the reaction equations of a chunk of reactions
+    (module level so that it can be sent to worker processes)'''
+    return inca_api().make_isotopomerRxnEquations_batch(rxns_I, memoize_I=memoize_I);
+def _write_isotopomerExperiments_chunk(jobs_I, directory_I):
+    '''render and write a chunk of experiment script jobs (see write_isotopomerExperiments_batch)
+    (module level so that it can be sent to worker processes; the jobs of a chunk share a model cache)
+    OUTPUT:
+    entries_O = [], manifest entry of each job'''
+    api = inca_api();
+    modelCache = inca_scriptCache();
+    return [api._write_isotopomerExperiment_job(job, directory_I, modelCache) for job in jobs_I];
+def _write_isotopomerExperiments_isolated(job_I, directory_I):
+    '''render and write a single experiment script job in its own worker process
+    (used to retry the jobs of a pool whose worker died, so that a job that kills its worker only fails itself)
+    OUTPUT:
+    entry_O = {}, manifest entry of the job'''
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return executor.submit(_write_isotopomerExperiments_chunk, [job_I], directory_I).result()[0];
+    except Exception:
+        return inca_api()._get_isotopomerExperimentEntry(job_I, traceback.format_exc());
 class inca_api():
     '''class of methods to interact with the INCA matlab interface
     1. output to .m scripts
@@ -12,154 +46,64 @@ class inca_api():
     3. internal methods for parsing and writing reactions
     '''
     def __init__(self):
+        self.profiler = null_profiler; # see set_profiler
         #modified biomass (INCA does not like exponential terms)
         self.biomass_INCA_iJS2012 = '0.488*ala_DASH_L_c + 0.0004*nadph_c + 0.176*phe_DASH_L_c + 0.582*gly_c + 0.00013*nadp_c + 0.276*ile_DASH_L_c + 0.21*pro_DASH_L_c + 0.25*glu_DASH_L_c + 0.154*glycogen_c + 45.73*atp_c + 0.139*utp_c + 0.00645*clpnEC_e + 0.131*tyr_DASH_L_c + 0.203*gtp_c + 0.00005*nadh_c + 0.0000006*coa_c + 0.00215*nad_c + 0.326*lys_DASH_L_c + 0.25*gln_DASH_L_c + 0.000003*succoa_c + 45.56*h2o_c + 0.205*ser_DASH_L_c + 0.126*ctp_c + 0.001*amp_c + 0.09675*peEC_e + 0.054*trp_DASH_L_c + 0.09*his_DASH_L_c + 0.0276*peptidoEC_e + 0.087*cys_DASH_L_c + 0.0084*lpsEC_e + 0.0247*datp_c + 0.0247*dttp_c + 0.241*thr_DASH_L_c + 0.281*arg_DASH_L_c + 0.00005*accoa_c + 0.402*val_DASH_L_c + 0.007*spmd_c + 0.0254*dgtp_c + 0.0232*pgEC_e + 0.146*met_DASH_L_c + 0.035*ptrc_c + 0.0254*dctp_c + 0.428*leu_DASH_L_c + 0.05*5mthf_c + 0.229*asp_DASH_L_c + 0.229*asn_DASH_L_c + 0.003*g1p_c + 0.0026*psEC_e + 0.00001*fad_c -> 45.56*pi_c + 45.56*h_c + 45.56*adp_c + 0.7332*ppi_c';
         self.biomass_INCA_iJS2012_v1 = '0.488*ala_DASH_L_c (C1:d C2:e C3:f) + 0.0004*nadph_c + 0.176*phe_DASH_L_c (C1:p C2:q C3:r C4:s C5:t C6:u C7:v C8:w C9:x) + 0.582*gly_c (C1:N C2:O) + 0.00013*nadp_c + 0.276*ile_DASH_L_c (C1:2 C2:3 C3:4 C4:5 C5:6 C6:7) + 0.21*pro_DASH_L_c (C1:y C2:z C3:A C4:B C5:C) + 0.25*glu_DASH_L_c (C1:I C2:J C3:K C4:L C5:M) + 0.154*glycogen_c (C1:P C2:Q C3:R C4:S C5:T C6:U) + 45.7318*atp_c + 0.139*utp_c + 0.00645*clpnEC_e + 0.131*tyr_DASH_L_c (C1:b C2:c C3:d C4:e C5:f C6:g C7:h C8:i C9:j) + 0.203*gtp_c + 0.00005*nadh_c + 0.000006*coa_c + 0.00215*nad_c + 0.326*lys_DASH_L_c (C1:e C2:f C3:g C4:h C5:i C6:j) + 0.25*gln_DASH_L_c (C1:D C2:E C3:F C4:G C5:H) + 0.000003*succoa_c (C1:R C2:S C3:T C4:U) + 45.5608*h2o_c + 0.205*ser_DASH_L_c (C1:H C2:I C3:J) + 0.126*ctp_c + 0.001*amp_c + 0.09675*peEC_e + 0.054*trp_DASH_L_c (C1:Z C2:1 C3:2 C4:3 C5:4 C6:5 C7:6 C8:7 C9:8 C10:9 C11:a) + 0.09*his_DASH_L_c (C1:V C2:W C3:X C4:Y C5:Z C6:1) + 0.0276*peptidoEC_e + 0.087*cys_DASH_L_c (C1:u C2:v C3:w) + 0.0084*lpsEC_e + 0.0247*datp_c + 0.0247*dttp_c + 0.241*thr_DASH_L_c (C1:V C2:W C3:X C4:Y) + 0.281*arg_DASH_L_c (C1:g C2:h C3:i C4:j C5:k C6:l) + 0.00005*accoa_c (C1:b C2:c) + 0.402*val_DASH_L_c (C1:k C2:l C3:m C4:n C5:o) + 0.007*spmd_c (C1:K C2:L C3:M C4:N C5:O C6:P C7:Q) + 0.0254*dgtp_c + 0.0232*pgEC_e + 0.146*met_DASH_L_c (C1:k C2:l C3:m C4:n C5:o) + 0.035*ptrc_c (C1:D C2:E C3:F C4:G) + 0.0254*dctp_c + 0.428*leu_DASH_L_c (C1:8 C2:9 C3:a C4:b C5:c C6:d) + 0.05*5mthf_c (C1:a) + 0.229*asp_DASH_L_c (C1:q C2:r C3:s C4:t) + 0.229*asn_DASH_L_c (C1:m C2:n C3:o C4:p) + 0.003*g1p_c (C1:x C2:y C3:z C4:A C5:B C6:C) + 0.0026*psEC_e + 0.00001*fad_c -> 45.5628*pi_c + 45.55735*h_c + 45.5608*adp_c + 0.7332*ppi_c ';
         self.biomass_INCA_iJS2012_v2 = '0.488*ala_DASH_L_c (C1:ala_DASH_L_cd C2:ala_DASH_L_ce C3:ala_DASH_L_cf) + 0.0004*nadph_c + 0.176*phe_DASH_L_c (C1:phe_DASH_L_cp C2:phe_DASH_L_cq C3:phe_DASH_L_cr C4:phe_DASH_L_cs C5:phe_DASH_L_ct C6:phe_DASH_L_cu C7:phe_DASH_L_cv C8:phe_DASH_L_cw C9:phe_DASH_L_cx) + 0.582*gly_c (C1:gly_cN C2:gly_cO) + 0.00013*nadp_c + 0.276*ile_DASH_L_c (C1:ile_DASH_L_c2 C2:ile_DASH_L_c3 C3:ile_DASH_L_c4 C4:ile_DASH_L_c5 C5:ile_DASH_L_c6 C6:ile_DASH_L_c7) + 0.21*pro_DASH_L_c (C1:pro_DASH_L_cy C2:pro_DASH_L_cz C3:pro_DASH_L_cA C4:pro_DASH_L_cB C5:pro_DASH_L_cC) + 0.25*glu_DASH_L_c (C1:glu_DASH_L_cI C2:glu_DASH_L_cJ C3:glu_DASH_L_cK C4:glu_DASH_L_cL C5:glu_DASH_L_cM) + 0.154*glycogen_c (C1:glycogen_cP C2:glycogen_cQ C3:glycogen_cR C4:glycogen_cS C5:glycogen_cT C6:glycogen_cU) + 45.73*atp_c + 0.139*utp_c + 0.00645*clpnEC_e + 0.131*tyr_DASH_L_c (C1:tyr_DASH_L_cb C2:tyr_DASH_L_cc C3:tyr_DASH_L_cd C4:tyr_DASH_L_ce C5:tyr_DASH_L_cf C6:tyr_DASH_L_cg C7:tyr_DASH_L_ch C8:tyr_DASH_L_ci C9:tyr_DASH_L_cj) + 0.203*gtp_c + 0.00005*nadh_c + 0.0000006*coa_c + 0.00215*nad_c + 0.326*lys_DASH_L_c (C1:lys_DASH_L_ce C2:lys_DASH_L_cf C3:lys_DASH_L_cg C4:lys_DASH_L_ch C5:lys_DASH_L_ci C6:lys_DASH_L_cj) + 0.25*gln_DASH_L_c (C1:gln_DASH_L_cD C2:gln_DASH_L_cE C3:gln_DASH_L_cF C4:gln_DASH_L_cG C5:gln_DASH_L_cH) + 0.000003*succoa_c (C1:succoa_cR C2:succoa_cS C3:succoa_cT C4:succoa_cU) + 45.56*h2o_c + 0.205*ser_DASH_L_c (C1:ser_DASH_L_cH C2:ser_DASH_L_cI C3:ser_DASH_L_cJ) + 0.126*ctp_c + 0.001*amp_c + 0.09675*peEC_e + 0.054*trp_DASH_L_c (C1:trp_DASH_L_cZ C2:trp_DASH_L_c1 C3:trp_DASH_L_c2 C4:trp_DASH_L_c3 C5:trp_DASH_L_c4 C6:trp_DASH_L_c5 C7:trp_DASH_L_c6 C8:trp_DASH_L_c7 C9:trp_DASH_L_c8 C10:trp_DASH_L_c9 C11:trp_DASH_L_ca) + 0.09*his_DASH_L_c (C1:his_DASH_L_cV C2:his_DASH_L_cW C3:his_DASH_L_cX C4:his_DASH_L_cY C5:his_DASH_L_cZ C6:his_DASH_L_c1) + 0.0276*peptidoEC_e + 0.087*cys_DASH_L_c (C1:cys_DASH_L_cu C2:cys_DASH_L_cv C3:cys_DASH_L_cw) + 0.0084*lpsEC_e + 0.0247*datp_c + 0.0247*dttp_c + 0.241*thr_DASH_L_c (C1:thr_DASH_L_cV C2:thr_DASH_L_cW C3:thr_DASH_L_cX C4:thr_DASH_L_cY) + 0.281*arg_DASH_L_c (C1:arg_DASH_L_cg C2:arg_DASH_L_ch C3:arg_DASH_L_ci C4:arg_DASH_L_cj C5:arg_DASH_L_ck C6:arg_DASH_L_cl) + 0.00005*accoa_c (C1:accoa_cb C2:accoa_cc) + 0.402*val_DASH_L_c (C1:val_DASH_L_ck C2:val_DASH_L_cl C3:val_DASH_L_cm C4:val_DASH_L_cn C5:val_DASH_L_co) + 0.007*spmd_c (C1:spmd_cK C2:spmd_cL C3:spmd_cM C4:spmd_cN C5:spmd_cO C6:spmd_cP C7:spmd_cQ) + 0.0254*dgtp_c + 0.0232*pgEC_e + 0.146*met_DASH_L_c (C1:met_DASH_L_ck C2:met_DASH_L_cl C3:met_DASH_L_cm C4:met_DASH_L_cn C5:met_DASH_L_co) + 0.035*ptrc_c (C1:ptrc_cD C2:ptrc_cE C3:ptrc_cF C4:ptrc_cG) + 0.0254*dctp_c + 0.428*leu_DASH_L_c (C1:leu_DASH_L_c8 C2:leu_DASH_L_c9 C3:leu_DASH_L_ca C4:leu_DASH_L_cb C5:leu_DASH_L_cc C6:leu_DASH_L_cd) + 0.05*5mthf_c (C1:5mthf_ca) + 0.229*asp_DASH_L_c (C1:asp_DASH_L_cq C2:asp_DASH_L_cr C3:asp_DASH_L_cs C4:asp_DASH_L_ct) + 0.229*asn_DASH_L_c (C1:asn_DASH_L_cm C2:asn_DASH_L_cn C3:asn_DASH_L_co C4:asn_DASH_L_cp) + 0.003*g1p_c (C1:g1p_cx C2:g1p_cy C3:g1p_cz C4:g1p_cA C5:g1p_cB C6:g1p_cC) + 0.0026*psEC_e + 0.00001*fad_c -> 45.56*pi_c + 45.56*h_c + 45.56*adp_c + 0.7332*ppi_c';
         self.biomass_INCA = '0.005707*pg160_c (C1:pg160_c0_C0 C2:pg160_c0_C1 C3:pg160_c0_C2 C4:pg160_c0_C3 C5:pg160_c0_C4 C6:pg160_c0_C5) + 0.000168*coa_c (C1:coa_c0_C0 C2:coa_c0_C1 C3:coa_c0_C2 C4:coa_c0_C3 C5:coa_c0_C4 C6:coa_c0_C5 C7:coa_c0_C6 C8:coa_c0_C7 C9:coa_c0_C8 C10:coa_c0_C9 C11:coa_c0_C10 C12:coa_c0_C11 C13:coa_c0_C12 C14:coa_c0_C13 C15:coa_c0_C14 C16:coa_c0_C15 C17:coa_c0_C16 C18:coa_c0_C17 C19:coa_c0_C18 C20:coa_c0_C19 C21:coa_c0_C20) + 0.000003*lipopb_c + 0.000307*ni2_c + 0.000055*udcpdp_c (C1:udcpdp_c0_C0 C2:udcpdp_c0_C1 C3:udcpdp_c0_C2 C4:udcpdp_c0_C3 C5:udcpdp_c0_C4 C6:udcpdp_c0_C5 C7:udcpdp_c0_C6 C8:udcpdp_c0_C7 C9:udcpdp_c0_C8 C10:udcpdp_c0_C9 C11:udcpdp_c0_C10 C12:udcpdp_c0_C11 C13:udcpdp_c0_C12 C14:udcpdp_c0_C13 C15:udcpdp_c0_C14 C16:udcpdp_c0_C15 C17:udcpdp_c0_C16 C18:udcpdp_c0_C17 C19:udcpdp_c0_C18 C20:udcpdp_c0_C19 C21:udcpdp_c0_C20 C22:udcpdp_c0_C21 C23:udcpdp_c0_C22 C24:udcpdp_c0_C23 C25:udcpdp_c0_C24 C26:udcpdp_c0_C25 C27:udcpdp_c0_C26 C28:udcpdp_c0_C27 C29:udcpdp_c0_C28 C30:udcpdp_c0_C29 C31:udcpdp_c0_C30 C32:udcpdp_c0_C31 C33:udcpdp_c0_C32 C34:udcpdp_c0_C33 C35:udcpdp_c0_C34 C36:udcpdp_c0_C35 C37:udcpdp_c0_C36 C38:udcpdp_c0_C37 C39:udcpdp_c0_C38 C40:udcpdp_c0_C39 C41:udcpdp_c0_C40 C42:udcpdp_c0_C41 C43:udcpdp_c0_C42 C44:udcpdp_c0_C43 C45:udcpdp_c0_C44 C46:udcpdp_c0_C45 C47:udcpdp_c0_C46 C48:udcpdp_c0_C47 C49:udcpdp_c0_C48 C50:udcpdp_c0_C49 C51:udcpdp_c0_C50 C52:udcpdp_c0_C51 C53:udcpdp_c0_C52 C54:udcpdp_c0_C53 C55:udcpdp_c0_C54) + 0.004957*pe181_c (C1:pe181_c0_C0 C2:pe181_c0_C1 C3:pe181_c0_C2 C4:pe181_c0_C3 C5:pe181_c0_C4) + 0.000112*nadp_c (C1:nadp_c0_C0 C2:nadp_c0_C1 C3:nadp_c0_C2 C4:nadp_c0_C3 C5:nadp_c0_C4 C6:nadp_c0_C5 C7:nadp_c0_C6 C8:nadp_c0_C7 C9:nadp_c0_C8 C10:nadp_c0_C9 C11:nadp_c0_C10 C12:nadp_c0_C11 C13:nadp_c0_C12 C14:nadp_c0_C13 C15:nadp_c0_C14 C16:nadp_c0_C15 C17:nadp_c0_C16 C18:nadp_c0_C17 C19:nadp_c0_C18 C20:nadp_c0_C19 C21:nadp_c0_C20) + 0.140101*utp_c (C1:utp_c0_C0 C2:utp_c0_C1 C3:utp_c0_C2 C4:utp_c0_C3 C5:utp_c0_C4 C6:utp_c0_C5 C7:utp_c0_C6 C8:utp_c0_C7 C9:utp_c0_C8) + 0.008253*mg2_c + 0.000024*cobalt2_c + 0.234232*asp_DASH_L_c (C1:asp_DASH_L_c0_C0 C2:asp_DASH_L_c0_C1 C3:asp_DASH_L_c0_C2 C4:asp_DASH_L_c0_C3) + 0.002288*pg181_c (C1:pg181_c0_C0 C2:pg181_c0_C1 C3:pg181_c0_C2 C4:pg181_c0_C3 C5:pg181_c0_C4 C6:pg181_c0_C5) + 0.154187*glycogen_c (C1:glycogen_c0_C0 C2:glycogen_c0_C1 C3:glycogen_c0_C2 C4:glycogen_c0_C3 C5:glycogen_c0_C4 C6:glycogen_c0_C5) + 0.000098*succoa_c (C1:succoa_c0_C0 C2:succoa_c0_C1 C3:succoa_c0_C2 C4:succoa_c0_C3 C5:succoa_c0_C4 C6:succoa_c0_C5 C7:succoa_c0_C6 C8:succoa_c0_C7 C9:succoa_c0_C8 C10:succoa_c0_C9 C11:succoa_c0_C10 C12:succoa_c0_C11 C13:succoa_c0_C12 C14:succoa_c0_C13 C15:succoa_c0_C14 C16:succoa_c0_C15 C17:succoa_c0_C16 C18:succoa_c0_C17 C19:succoa_c0_C18 C20:succoa_c0_C19 C21:succoa_c0_C20 C22:succoa_c0_C21 C23:succoa_c0_C22 C24:succoa_c0_C23 C25:succoa_c0_C24) + 48.752916*h2o_c + 0.031798*pe160_p (C1:pe160_p0_C0 C2:pe160_p0_C1 C3:pe160_p0_C2 C4:pe160_p0_C3 C5:pe160_p0_C4) + 0.000223*gthrd_c (C1:gthrd_c0_C0 C2:gthrd_c0_C1 C3:gthrd_c0_C2 C4:gthrd_c0_C3 C5:gthrd_c0_C4 C6:gthrd_c0_C5 C7:gthrd_c0_C6 C8:gthrd_c0_C7 C9:gthrd_c0_C8 C10:gthrd_c0_C9) + 0.000031*malcoa_c (C1:malcoa_c0_C0 C2:malcoa_c0_C1 C3:malcoa_c0_C2 C4:malcoa_c0_C3 C5:malcoa_c0_C4 C6:malcoa_c0_C5 C7:malcoa_c0_C6 C8:malcoa_c0_C7 C9:malcoa_c0_C8 C10:malcoa_c0_C9 C11:malcoa_c0_C10 C12:malcoa_c0_C11 C13:malcoa_c0_C12 C14:malcoa_c0_C13 C15:malcoa_c0_C14 C16:malcoa_c0_C15 C17:malcoa_c0_C16 C18:malcoa_c0_C17 C19:malcoa_c0_C18 C20:malcoa_c0_C19 C21:malcoa_c0_C20 C22:malcoa_c0_C21 C23:malcoa_c0_C22 C24:malcoa_c0_C23) + 0.209684*ser_DASH_L_c (C1:ser_DASH_L_c0_C0 C2:ser_DASH_L_c0_C1 C3:ser_DASH_L_c0_C2) + 0.234232*asn_DASH_L_c (C1:asn_DASH_L_c0_C0 C2:asn_DASH_L_c0_C1 C3:asn_DASH_L_c0_C2 C4:asn_DASH_L_c0_C3) + 0.000223*amet_c (C1:amet_c0_C0 C2:amet_c0_C1 C3:amet_c0_C2 C4:amet_c0_C3 C5:amet_c0_C4 C6:amet_c0_C5 C7:amet_c0_C6 C8:amet_c0_C7 C9:amet_c0_C8 C10:amet_c0_C9 C11:amet_c0_C10 C12:amet_c0_C11 C13:amet_c0_C12 C14:amet_c0_C13 C15:amet_c0_C14) + 0.595297*gly_c (C1:gly_c0_C0 C2:gly_c0_C1) + 0.000605*murein3px4p_p (C1:murein3px4p_p0_C0 C2:murein3px4p_p0_C1 C3:murein3px4p_p0_C2 C4:murein3px4p_p0_C3 C5:murein3px4p_p0_C4 C6:murein3px4p_p0_C5 C7:murein3px4p_p0_C6 C8:murein3px4p_p0_C7 C9:murein3px4p_p0_C8 C10:murein3px4p_p0_C9 C11:murein3px4p_p0_C10 C12:murein3px4p_p0_C11 C13:murein3px4p_p0_C12 C14:murein3px4p_p0_C13 C15:murein3px4p_p0_C14 C16:murein3px4p_p0_C15 C17:murein3px4p_p0_C16 C18:murein3px4p_p0_C17 C19:murein3px4p_p0_C18 C20:murein3px4p_p0_C19 C21:murein3px4p_p0_C20 C22:murein3px4p_p0_C21 C23:murein3px4p_p0_C22 C24:murein3px4p_p0_C23 C25:murein3px4p_p0_C24 C26:murein3px4p_p0_C25 C27:murein3px4p_p0_C26 C28:murein3px4p_p0_C27 C29:murein3px4p_p0_C28 C30:murein3px4p_p0_C29 C31:murein3px4p_p0_C30 C32:murein3px4p_p0_C31 C33:murein3px4p_p0_C32 C34:murein3px4p_p0_C33 C35:murein3px4p_p0_C34 C36:murein3px4p_p0_C35 C37:murein3px4p_p0_C36 C38:murein3px4p_p0_C37 C39:murein3px4p_p0_C38 C40:murein3px4p_p0_C39 C41:murein3px4p_p0_C40 C42:murein3px4p_p0_C41 C43:murein3px4p_p0_C42 C44:murein3px4p_p0_C43 C45:murein3px4p_p0_C44 C46:murein3px4p_p0_C45 C47:murein3px4p_p0_C46 C48:murein3px4p_p0_C47 C49:murein3px4p_p0_C48 C50:murein3px4p_p0_C49 C51:murein3px4p_p0_C50 C52:murein3px4p_p0_C51 C53:murein3px4p_p0_C52 C54:murein3px4p_p0_C53 C55:murein3px4p_p0_C54 C56:murein3px4p_p0_C55 C57:murein3px4p_p0_C56 C58:murein3px4p_p0_C57 C59:murein3px4p_p0_C58 C60:murein3px4p_p0_C59 C61:murein3px4p_p0_C60 C62:murein3px4p_p0_C61 C63:murein3px4p_p0_C62 C64:murein3px4p_p0_C63 C65:murein3px4p_p0_C64 C66:murein3px4p_p0_C65 C67:murein3px4p_p0_C66 C68:murein3px4p_p0_C67 C69:murein3px4p_p0_C68 C70:murein3px4p_p0_C69 C71:murein3px4p_p0_C70) + 0.055234*trp_DASH_L_c (C1:trp_DASH_L_c0_C0 C2:trp_DASH_L_c0_C1 C3:trp_DASH_L_c0_C2 C4:trp_DASH_L_c0_C3 C5:trp_DASH_L_c0_C4 C6:trp_DASH_L_c0_C5 C7:trp_DASH_L_c0_C6 C8:trp_DASH_L_c0_C7 C9:trp_DASH_L_c0_C8 C10:trp_DASH_L_c0_C9 C11:trp_DASH_L_c0_C10) + 0.03327*ptrc_c (C1:ptrc_c0_C0 C2:ptrc_c0_C1 C3:ptrc_c0_C2 C4:ptrc_c0_C3) + 0.006388*fe2_c + 0.000223*thf_c + 0.000007*mocogdp_c + 0.000223*fad_c (C1:fad_c0_C0 C2:fad_c0_C1 C3:fad_c0_C2 C4:fad_c0_C3 C5:fad_c0_C4 C6:fad_c0_C5 C7:fad_c0_C6 C8:fad_c0_C7 C9:fad_c0_C8 C10:fad_c0_C9 C11:fad_c0_C10 C12:fad_c0_C11 C13:fad_c0_C12 C14:fad_c0_C13 C15:fad_c0_C14 C16:fad_c0_C15 C17:fad_c0_C16 C18:fad_c0_C17 C19:fad_c0_C18 C20:fad_c0_C19 C21:fad_c0_C20 C22:fad_c0_C21 C23:fad_c0_C22 C24:fad_c0_C23 C25:fad_c0_C24 C26:fad_c0_C25 C27:fad_c0_C26) + 0.004126*so4_c + 0.411184*val_DASH_L_c (C1:val_DASH_L_c0_C0 C2:val_DASH_L_c0_C1 C3:val_DASH_L_c0_C2 C4:val_DASH_L_c0_C3 C5:val_DASH_L_c0_C4) + 0.18569*k_c + 0.005381*murein4p4p_p (C1:murein4p4p_p0_C0 C2:murein4p4p_p0_C1 C3:murein4p4p_p0_C2 C4:murein4p4p_p0_C3 C5:murein4p4p_p0_C4 C6:murein4p4p_p0_C5 C7:murein4p4p_p0_C6 C8:murein4p4p_p0_C7 C9:murein4p4p_p0_C8 C10:murein4p4p_p0_C9 C11:murein4p4p_p0_C10 C12:murein4p4p_p0_C11 C13:murein4p4p_p0_C12 C14:murein4p4p_p0_C13 C15:murein4p4p_p0_C14 C16:murein4p4p_p0_C15 C17:murein4p4p_p0_C16 C18:murein4p4p_p0_C17 C19:murein4p4p_p0_C18 C20:murein4p4p_p0_C19 C21:murein4p4p_p0_C20 C22:murein4p4p_p0_C21 C23:murein4p4p_p0_C22 C24:murein4p4p_p0_C23 C25:murein4p4p_p0_C24 C26:murein4p4p_p0_C25 C27:murein4p4p_p0_C26 C28:murein4p4p_p0_C27 C29:murein4p4p_p0_C28 C30:murein4p4p_p0_C29 C31:murein4p4p_p0_C30 C32:murein4p4p_p0_C31 C33:murein4p4p_p0_C32 C34:murein4p4p_p0_C33 C35:murein4p4p_p0_C34 C36:murein4p4p_p0_C35 C37:murein4p4p_p0_C36 C38:murein4p4p_p0_C37 C39:murein4p4p_p0_C38 C40:murein4p4p_p0_C39 C41:murein4p4p_p0_C40 C42:murein4p4p_p0_C41 C43:murein4p4p_p0_C42 C44:murein4p4p_p0_C43 C45:murein4p4p_p0_C44 C46:murein4p4p_p0_C45 C47:murein4p4p_p0_C46 C48:murein4p4p_p0_C47 C49:murein4p4p_p0_C48 C50:murein4p4p_p0_C49 C51:murein4p4p_p0_C50 C52:murein4p4p_p0_C51 C53:murein4p4p_p0_C52 C54:murein4p4p_p0_C53 C55:murein4p4p_p0_C54 C56:murein4p4p_p0_C55 C57:murein4p4p_p0_C56 C58:murein4p4p_p0_C57 C59:murein4p4p_p0_C58 C60:murein4p4p_p0_C59 C61:murein4p4p_p0_C60 C62:murein4p4p_p0_C61 C63:murein4p4p_p0_C62 C64:murein4p4p_p0_C63 C65:murein4p4p_p0_C64 C66:murein4p4p_p0_C65 C67:murein4p4p_p0_C66 C68:murein4p4p_p0_C67 C69:murein4p4p_p0_C68 C70:murein4p4p_p0_C69 C71:murein4p4p_p0_C70 C72:murein4p4p_p0_C71 C73:murein4p4p_p0_C72 C74:murein4p4p_p0_C73) + 0.000223*adocbl_c + 0.005448*murein4px4p_p (C1:murein4px4p_p0_C0 C2:murein4px4p_p0_C1 C3:murein4px4p_p0_C2 C4:murein4px4p_p0_C3 C5:murein4px4p_p0_C4 C6:murein4px4p_p0_C5 C7:murein4px4p_p0_C6 C8:murein4px4p_p0_C7 C9:murein4px4p_p0_C8 C10:murein4px4p_p0_C9 C11:murein4px4p_p0_C10 C12:murein4px4p_p0_C11 C13:murein4px4p_p0_C12 C14:murein4px4p_p0_C13 C15:murein4px4p_p0_C14 C16:murein4px4p_p0_C15 C17:murein4px4p_p0_C16 C18:murein4px4p_p0_C17 C19:murein4px4p_p0_C18 C20:murein4px4p_p0_C19 C21:murein4px4p_p0_C20 C22:murein4px4p_p0_C21 C23:murein4px4p_p0_C22 C24:murein4px4p_p0_C23 C25:murein4px4p_p0_C24 C26:murein4px4p_p0_C25 C27:murein4px4p_p0_C26 C28:murein4px4p_p0_C27 C29:murein4px4p_p0_C28 C30:murein4px4p_p0_C29 C31:murein4px4p_p0_C30 C32:murein4px4p_p0_C31 C33:murein4px4p_p0_C32 C34:murein4px4p_p0_C33 C35:murein4px4p_p0_C34 C36:murein4px4p_p0_C35 C37:murein4px4p_p0_C36 C38:murein4px4p_p0_C37 C39:murein4px4p_p0_C38 C40:murein4px4p_p0_C39 C41:murein4px4p_p0_C40 C42:murein4px4p_p0_C41 C43:murein4px4p_p0_C42 C44:murein4px4p_p0_C43 C45:murein4px4p_p0_C44 C46:murein4px4p_p0_C45 C47:murein4px4p_p0_C46 C48:murein4px4p_p0_C47 C49:murein4px4p_p0_C48 C50:murein4px4p_p0_C49 C51:murein4px4p_p0_C50 C52:murein4px4p_p0_C51 C53:murein4px4p_p0_C52 C54:murein4px4p_p0_C53 C55:murein4px4p_p0_C54 C56:murein4px4p_p0_C55 C57:murein4px4p_p0_C56 C58:murein4px4p_p0_C57 C59:murein4px4p_p0_C58 C60:murein4px4p_p0_C59 C61:murein4px4p_p0_C60 C62:murein4px4p_p0_C61 C63:murein4px4p_p0_C62 C64:murein4px4p_p0_C63 C65:murein4px4p_p0_C64 C66:murein4px4p_p0_C65 C67:murein4px4p_p0_C66 C68:murein4px4p_p0_C67 C69:murein4px4p_p0_C68 C70:murein4px4p_p0_C69 C71:murein4px4p_p0_C70 C72:murein4px4p_p0_C71 C73:murein4px4p_p0_C72 C74:murein4px4p_p0_C73) + 0.004952*ca2_c + 0.000025*2fe2s_c + 0.000335*nadph_c (C1:nadph_c0_C0 C2:nadph_c0_C1 C3:nadph_c0_C2 C4:nadph_c0_C3 C5:nadph_c0_C4 C6:nadph_c0_C5 C7:nadph_c0_C6 C8:nadph_c0_C7 C9:nadph_c0_C8 C10:nadph_c0_C9 C11:nadph_c0_C10 C12:nadph_c0_C11 C13:nadph_c0_C12 C14:nadph_c0_C13 C15:nadph_c0_C14 C16:nadph_c0_C15 C17:nadph_c0_C16 C18:nadph_c0_C17 C19:nadph_c0_C18 C20:nadph_c0_C19 C21:nadph_c0_C20) + 0.000045*nadh_c (C1:nadh_c0_C0 C2:nadh_c0_C1 C3:nadh_c0_C2 C4:nadh_c0_C3 C5:nadh_c0_C4 C6:nadh_c0_C5 C7:nadh_c0_C6 C8:nadh_c0_C7 C9:nadh_c0_C8 C10:nadh_c0_C9 C11:nadh_c0_C10 C12:nadh_c0_C11 C13:nadh_c0_C12 C14:nadh_c0_C13 C15:nadh_c0_C14 C16:nadh_c0_C15 C17:nadh_c0_C16 C18:nadh_c0_C17 C19:nadh_c0_C18 C20:nadh_c0_C19 C21:nadh_c0_C20) + 0.000674*cu2_c + 0.000007*mococdp_c + 0.000223*pheme_c + 0.004439*pg161_c (C1:pg161_c0_C0 C2:pg161_c0_C1 C3:pg161_c0_C2 C4:pg161_c0_C3 C5:pg161_c0_C4 C6:pg161_c0_C5) + 0.012747*pe181_p (C1:pe181_p0_C0 C2:pe181_p0_C1 C3:pe181_p0_C2 C4:pe181_p0_C3 C5:pe181_p0_C4) + 0.282306*ile_DASH_L_c (C1:ile_DASH_L_c0_C0 C2:ile_DASH_L_c0_C1 C3:ile_DASH_L_c0_C2 C4:ile_DASH_L_c0_C3 C5:ile_DASH_L_c0_C4 C6:ile_DASH_L_c0_C5) + 0.000223*chor_c (C1:chor_c0_C0 C2:chor_c0_C1 C3:chor_c0_C2 C4:chor_c0_C3 C5:chor_c0_C4 C6:chor_c0_C5 C7:chor_c0_C6 C8:chor_c0_C7 C9:chor_c0_C8 C10:chor_c0_C9) + 0.000223*q8h2_c + 0.008151*colipa_e + 0.333448*lys_DASH_L_c (C1:lys_DASH_L_c0_C0 C2:lys_DASH_L_c0_C1 C3:lys_DASH_L_c0_C2 C4:lys_DASH_L_c0_C3 C5:lys_DASH_L_c0_C4 C6:lys_DASH_L_c0_C5) + 0.000223*enter_c + 0.000223*mlthf_c (C1:mlthf_c0_C0) + 0.000223*thmpp_c + 0.28742*arg_DASH_L_c (C1:arg_DASH_L_c0_C0 C2:arg_DASH_L_c0_C1 C3:arg_DASH_L_c0_C2 C4:arg_DASH_L_c0_C3 C5:arg_DASH_L_c0_C4 C6:arg_DASH_L_c0_C5) + 0.000002*btn_c + 0.000223*hemeO_c + 0.499149*ala_DASH_L_c (C1:ala_DASH_L_c0_C0 C2:ala_DASH_L_c0_C1 C3:ala_DASH_L_c0_C2) + 0.246506*thr_DASH_L_c (C1:thr_DASH_L_c0_C0 C2:thr_DASH_L_c0_C1 C3:thr_DASH_L_c0_C2 C4:thr_DASH_L_c0_C3) + 0.088988*cys_DASH_L_c (C1:cys_DASH_L_c0_C0 C2:cys_DASH_L_c0_C1 C3:cys_DASH_L_c0_C2) + 0.001787*nad_c (C1:nad_c0_C0 C2:nad_c0_C1 C3:nad_c0_C2 C4:nad_c0_C3 C5:nad_c0_C4 C6:nad_c0_C5 C7:nad_c0_C6 C8:nad_c0_C7 C9:nad_c0_C8 C10:nad_c0_C9 C11:nad_c0_C10 C12:nad_c0_C11 C13:nad_c0_C12 C14:nad_c0_C13 C15:nad_c0_C14 C16:nad_c0_C15 C17:nad_c0_C16 C18:nad_c0_C17 C19:nad_c0_C18 C20:nad_c0_C19 C21:nad_c0_C20) + 0.180021*phe_DASH_L_c (C1:phe_DASH_L_c0_C0 C2:phe_DASH_L_c0_C1 C3:phe_DASH_L_c0_C2 C4:phe_DASH_L_c0_C3 C5:phe_DASH_L_c0_C4 C6:phe_DASH_L_c0_C5 C7:phe_DASH_L_c0_C6 C8:phe_DASH_L_c0_C7 C9:phe_DASH_L_c0_C8) + 0.025612*dctp_c (C1:dctp_c0_C0 C2:dctp_c0_C1 C3:dctp_c0_C2 C4:dctp_c0_C3 C5:dctp_c0_C4 C6:dctp_c0_C5 C7:dctp_c0_C6 C8:dctp_c0_C7 C9:dctp_c0_C8) + 0.149336*met_DASH_L_c (C1:met_DASH_L_c0_C0 C2:met_DASH_L_c0_C1 C3:met_DASH_L_c0_C2 C4:met_DASH_L_c0_C3 C5:met_DASH_L_c0_C4) + 0.012366*pe160_c (C1:pe160_c0_C0 C2:pe160_c0_C1 C3:pe160_c0_C2 C4:pe160_c0_C3 C5:pe160_c0_C4) + 0.209121*gtp_c (C1:gtp_c0_C0 C2:gtp_c0_C1 C3:gtp_c0_C2 C4:gtp_c0_C3 C5:gtp_c0_C4 C6:gtp_c0_C5 C7:gtp_c0_C6 C8:gtp_c0_C7 C9:gtp_c0_C8 C10:gtp_c0_C9) + 0.437778*leu_DASH_L_c (C1:leu_DASH_L_c0_C0 C2:leu_DASH_L_c0_C1 C3:leu_DASH_L_c0_C2 C4:leu_DASH_L_c0_C3 C5:leu_DASH_L_c0_C4 C6:leu_DASH_L_c0_C5) + 0.007428*fe3_c + 0.092056*his_DASH_L_c (C1:his_DASH_L_c0_C0 C2:his_DASH_L_c0_C1 C3:his_DASH_L_c0_C2 C4:his_DASH_L_c0_C3 C5:his_DASH_L_c0_C4 C6:his_DASH_L_c0_C5) + 0.009618*pe161_c (C1:pe161_c0_C0 C2:pe161_c0_C1 C3:pe161_c0_C2 C4:pe161_c0_C3 C5:pe161_c0_C4) + 0.000223*10fthf_c (C1:10fthf_c0_C0) + 0.024805*datp_c (C1:datp_c0_C0 C2:datp_c0_C1 C3:datp_c0_C2 C4:datp_c0_C3 C5:datp_c0_C4 C6:datp_c0_C5 C7:datp_c0_C6 C8:datp_c0_C7 C9:datp_c0_C8 C10:datp_c0_C9) + 0.000223*5mthf_c (C1:5mthf_c0_C0) + 0.000673*murein4px4px4p_p (C1:murein4px4px4p_p0_C0 C2:murein4px4px4p_p0_C1 C3:murein4px4px4p_p0_C2 C4:murein4px4px4p_p0_C3 C5:murein4px4px4p_p0_C4 C6:murein4px4px4p_p0_C5 C7:murein4px4px4p_p0_C6 C8:murein4px4px4p_p0_C7 C9:murein4px4px4p_p0_C8 C10:murein4px4px4p_p0_C9 C11:murein4px4px4p_p0_C10 C12:murein4px4px4p_p0_C11 C13:murein4px4px4p_p0_C12 C14:murein4px4px4p_p0_C13 C15:murein4px4px4p_p0_C14 C16:murein4px4px4p_p0_C15 C17:murein4px4px4p_p0_C16 C18:murein4px4px4p_p0_C17 C19:murein4px4px4p_p0_C18 C20:murein4px4px4p_p0_C19 C21:murein4px4px4p_p0_C20 C22:murein4px4px4p_p0_C21 C23:murein4px4px4p_p0_C22 C24:murein4px4px4p_p0_C23 C25:murein4px4px4p_p0_C24 C26:murein4px4px4p_p0_C25 C27:murein4px4px4p_p0_C26 C28:murein4px4px4p_p0_C27 C29:murein4px4px4p_p0_C28 C30:murein4px4px4p_p0_C29 C31:murein4px4px4p_p0_C30 C32:murein4px4px4p_p0_C31 C33:murein4px4px4p_p0_C32 C34:murein4px4px4p_p0_C33 C35:murein4px4px4p_p0_C34 C36:murein4px4px4p_p0_C35 C37:murein4px4px4p_p0_C36 C38:murein4px4px4p_p0_C37 C39:murein4px4px4p_p0_C38 C40:murein4px4px4p_p0_C39 C41:murein4px4px4p_p0_C40 C42:murein4px4px4p_p0_C41 C43:murein4px4px4p_p0_C42 C44:murein4px4px4p_p0_C43 C45:murein4px4px4p_p0_C44 C46:murein4px4px4p_p0_C45 C47:murein4px4px4p_p0_C46 C48:murein4px4px4p_p0_C47 C49:murein4px4px4p_p0_C48 C50:murein4px4px4p_p0_C49 C51:murein4px4px4p_p0_C50 C52:murein4px4px4p_p0_C51 C53:murein4px4px4p_p0_C52 C54:murein4px4px4p_p0_C53 C55:murein4px4px4p_p0_C54 C56:murein4px4px4p_p0_C55 C57:murein4px4px4p_p0_C56 C58:murein4px4px4p_p0_C57 C59:murein4px4px4p_p0_C58 C60:murein4px4px4p_p0_C59 C61:murein4px4px4p_p0_C60 C62:murein4px4px4p_p0_C61 C63:murein4px4px4p_p0_C62 C64:murein4px4px4p_p0_C63 C65:murein4px4px4p_p0_C64 C66:murein4px4px4p_p0_C65 C67:murein4px4px4p_p0_C66 C68:murein4px4px4p_p0_C67 C69:murein4px4px4p_p0_C68 C70:murein4px4px4p_p0_C69 C71:murein4px4px4p_p0_C70 C72:murein4px4px4p_p0_C71 C73:murein4px4px4p_p0_C72 C74:murein4px4px4p_p0_C73 C75:murein4px4px4p_p0_C74 C76:murein4px4px4p_p0_C75 C77:murein4px4px4p_p0_C76 C78:murein4px4px4p_p0_C77 C79:murein4px4px4p_p0_C78 C80:murein4px4px4p_p0_C79 C81:murein4px4px4p_p0_C80 C82:murein4px4px4p_p0_C81 C83:murein4px4px4p_p0_C82 C84:murein4px4px4p_p0_C83 C85:murein4px4px4p_p0_C84 C86:murein4px4px4p_p0_C85 C87:murein4px4px4p_p0_C86 C88:murein4px4px4p_p0_C87 C89:murein4px4px4p_p0_C88 C90:murein4px4px4p_p0_C89 C91:murein4px4px4p_p0_C90 C92:murein4px4px4p_p0_C91 C93:murein4px4px4p_p0_C92 C94:murein4px4px4p_p0_C93 C95:murein4px4px4p_p0_C94 C96:murein4px4px4p_p0_C95 C97:murein4px4px4p_p0_C96 C98:murein4px4px4p_p0_C97 C99:murein4px4px4p_p0_C98 C100:murein4px4px4p_p0_C99 C101:murein4px4px4p_p0_C100 C102:murein4px4px4p_p0_C101 C103:murein4px4px4p_p0_C102 C104:murein4px4px4p_p0_C103 C105:murein4px4px4p_p0_C104 C106:murein4px4px4p_p0_C105 C107:murein4px4px4p_p0_C106 C108:murein4px4px4p_p0_C107 C109:murein4px4px4p_p0_C108 C110:murein4px4px4p_p0_C109 C111:murein4px4px4p_p0_C110) + 0.024805*dttp_c (C1:dttp_c0_C0 C2:dttp_c0_C1 C3:dttp_c0_C2 C4:dttp_c0_C3 C5:dttp_c0_C4 C6:dttp_c0_C5 C7:dttp_c0_C6 C8:dttp_c0_C7 C9:dttp_c0_C8 C10:dttp_c0_C9) + 0.000223*ribflv_c (C1:ribflv_c0_C0 C2:ribflv_c0_C1 C3:ribflv_c0_C2 C4:ribflv_c0_C3 C5:ribflv_c0_C4 C6:ribflv_c0_C5 C7:ribflv_c0_C6 C8:ribflv_c0_C7 C9:ribflv_c0_C8 C10:ribflv_c0_C9 C11:ribflv_c0_C10 C12:ribflv_c0_C11 C13:ribflv_c0_C12 C14:ribflv_c0_C13 C15:ribflv_c0_C14 C16:ribflv_c0_C15 C17:ribflv_c0_C16) + 0.000223*pydx5p_c + 0.000324*zn2_c + 0.004952*cl_c + 0.000223*sheme_c + 0.001345*murein3p3p_p (C1:murein3p3p_p0_C0 C2:murein3p3p_p0_C1 C3:murein3p3p_p0_C2 C4:murein3p3p_p0_C3 C5:murein3p3p_p0_C4 C6:murein3p3p_p0_C5 C7:murein3p3p_p0_C6 C8:murein3p3p_p0_C7 C9:murein3p3p_p0_C8 C10:murein3p3p_p0_C9 C11:murein3p3p_p0_C10 C12:murein3p3p_p0_C11 C13:murein3p3p_p0_C12 C14:murein3p3p_p0_C13 C15:murein3p3p_p0_C14 C16:murein3p3p_p0_C15 C17:murein3p3p_p0_C16 C18:murein3p3p_p0_C17 C19:murein3p3p_p0_C18 C20:murein3p3p_p0_C19 C21:murein3p3p_p0_C20 C22:murein3p3p_p0_C21 C23:murein3p3p_p0_C22 C24:murein3p3p_p0_C23 C25:murein3p3p_p0_C24 C26:murein3p3p_p0_C25 C27:murein3p3p_p0_C26 C28:murein3p3p_p0_C27 C29:murein3p3p_p0_C28 C30:murein3p3p_p0_C29 C31:murein3p3p_p0_C30 C32:murein3p3p_p0_C31 C33:murein3p3p_p0_C32 C34:murein3p3p_p0_C33 C35:murein3p3p_p0_C34 C36:murein3p3p_p0_C35 C37:murein3p3p_p0_C36 C38:murein3p3p_p0_C37 C39:murein3p3p_p0_C38 C40:murein3p3p_p0_C39 C41:murein3p3p_p0_C40 C42:murein3p3p_p0_C41 C43:murein3p3p_p0_C42 C44:murein3p3p_p0_C43 C45:murein3p3p_p0_C44 C46:murein3p3p_p0_C45 C47:murein3p3p_p0_C46 C48:murein3p3p_p0_C47 C49:murein3p3p_p0_C48 C50:murein3p3p_p0_C49 C51:murein3p3p_p0_C50 C52:murein3p3p_p0_C51 C53:murein3p3p_p0_C52 C54:murein3p3p_p0_C53 C55:murein3p3p_p0_C54 C56:murein3p3p_p0_C55 C57:murein3p3p_p0_C56 C58:murein3p3p_p0_C57 C59:murein3p3p_p0_C58 C60:murein3p3p_p0_C59 C61:murein3p3p_p0_C60 C62:murein3p3p_p0_C61 C63:murein3p3p_p0_C62 C64:murein3p3p_p0_C63 C65:murein3p3p_p0_C64 C66:murein3p3p_p0_C65 C67:murein3p3p_p0_C66 C68:murein3p3p_p0_C67) + 0.004892*pg160_p (C1:pg160_p0_C0 C2:pg160_p0_C1 C3:pg160_p0_C2 C4:pg160_p0_C3 C5:pg160_p0_C4 C6:pg160_p0_C5) + 0.129799*ctp_c (C1:ctp_c0_C0 C2:ctp_c0_C1 C3:ctp_c0_C2 C4:ctp_c0_C3 C5:ctp_c0_C4 C6:ctp_c0_C5 C7:ctp_c0_C6 C8:ctp_c0_C7 C9:ctp_c0_C8) + 0.255712*glu_DASH_L_c (C1:glu_DASH_L_c0_C0 C2:glu_DASH_L_c0_C1 C3:glu_DASH_L_c0_C2 C4:glu_DASH_L_c0_C3 C5:glu_DASH_L_c0_C4) + 0.214798*pro_DASH_L_c (C1:pro_DASH_L_c0_C0 C2:pro_DASH_L_c0_C1 C3:pro_DASH_L_c0_C2 C4:pro_DASH_L_c0_C3 C5:pro_DASH_L_c0_C4) + 0.025612*dgtp_c (C1:dgtp_c0_C0 C2:dgtp_c0_C1 C3:dgtp_c0_C2 C4:dgtp_c0_C3 C5:dgtp_c0_C4 C6:dgtp_c0_C5 C7:dgtp_c0_C6 C8:dgtp_c0_C7 C9:dgtp_c0_C8 C10:dgtp_c0_C9) + 0.000007*mobd_c + 0.255712*gln_DASH_L_c (C1:gln_DASH_L_c0_C0 C2:gln_DASH_L_c0_C1 C3:gln_DASH_L_c0_C2 C4:gln_DASH_L_c0_C3 C5:gln_DASH_L_c0_C4) + 0.001961*pg181_p (C1:pg181_p0_C0 C2:pg181_p0_C1 C3:pg181_p0_C2 C4:pg181_p0_C3 C5:pg181_p0_C4 C6:pg181_p0_C5) + 0.000658*mn2_c + 0.000223*2dmmql8_c + 0.024732*pe161_p (C1:pe161_p0_C0 C2:pe161_p0_C1 C3:pe161_p0_C2 C4:pe161_p0_C3 C5:pe161_p0_C4) + 0.000248*4fe4s_c + 0.00118*clpn181_p (C1:clpn181_p0_C0 C2:clpn181_p0_C1 C3:clpn181_p0_C2 C4:clpn181_p0_C3 C5:clpn181_p0_C4 C6:clpn181_p0_C5 C7:clpn181_p0_C6 C8:clpn181_p0_C7 C9:clpn181_p0_C8) + 0.012379*nh4_c + 0.000223*mql8_c + 0.003805*pg161_p (C1:pg161_p0_C0 C2:pg161_p0_C1 C3:pg161_p0_C2 C4:pg161_p0_C3 C5:pg161_p0_C4 C6:pg161_p0_C5) + 0.000279*accoa_c (C1:accoa_c0_C0 C2:accoa_c0_C1 C3:accoa_c0_C2 C4:accoa_c0_C3 C5:accoa_c0_C4 C6:accoa_c0_C5 C7:accoa_c0_C6 C8:accoa_c0_C7 C9:accoa_c0_C8 C10:accoa_c0_C9 C11:accoa_c0_C10 C12:accoa_c0_C11 C13:accoa_c0_C12 C14:accoa_c0_C13 C15:accoa_c0_C14 C16:accoa_c0_C15 C17:accoa_c0_C16 C18:accoa_c0_C17 C19:accoa_c0_C18 C20:accoa_c0_C19 C21:accoa_c0_C20 C22:accoa_c0_C21 C23:accoa_c0_C22) + 54.119975*atp_c (C1:atp_c0_C0 C2:atp_c0_C1 C3:atp_c0_C2 C4:atp_c0_C3 C5:atp_c0_C4 C6:atp_c0_C5 C7:atp_c0_C6 C8:atp_c0_C7 C9:atp_c0_C8 C10:atp_c0_C9) + 0.133993*tyr_DASH_L_c (C1:tyr_DASH_L_c0_C0 C2:tyr_DASH_L_c0_C1 C3:tyr_DASH_L_c0_C2 C4:tyr_DASH_L_c0_C3 C5:tyr_DASH_L_c0_C4 C6:tyr_DASH_L_c0_C5 C7:tyr_DASH_L_c0_C6 C8:tyr_DASH_L_c0_C7 C9:tyr_DASH_L_c0_C8) + 0.006744*spmd_c (C1:spmd_c0_C0 C2:spmd_c0_C1 C3:spmd_c0_C2 C4:spmd_c0_C3 C5:spmd_c0_C4 C6:spmd_c0_C5 C7:spmd_c0_C6) + 0.002944*clpn160_p (C1:clpn160_p0_C0 C2:clpn160_p0_C1 C3:clpn160_p0_C2 C4:clpn160_p0_C3 C5:clpn160_p0_C4 C6:clpn160_p0_C5 C7:clpn160_p0_C6 C8:clpn160_p0_C7 C9:clpn160_p0_C8) + 0.000116*bmocogdp_c + 0.00229*clpn161_p (C1:clpn161_p0_C0 C2:clpn161_p0_C1 C3:clpn161_p0_C2 C4:clpn161_p0_C3 C5:clpn161_p0_C4 C6:clpn161_p0_C5 C7:clpn161_p0_C6 C8:clpn161_p0_C7 C9:clpn161_p0_C8) -> 0.749831*ppi_c + 53.95*adp_c (C1:atp_c0_C0 C2:atp_c0_C1 C3:atp_c0_C2 C4:atp_c0_C3 C5:atp_c0_C4 C6:atp_c0_C5 C7:atp_c0_C6 C8:atp_c0_C7 C9:atp_c0_C8 C10:atp_c0_C9) + 0.005707*Ec_biomass_iJO1366_WT_53p95M_pg160_c_0.balance (C1:pg160_c0_C0 C2:pg160_c0_C1 C3:pg160_c0_C2 C4:pg160_c0_C3 C5:pg160_c0_C4 C6:pg160_c0_C5) + 0.000168*Ec_biomass_iJO1366_WT_53p95M_coa_c_1.balance (C1:coa_c0_C0 C2:coa_c0_C1 C3:coa_c0_C2 C4:coa_c0_C3 C5:coa_c0_C4 C6:coa_c0_C5 C7:coa_c0_C6 C8:coa_c0_C7 C9:coa_c0_C8 C10:coa_c0_C9 C11:coa_c0_C10 C12:coa_c0_C11 C13:coa_c0_C12 C14:coa_c0_C13 C15:coa_c0_C14 C16:coa_c0_C15 C17:coa_c0_C16 C18:coa_c0_C17 C19:coa_c0_C18 C20:coa_c0_C19 C21:coa_c0_C20) + 0.000055*Ec_biomass_iJO1366_WT_53p95M_udcpdp_c_2.balance (C1:udcpdp_c0_C0 C2:udcpdp_c0_C1 C3:udcpdp_c0_C2 C4:udcpdp_c0_C3 C5:udcpdp_c0_C4 C6:udcpdp_c0_C5 C7:udcpdp_c0_C6 C8:udcpdp_c0_C7 C9:udcpdp_c0_C8 C10:udcpdp_c0_C9 C11:udcpdp_c0_C10 C12:udcpdp_c0_C11 C13:udcpdp_c0_C12 C14:udcpdp_c0_C13 C15:udcpdp_c0_C14 C16:udcpdp_c0_C15 C17:udcpdp_c0_C16 C18:udcpdp_c0_C17 C19:udcpdp_c0_C18 C20:udcpdp_c0_C19 C21:udcpdp_c0_C20 C22:udcpdp_c0_C21 C23:udcpdp_c0_C22 C24:udcpdp_c0_C23 C25:udcpdp_c0_C24 C26:udcpdp_c0_C25 C27:udcpdp_c0_C26 C28:udcpdp_c0_C27 C29:udcpdp_c0_C28 C30:udcpdp_c0_C29 C31:udcpdp_c0_C30 C32:udcpdp_c0_C31 C33:udcpdp_c0_C32 C34:udcpdp_c0_C33 C35:udcpdp_c0_C34 C36:udcpdp_c0_C35 C37:udcpdp_c0_C36 C38:udcpdp_c0_C37 C39:udcpdp_c0_C38 C40:udcpdp_c0_C39 C41:udcpdp_c0_C40 C42:udcpdp_c0_C41 C43:udcpdp_c0_C42 C44:udcpdp_c0_C43 C45:udcpdp_c0_C44 C46:udcpdp_c0_C45 C47:udcpdp_c0_C46 C48:udcpdp_c0_C47 C49:udcpdp_c0_C48 C50:udcpdp_c0_C49 C51:udcpdp_c0_C50 C52:udcpdp_c0_C51 C53:udcpdp_c0_C52 C54:udcpdp_c0_C53 C55:udcpdp_c0_C54) + 0.004957*Ec_biomass_iJO1366_WT_53p95M_pe181_c_3.balance (C1:pe181_c0_C0 C2:pe181_c0_C1 C3:pe181_c0_C2 C4:pe181_c0_C3 C5:pe181_c0_C4) + 0.000112*Ec_biomass_iJO1366_WT_53p95M_nadp_c_4.balance (C1:nadp_c0_C0 C2:nadp_c0_C1 C3:nadp_c0_C2 C4:nadp_c0_C3 C5:nadp_c0_C4 C6:nadp_c0_C5 C7:nadp_c0_C6 C8:nadp_c0_C7 C9:nadp_c0_C8 C10:nadp_c0_C9 C11:nadp_c0_C10 C12:nadp_c0_C11 C13:nadp_c0_C12 C14:nadp_c0_C13 C15:nadp_c0_C14 C16:nadp_c0_C15 C17:nadp_c0_C16 C18:nadp_c0_C17 C19:nadp_c0_C18 C20:nadp_c0_C19 C21:nadp_c0_C20) + 0.140101*Ec_biomass_iJO1366_WT_53p95M_utp_c_5.balance (C1:utp_c0_C0 C2:utp_c0_C1 C3:utp_c0_C2 C4:utp_c0_C3 C5:utp_c0_C4 C6:utp_c0_C5 C7:utp_c0_C6 C8:utp_c0_C7 C9:utp_c0_C8) + 0.234232*Ec_biomass_iJO1366_WT_53p95M_asp_DASH_L_c_6.balance (C1:asp_DASH_L_c0_C0 C2:asp_DASH_L_c0_C1 C3:asp_DASH_L_c0_C2 C4:asp_DASH_L_c0_C3) + 0.002288*Ec_biomass_iJO1366_WT_53p95M_pg181_c_7.balance (C1:pg181_c0_C0 C2:pg181_c0_C1 C3:pg181_c0_C2 C4:pg181_c0_C3 C5:pg181_c0_C4 C6:pg181_c0_C5) + 0.154187*Ec_biomass_iJO1366_WT_53p95M_glycogen_c_8.balance (C1:glycogen_c0_C0 C2:glycogen_c0_C1 C3:glycogen_c0_C2 C4:glycogen_c0_C3 C5:glycogen_c0_C4 C6:glycogen_c0_C5) + 0.000098*Ec_biomass_iJO1366_WT_53p95M_succoa_c_9.balance (C1:succoa_c0_C0 C2:succoa_c0_C1 C3:succoa_c0_C2 C4:succoa_c0_C3 C5:succoa_c0_C4 C6:succoa_c0_C5 C7:succoa_c0_C6 C8:succoa_c0_C7 C9:succoa_c0_C8 C10:succoa_c0_C9 C11:succoa_c0_C10 C12:succoa_c0_C11 C13:succoa_c0_C12 C14:succoa_c0_C13 C15:succoa_c0_C14 C16:succoa_c0_C15 C17:succoa_c0_C16 C18:succoa_c0_C17 C19:succoa_c0_C18 C20:succoa_c0_C19 C21:succoa_c0_C20 C22:succoa_c0_C21 C23:succoa_c0_C22 C24:succoa_c0_C23 C25:succoa_c0_C24) + 0.031798*Ec_biomass_iJO1366_WT_53p95M_pe160_p_10.balance (C1:pe160_p0_C0 C2:pe160_p0_C1 C3:pe160_p0_C2 C4:pe160_p0_C3 C5:pe160_p0_C4) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_gthrd_c_11.balance (C1:gthrd_c0_C0 C2:gthrd_c0_C1 C3:gthrd_c0_C2 C4:gthrd_c0_C3 C5:gthrd_c0_C4 C6:gthrd_c0_C5 C7:gthrd_c0_C6 C8:gthrd_c0_C7 C9:gthrd_c0_C8 C10:gthrd_c0_C9) + 0.000031*Ec_biomass_iJO1366_WT_53p95M_malcoa_c_12.balance (C1:malcoa_c0_C0 C2:malcoa_c0_C1 C3:malcoa_c0_C2 C4:malcoa_c0_C3 C5:malcoa_c0_C4 C6:malcoa_c0_C5 C7:malcoa_c0_C6 C8:malcoa_c0_C7 C9:malcoa_c0_C8 C10:malcoa_c0_C9 C11:malcoa_c0_C10 C12:malcoa_c0_C11 C13:malcoa_c0_C12 C14:malcoa_c0_C13 C15:malcoa_c0_C14 C16:malcoa_c0_C15 C17:malcoa_c0_C16 C18:malcoa_c0_C17 C19:malcoa_c0_C18 C20:malcoa_c0_C19 C21:malcoa_c0_C20 C22:malcoa_c0_C21 C23:malcoa_c0_C22 C24:malcoa_c0_C23) + 0.209684*Ec_biomass_iJO1366_WT_53p95M_ser_DASH_L_c_13.balance (C1:ser_DASH_L_c0_C0 C2:ser_DASH_L_c0_C1 C3:ser_DASH_L_c0_C2) + 0.234232*Ec_biomass_iJO1366_WT_53p95M_asn_DASH_L_c_14.balance (C1:asn_DASH_L_c0_C0 C2:asn_DASH_L_c0_C1 C3:asn_DASH_L_c0_C2 C4:asn_DASH_L_c0_C3) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_amet_c_15.balance (C1:amet_c0_C0 C2:amet_c0_C1 C3:amet_c0_C2 C4:amet_c0_C3 C5:amet_c0_C4 C6:amet_c0_C5 C7:amet_c0_C6 C8:amet_c0_C7 C9:amet_c0_C8 C10:amet_c0_C9 C11:amet_c0_C10 C12:amet_c0_C11 C13:amet_c0_C12 C14:amet_c0_C13 C15:amet_c0_C14) + 0.595297*Ec_biomass_iJO1366_WT_53p95M_gly_c_16.balance (C1:gly_c0_C0 C2:gly_c0_C1) + 0.000605*Ec_biomass_iJO1366_WT_53p95M_murein3px4p_p_17.balance (C1:murein3px4p_p0_C0 C2:murein3px4p_p0_C1 C3:murein3px4p_p0_C2 C4:murein3px4p_p0_C3 C5:murein3px4p_p0_C4 C6:murein3px4p_p0_C5 C7:murein3px4p_p0_C6 C8:murein3px4p_p0_C7 C9:murein3px4p_p0_C8 C10:murein3px4p_p0_C9 C11:murein3px4p_p0_C10 C12:murein3px4p_p0_C11 C13:murein3px4p_p0_C12 C14:murein3px4p_p0_C13 C15:murein3px4p_p0_C14 C16:murein3px4p_p0_C15 C17:murein3px4p_p0_C16 C18:murein3px4p_p0_C17 C19:murein3px4p_p0_C18 C20:murein3px4p_p0_C19 C21:murein3px4p_p0_C20 C22:murein3px4p_p0_C21 C23:murein3px4p_p0_C22 C24:murein3px4p_p0_C23 C25:murein3px4p_p0_C24 C26:murein3px4p_p0_C25 C27:murein3px4p_p0_C26 C28:murein3px4p_p0_C27 C29:murein3px4p_p0_C28 C30:murein3px4p_p0_C29 C31:murein3px4p_p0_C30 C32:murein3px4p_p0_C31 C33:murein3px4p_p0_C32 C34:murein3px4p_p0_C33 C35:murein3px4p_p0_C34 C36:murein3px4p_p0_C35 C37:murein3px4p_p0_C36 C38:murein3px4p_p0_C37 C39:murein3px4p_p0_C38 C40:murein3px4p_p0_C39 C41:murein3px4p_p0_C40 C42:murein3px4p_p0_C41 C43:murein3px4p_p0_C42 C44:murein3px4p_p0_C43 C45:murein3px4p_p0_C44 C46:murein3px4p_p0_C45 C47:murein3px4p_p0_C46 C48:murein3px4p_p0_C47 C49:murein3px4p_p0_C48 C50:murein3px4p_p0_C49 C51:murein3px4p_p0_C50 C52:murein3px4p_p0_C51 C53:murein3px4p_p0_C52 C54:murein3px4p_p0_C53 C55:murein3px4p_p0_C54 C56:murein3px4p_p0_C55 C57:murein3px4p_p0_C56 C58:murein3px4p_p0_C57 C59:murein3px4p_p0_C58 C60:murein3px4p_p0_C59 C61:murein3px4p_p0_C60 C62:murein3px4p_p0_C61 C63:murein3px4p_p0_C62 C64:murein3px4p_p0_C63 C65:murein3px4p_p0_C64 C66:murein3px4p_p0_C65 C67:murein3px4p_p0_C66 C68:murein3px4p_p0_C67 C69:murein3px4p_p0_C68 C70:murein3px4p_p0_C69 C71:murein3px4p_p0_C70) + 0.055234*Ec_biomass_iJO1366_WT_53p95M_trp_DASH_L_c_18.balance (C1:trp_DASH_L_c0_C0 C2:trp_DASH_L_c0_C1 C3:trp_DASH_L_c0_C2 C4:trp_DASH_L_c0_C3 C5:trp_DASH_L_c0_C4 C6:trp_DASH_L_c0_C5 C7:trp_DASH_L_c0_C6 C8:trp_DASH_L_c0_C7 C9:trp_DASH_L_c0_C8 C10:trp_DASH_L_c0_C9 C11:trp_DASH_L_c0_C10) + 0.03327*Ec_biomass_iJO1366_WT_53p95M_ptrc_c_19.balance (C1:ptrc_c0_C0 C2:ptrc_c0_C1 C3:ptrc_c0_C2 C4:ptrc_c0_C3) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_fad_c_20.balance (C1:fad_c0_C0 C2:fad_c0_C1 C3:fad_c0_C2 C4:fad_c0_C3 C5:fad_c0_C4 C6:fad_c0_C5 C7:fad_c0_C6 C8:fad_c0_C7 C9:fad_c0_C8 C10:fad_c0_C9 C11:fad_c0_C10 C12:fad_c0_C11 C13:fad_c0_C12 C14:fad_c0_C13 C15:fad_c0_C14 C16:fad_c0_C15 C17:fad_c0_C16 C18:fad_c0_C17 C19:fad_c0_C18 C20:fad_c0_C19 C21:fad_c0_C20 C22:fad_c0_C21 C23:fad_c0_C22 C24:fad_c0_C23 C25:fad_c0_C24 C26:fad_c0_C25 C27:fad_c0_C26) + 0.411184*Ec_biomass_iJO1366_WT_53p95M_val_DASH_L_c_21.balance (C1:val_DASH_L_c0_C0 C2:val_DASH_L_c0_C1 C3:val_DASH_L_c0_C2 C4:val_DASH_L_c0_C3 C5:val_DASH_L_c0_C4) + 0.005381*Ec_biomass_iJO1366_WT_53p95M_murein4p4p_p_22.balance (C1:murein4p4p_p0_C0 C2:murein4p4p_p0_C1 C3:murein4p4p_p0_C2 C4:murein4p4p_p0_C3 C5:murein4p4p_p0_C4 C6:murein4p4p_p0_C5 C7:murein4p4p_p0_C6 C8:murein4p4p_p0_C7 C9:murein4p4p_p0_C8 C10:murein4p4p_p0_C9 C11:murein4p4p_p0_C10 C12:murein4p4p_p0_C11 C13:murein4p4p_p0_C12 C14:murein4p4p_p0_C13 C15:murein4p4p_p0_C14 C16:murein4p4p_p0_C15 C17:murein4p4p_p0_C16 C18:murein4p4p_p0_C17 C19:murein4p4p_p0_C18 C20:murein4p4p_p0_C19 C21:murein4p4p_p0_C20 C22:murein4p4p_p0_C21 C23:murein4p4p_p0_C22 C24:murein4p4p_p0_C23 C25:murein4p4p_p0_C24 C26:murein4p4p_p0_C25 C27:murein4p4p_p0_C26 C28:murein4p4p_p0_C27 C29:murein4p4p_p0_C28 C30:murein4p4p_p0_C29 C31:murein4p4p_p0_C30 C32:murein4p4p_p0_C31 C33:murein4p4p_p0_C32 C34:murein4p4p_p0_C33 C35:murein4p4p_p0_C34 C36:murein4p4p_p0_C35 C37:murein4p4p_p0_C36 C38:murein4p4p_p0_C37 C39:murein4p4p_p0_C38 C40:murein4p4p_p0_C39 C41:murein4p4p_p0_C40 C42:murein4p4p_p0_C41 C43:murein4p4p_p0_C42 C44:murein4p4p_p0_C43 C45:murein4p4p_p0_C44 C46:murein4p4p_p0_C45 C47:murein4p4p_p0_C46 C48:murein4p4p_p0_C47 C49:murein4p4p_p0_C48 C50:murein4p4p_p0_C49 C51:murein4p4p_p0_C50 C52:murein4p4p_p0_C51 C53:murein4p4p_p0_C52 C54:murein4p4p_p0_C53 C55:murein4p4p_p0_C54 C56:murein4p4p_p0_C55 C57:murein4p4p_p0_C56 C58:murein4p4p_p0_C57 C59:murein4p4p_p0_C58 C60:murein4p4p_p0_C59 C61:murein4p4p_p0_C60 C62:murein4p4p_p0_C61 C63:murein4p4p_p0_C62 C64:murein4p4p_p0_C63 C65:murein4p4p_p0_C64 C66:murein4p4p_p0_C65 C67:murein4p4p_p0_C66 C68:murein4p4p_p0_C67 C69:murein4p4p_p0_C68 C70:murein4p4p_p0_C69 C71:murein4p4p_p0_C70 C72:murein4p4p_p0_C71 C73:murein4p4p_p0_C72 C74:murein4p4p_p0_C73) + 0.005448*Ec_biomass_iJO1366_WT_53p95M_murein4px4p_p_23.balance (C1:murein4px4p_p0_C0 C2:murein4px4p_p0_C1 C3:murein4px4p_p0_C2 C4:murein4px4p_p0_C3 C5:murein4px4p_p0_C4 C6:murein4px4p_p0_C5 C7:murein4px4p_p0_C6 C8:murein4px4p_p0_C7 C9:murein4px4p_p0_C8 C10:murein4px4p_p0_C9 C11:murein4px4p_p0_C10 C12:murein4px4p_p0_C11 C13:murein4px4p_p0_C12 C14:murein4px4p_p0_C13 C15:murein4px4p_p0_C14 C16:murein4px4p_p0_C15 C17:murein4px4p_p0_C16 C18:murein4px4p_p0_C17 C19:murein4px4p_p0_C18 C20:murein4px4p_p0_C19 C21:murein4px4p_p0_C20 C22:murein4px4p_p0_C21 C23:murein4px4p_p0_C22 C24:murein4px4p_p0_C23 C25:murein4px4p_p0_C24 C26:murein4px4p_p0_C25 C27:murein4px4p_p0_C26 C28:murein4px4p_p0_C27 C29:murein4px4p_p0_C28 C30:murein4px4p_p0_C29 C31:murein4px4p_p0_C30 C32:murein4px4p_p0_C31 C33:murein4px4p_p0_C32 C34:murein4px4p_p0_C33 C35:murein4px4p_p0_C34 C36:murein4px4p_p0_C35 C37:murein4px4p_p0_C36 C38:murein4px4p_p0_C37 C39:murein4px4p_p0_C38 C40:murein4px4p_p0_C39 C41:murein4px4p_p0_C40 C42:murein4px4p_p0_C41 C43:murein4px4p_p0_C42 C44:murein4px4p_p0_C43 C45:murein4px4p_p0_C44 C46:murein4px4p_p0_C45 C47:murein4px4p_p0_C46 C48:murein4px4p_p0_C47 C49:murein4px4p_p0_C48 C50:murein4px4p_p0_C49 C51:murein4px4p_p0_C50 C52:murein4px4p_p0_C51 C53:murein4px4p_p0_C52 C54:murein4px4p_p0_C53 C55:murein4px4p_p0_C54 C56:murein4px4p_p0_C55 C57:murein4px4p_p0_C56 C58:murein4px4p_p0_C57 C59:murein4px4p_p0_C58 C60:murein4px4p_p0_C59 C61:murein4px4p_p0_C60 C62:murein4px4p_p0_C61 C63:murein4px4p_p0_C62 C64:murein4px4p_p0_C63 C65:murein4px4p_p0_C64 C66:murein4px4p_p0_C65 C67:murein4px4p_p0_C66 C68:murein4px4p_p0_C67 C69:murein4px4p_p0_C68 C70:murein4px4p_p0_C69 C71:murein4px4p_p0_C70 C72:murein4px4p_p0_C71 C73:murein4px4p_p0_C72 C74:murein4px4p_p0_C73) + 0.000335*Ec_biomass_iJO1366_WT_53p95M_nadph_c_24.balance (C1:nadph_c0_C0 C2:nadph_c0_C1 C3:nadph_c0_C2 C4:nadph_c0_C3 C5:nadph_c0_C4 C6:nadph_c0_C5 C7:nadph_c0_C6 C8:nadph_c0_C7 C9:nadph_c0_C8 C10:nadph_c0_C9 C11:nadph_c0_C10 C12:nadph_c0_C11 C13:nadph_c0_C12 C14:nadph_c0_C13 C15:nadph_c0_C14 C16:nadph_c0_C15 C17:nadph_c0_C16 C18:nadph_c0_C17 C19:nadph_c0_C18 C20:nadph_c0_C19 C21:nadph_c0_C20) + 0.000045*Ec_biomass_iJO1366_WT_53p95M_nadh_c_25.balance (C1:nadh_c0_C0 C2:nadh_c0_C1 C3:nadh_c0_C2 C4:nadh_c0_C3 C5:nadh_c0_C4 C6:nadh_c0_C5 C7:nadh_c0_C6 C8:nadh_c0_C7 C9:nadh_c0_C8 C10:nadh_c0_C9 C11:nadh_c0_C10 C12:nadh_c0_C11 C13:nadh_c0_C12 C14:nadh_c0_C13 C15:nadh_c0_C14 C16:nadh_c0_C15 C17:nadh_c0_C16 C18:nadh_c0_C17 C19:nadh_c0_C18 C20:nadh_c0_C19 C21:nadh_c0_C20) + 0.004439*Ec_biomass_iJO1366_WT_53p95M_pg161_c_26.balance (C1:pg161_c0_C0 C2:pg161_c0_C1 C3:pg161_c0_C2 C4:pg161_c0_C3 C5:pg161_c0_C4 C6:pg161_c0_C5) + 0.012747*Ec_biomass_iJO1366_WT_53p95M_pe181_p_27.balance (C1:pe181_p0_C0 C2:pe181_p0_C1 C3:pe181_p0_C2 C4:pe181_p0_C3 C5:pe181_p0_C4) + 0.282306*Ec_biomass_iJO1366_WT_53p95M_ile_DASH_L_c_28.balance (C1:ile_DASH_L_c0_C0 C2:ile_DASH_L_c0_C1 C3:ile_DASH_L_c0_C2 C4:ile_DASH_L_c0_C3 C5:ile_DASH_L_c0_C4 C6:ile_DASH_L_c0_C5) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_chor_c_29.balance (C1:chor_c0_C0 C2:chor_c0_C1 C3:chor_c0_C2 C4:chor_c0_C3 C5:chor_c0_C4 C6:chor_c0_C5 C7:chor_c0_C6 C8:chor_c0_C7 C9:chor_c0_C8 C10:chor_c0_C9) + 0.333448*Ec_biomass_iJO1366_WT_53p95M_lys_DASH_L_c_30.balance (C1:lys_DASH_L_c0_C0 C2:lys_DASH_L_c0_C1 C3:lys_DASH_L_c0_C2 C4:lys_DASH_L_c0_C3 C5:lys_DASH_L_c0_C4 C6:lys_DASH_L_c0_C5) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_mlthf_c_31.balance (C1:mlthf_c0_C0) + 0.28742*Ec_biomass_iJO1366_WT_53p95M_arg_DASH_L_c_32.balance (C1:arg_DASH_L_c0_C0 C2:arg_DASH_L_c0_C1 C3:arg_DASH_L_c0_C2 C4:arg_DASH_L_c0_C3 C5:arg_DASH_L_c0_C4 C6:arg_DASH_L_c0_C5) + 0.499149*Ec_biomass_iJO1366_WT_53p95M_ala_DASH_L_c_33.balance (C1:ala_DASH_L_c0_C0 C2:ala_DASH_L_c0_C1 C3:ala_DASH_L_c0_C2) + 0.246506*Ec_biomass_iJO1366_WT_53p95M_thr_DASH_L_c_34.balance (C1:thr_DASH_L_c0_C0 C2:thr_DASH_L_c0_C1 C3:thr_DASH_L_c0_C2 C4:thr_DASH_L_c0_C3) + 0.088988*Ec_biomass_iJO1366_WT_53p95M_cys_DASH_L_c_35.balance (C1:cys_DASH_L_c0_C0 C2:cys_DASH_L_c0_C1 C3:cys_DASH_L_c0_C2) + 0.001787*Ec_biomass_iJO1366_WT_53p95M_nad_c_36.balance (C1:nad_c0_C0 C2:nad_c0_C1 C3:nad_c0_C2 C4:nad_c0_C3 C5:nad_c0_C4 C6:nad_c0_C5 C7:nad_c0_C6 C8:nad_c0_C7 C9:nad_c0_C8 C10:nad_c0_C9 C11:nad_c0_C10 C12:nad_c0_C11 C13:nad_c0_C12 C14:nad_c0_C13 C15:nad_c0_C14 C16:nad_c0_C15 C17:nad_c0_C16 C18:nad_c0_C17 C19:nad_c0_C18 C20:nad_c0_C19 C21:nad_c0_C20) + 0.180021*Ec_biomass_iJO1366_WT_53p95M_phe_DASH_L_c_37.balance (C1:phe_DASH_L_c0_C0 C2:phe_DASH_L_c0_C1 C3:phe_DASH_L_c0_C2 C4:phe_DASH_L_c0_C3 C5:phe_DASH_L_c0_C4 C6:phe_DASH_L_c0_C5 C7:phe_DASH_L_c0_C6 C8:phe_DASH_L_c0_C7 C9:phe_DASH_L_c0_C8) + 0.025612*Ec_biomass_iJO1366_WT_53p95M_dctp_c_38.balance (C1:dctp_c0_C0 C2:dctp_c0_C1 C3:dctp_c0_C2 C4:dctp_c0_C3 C5:dctp_c0_C4 C6:dctp_c0_C5 C7:dctp_c0_C6 C8:dctp_c0_C7 C9:dctp_c0_C8) + 0.149336*Ec_biomass_iJO1366_WT_53p95M_met_DASH_L_c_39.balance (C1:met_DASH_L_c0_C0 C2:met_DASH_L_c0_C1 C3:met_DASH_L_c0_C2 C4:met_DASH_L_c0_C3 C5:met_DASH_L_c0_C4) + 0.012366*Ec_biomass_iJO1366_WT_53p95M_pe160_c_40.balance (C1:pe160_c0_C0 C2:pe160_c0_C1 C3:pe160_c0_C2 C4:pe160_c0_C3 C5:pe160_c0_C4) + 0.209121*Ec_biomass_iJO1366_WT_53p95M_gtp_c_41.balance (C1:gtp_c0_C0 C2:gtp_c0_C1 C3:gtp_c0_C2 C4:gtp_c0_C3 C5:gtp_c0_C4 C6:gtp_c0_C5 C7:gtp_c0_C6 C8:gtp_c0_C7 C9:gtp_c0_C8 C10:gtp_c0_C9) + 0.437778*Ec_biomass_iJO1366_WT_53p95M_leu_DASH_L_c_42.balance (C1:leu_DASH_L_c0_C0 C2:leu_DASH_L_c0_C1 C3:leu_DASH_L_c0_C2 C4:leu_DASH_L_c0_C3 C5:leu_DASH_L_c0_C4 C6:leu_DASH_L_c0_C5) + 0.092056*Ec_biomass_iJO1366_WT_53p95M_his_DASH_L_c_43.balance (C1:his_DASH_L_c0_C0 C2:his_DASH_L_c0_C1 C3:his_DASH_L_c0_C2 C4:his_DASH_L_c0_C3 C5:his_DASH_L_c0_C4 C6:his_DASH_L_c0_C5) + 0.009618*Ec_biomass_iJO1366_WT_53p95M_pe161_c_44.balance (C1:pe161_c0_C0 C2:pe161_c0_C1 C3:pe161_c0_C2 C4:pe161_c0_C3 C5:pe161_c0_C4) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_10fthf_c_45.balance (C1:10fthf_c0_C0) + 0.024805*Ec_biomass_iJO1366_WT_53p95M_datp_c_46.balance (C1:datp_c0_C0 C2:datp_c0_C1 C3:datp_c0_C2 C4:datp_c0_C3 C5:datp_c0_C4 C6:datp_c0_C5 C7:datp_c0_C6 C8:datp_c0_C7 C9:datp_c0_C8 C10:datp_c0_C9) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_5mthf_c_47.balance (C1:5mthf_c0_C0) + 0.000673*Ec_biomass_iJO1366_WT_53p95M_murein4px4px4p_p_48.balance (C1:murein4px4px4p_p0_C0 C2:murein4px4px4p_p0_C1 C3:murein4px4px4p_p0_C2 C4:murein4px4px4p_p0_C3 C5:murein4px4px4p_p0_C4 C6:murein4px4px4p_p0_C5 C7:murein4px4px4p_p0_C6 C8:murein4px4px4p_p0_C7 C9:murein4px4px4p_p0_C8 C10:murein4px4px4p_p0_C9 C11:murein4px4px4p_p0_C10 C12:murein4px4px4p_p0_C11 C13:murein4px4px4p_p0_C12 C14:murein4px4px4p_p0_C13 C15:murein4px4px4p_p0_C14 C16:murein4px4px4p_p0_C15 C17:murein4px4px4p_p0_C16 C18:murein4px4px4p_p0_C17 C19:murein4px4px4p_p0_C18 C20:murein4px4px4p_p0_C19 C21:murein4px4px4p_p0_C20 C22:murein4px4px4p_p0_C21 C23:murein4px4px4p_p0_C22 C24:murein4px4px4p_p0_C23 C25:murein4px4px4p_p0_C24 C26:murein4px4px4p_p0_C25 C27:murein4px4px4p_p0_C26 C28:murein4px4px4p_p0_C27 C29:murein4px4px4p_p0_C28 C30:murein4px4px4p_p0_C29 C31:murein4px4px4p_p0_C30 C32:murein4px4px4p_p0_C31 C33:murein4px4px4p_p0_C32 C34:murein4px4px4p_p0_C33 C35:murein4px4px4p_p0_C34 C36:murein4px4px4p_p0_C35 C37:murein4px4px4p_p0_C36 C38:murein4px4px4p_p0_C37 C39:murein4px4px4p_p0_C38 C40:murein4px4px4p_p0_C39 C41:murein4px4px4p_p0_C40 C42:murein4px4px4p_p0_C41 C43:murein4px4px4p_p0_C42 C44:murein4px4px4p_p0_C43 C45:murein4px4px4p_p0_C44 C46:murein4px4px4p_p0_C45 C47:murein4px4px4p_p0_C46 C48:murein4px4px4p_p0_C47 C49:murein4px4px4p_p0_C48 C50:murein4px4px4p_p0_C49 C51:murein4px4px4p_p0_C50 C52:murein4px4px4p_p0_C51 C53:murein4px4px4p_p0_C52 C54:murein4px4px4p_p0_C53 C55:murein4px4px4p_p0_C54 C56:murein4px4px4p_p0_C55 C57:murein4px4px4p_p0_C56 C58:murein4px4px4p_p0_C57 C59:murein4px4px4p_p0_C58 C60:murein4px4px4p_p0_C59 C61:murein4px4px4p_p0_C60 C62:murein4px4px4p_p0_C61 C63:murein4px4px4p_p0_C62 C64:murein4px4px4p_p0_C63 C65:murein4px4px4p_p0_C64 C66:murein4px4px4p_p0_C65 C67:murein4px4px4p_p0_C66 C68:murein4px4px4p_p0_C67 C69:murein4px4px4p_p0_C68 C70:murein4px4px4p_p0_C69 C71:murein4px4px4p_p0_C70 C72:murein4px4px4p_p0_C71 C73:murein4px4px4p_p0_C72 C74:murein4px4px4p_p0_C73 C75:murein4px4px4p_p0_C74 C76:murein4px4px4p_p0_C75 C77:murein4px4px4p_p0_C76 C78:murein4px4px4p_p0_C77 C79:murein4px4px4p_p0_C78 C80:murein4px4px4p_p0_C79 C81:murein4px4px4p_p0_C80 C82:murein4px4px4p_p0_C81 C83:murein4px4px4p_p0_C82 C84:murein4px4px4p_p0_C83 C85:murein4px4px4p_p0_C84 C86:murein4px4px4p_p0_C85 C87:murein4px4px4p_p0_C86 C88:murein4px4px4p_p0_C87 C89:murein4px4px4p_p0_C88 C90:murein4px4px4p_p0_C89 C91:murein4px4px4p_p0_C90 C92:murein4px4px4p_p0_C91 C93:murein4px4px4p_p0_C92 C94:murein4px4px4p_p0_C93 C95:murein4px4px4p_p0_C94 C96:murein4px4px4p_p0_C95 C97:murein4px4px4p_p0_C96 C98:murein4px4px4p_p0_C97 C99:murein4px4px4p_p0_C98 C100:murein4px4px4p_p0_C99 C101:murein4px4px4p_p0_C100 C102:murein4px4px4p_p0_C101 C103:murein4px4px4p_p0_C102 C104:murein4px4px4p_p0_C103 C105:murein4px4px4p_p0_C104 C106:murein4px4px4p_p0_C105 C107:murein4px4px4p_p0_C106 C108:murein4px4px4p_p0_C107 C109:murein4px4px4p_p0_C108 C110:murein4px4px4p_p0_C109 C111:murein4px4px4p_p0_C110) + 0.024805*Ec_biomass_iJO1366_WT_53p95M_dttp_c_49.balance (C1:dttp_c0_C0 C2:dttp_c0_C1 C3:dttp_c0_C2 C4:dttp_c0_C3 C5:dttp_c0_C4 C6:dttp_c0_C5 C7:dttp_c0_C6 C8:dttp_c0_C7 C9:dttp_c0_C8 C10:dttp_c0_C9) + 0.000223*Ec_biomass_iJO1366_WT_53p95M_ribflv_c_50.balance (C1:ribflv_c0_C0 C2:ribflv_c0_C1 C3:ribflv_c0_C2 C4:ribflv_c0_C3 C5:ribflv_c0_C4 C6:ribflv_c0_C5 C7:ribflv_c0_C6 C8:ribflv_c0_C7 C9:ribflv_c0_C8 C10:ribflv_c0_C9 C11:ribflv_c0_C10 C12:ribflv_c0_C11 C13:ribflv_c0_C12 C14:ribflv_c0_C13 C15:ribflv_c0_C14 C16:ribflv_c0_C15 C17:ribflv_c0_C16) + 0.001345*Ec_biomass_iJO1366_WT_53p95M_murein3p3p_p_51.balance (C1:murein3p3p_p0_C0 C2:murein3p3p_p0_C1 C3:murein3p3p_p0_C2 C4:murein3p3p_p0_C3 C5:murein3p3p_p0_C4 C6:murein3p3p_p0_C5 C7:murein3p3p_p0_C6 C8:murein3p3p_p0_C7 C9:murein3p3p_p0_C8 C10:murein3p3p_p0_C9 C11:murein3p3p_p0_C10 C12:murein3p3p_p0_C11 C13:murein3p3p_p0_C12 C14:murein3p3p_p0_C13 C15:murein3p3p_p0_C14 C16:murein3p3p_p0_C15 C17:murein3p3p_p0_C16 C18:murein3p3p_p0_C17 C19:murein3p3p_p0_C18 C20:murein3p3p_p0_C19 C21:murein3p3p_p0_C20 C22:murein3p3p_p0_C21 C23:murein3p3p_p0_C22 C24:murein3p3p_p0_C23 C25:murein3p3p_p0_C24 C26:murein3p3p_p0_C25 C27:murein3p3p_p0_C26 C28:murein3p3p_p0_C27 C29:murein3p3p_p0_C28 C30:murein3p3p_p0_C29 C31:murein3p3p_p0_C30 C32:murein3p3p_p0_C31 C33:murein3p3p_p0_C32 C34:murein3p3p_p0_C33 C35:murein3p3p_p0_C34 C36:murein3p3p_p0_C35 C37:murein3p3p_p0_C36 C38:murein3p3p_p0_C37 C39:murein3p3p_p0_C38 C40:murein3p3p_p0_C39 C41:murein3p3p_p0_C40 C42:murein3p3p_p0_C41 C43:murein3p3p_p0_C42 C44:murein3p3p_p0_C43 C45:murein3p3p_p0_C44 C46:murein3p3p_p0_C45 C47:murein3p3p_p0_C46 C48:murein3p3p_p0_C47 C49:murein3p3p_p0_C48 C50:murein3p3p_p0_C49 C51:murein3p3p_p0_C50 C52:murein3p3p_p0_C51 C53:murein3p3p_p0_C52 C54:murein3p3p_p0_C53 C55:murein3p3p_p0_C54 C56:murein3p3p_p0_C55 C57:murein3p3p_p0_C56 C58:murein3p3p_p0_C57 C59:murein3p3p_p0_C58 C60:murein3p3p_p0_C59 C61:murein3p3p_p0_C60 C62:murein3p3p_p0_C61 C63:murein3p3p_p0_C62 C64:murein3p3p_p0_C63 C65:murein3p3p_p0_C64 C66:murein3p3p_p0_C65 C67:murein3p3p_p0_C66 C68:murein3p3p_p0_C67) + 0.004892*Ec_biomass_iJO1366_WT_53p95M_pg160_p_52.balance (C1:pg160_p0_C0 C2:pg160_p0_C1 C3:pg160_p0_C2 C4:pg160_p0_C3 C5:pg160_p0_C4 C6:pg160_p0_C5) + 0.129799*Ec_biomass_iJO1366_WT_53p95M_ctp_c_53.balance (C1:ctp_c0_C0 C2:ctp_c0_C1 C3:ctp_c0_C2 C4:ctp_c0_C3 C5:ctp_c0_C4 C6:ctp_c0_C5 C7:ctp_c0_C6 C8:ctp_c0_C7 C9:ctp_c0_C8) + 0.255712*Ec_biomass_iJO1366_WT_53p95M_glu_DASH_L_c_54.balance (C1:glu_DASH_L_c0_C0 C2:glu_DASH_L_c0_C1 C3:glu_DASH_L_c0_C2 C4:glu_DASH_L_c0_C3 C5:glu_DASH_L_c0_C4) + 0.214798*Ec_biomass_iJO1366_WT_53p95M_pro_DASH_L_c_55.balance (C1:pro_DASH_L_c0_C0 C2:pro_DASH_L_c0_C1 C3:pro_DASH_L_c0_C2 C4:pro_DASH_L_c0_C3 C5:pro_DASH_L_c0_C4) + 0.025612*Ec_biomass_iJO1366_WT_53p95M_dgtp_c_56.balance (C1:dgtp_c0_C0 C2:dgtp_c0_C1 C3:dgtp_c0_C2 C4:dgtp_c0_C3 C5:dgtp_c0_C4 C6:dgtp_c0_C5 C7:dgtp_c0_C6 C8:dgtp_c0_C7 C9:dgtp_c0_C8 C10:dgtp_c0_C9) + 0.255712*Ec_biomass_iJO1366_WT_53p95M_gln_DASH_L_c_57.balance (C1:gln_DASH_L_c0_C0 C2:gln_DASH_L_c0_C1 C3:gln_DASH_L_c0_C2 C4:gln_DASH_L_c0_C3 C5:gln_DASH_L_c0_C4) + 0.001961*Ec_biomass_iJO1366_WT_53p95M_pg181_p_58.balance (C1:pg181_p0_C0 C2:pg181_p0_C1 C3:pg181_p0_C2 C4:pg181_p0_C3 C5:pg181_p0_C4 C6:pg181_p0_C5) + 0.024732*Ec_biomass_iJO1366_WT_53p95M_pe161_p_59.balance (C1:pe161_p0_C0 C2:pe161_p0_C1 C3:pe161_p0_C2 C4:pe161_p0_C3 C5:pe161_p0_C4) + 0.00118*Ec_biomass_iJO1366_WT_53p95M_clpn181_p_60.balance (C1:clpn181_p0_C0 C2:clpn181_p0_C1 C3:clpn181_p0_C2 C4:clpn181_p0_C3 C5:clpn181_p0_C4 C6:clpn181_p0_C5 C7:clpn181_p0_C6 C8:clpn181_p0_C7 C9:clpn181_p0_C8) + 0.003805*Ec_biomass_iJO1366_WT_53p95M_pg161_p_61.balance (C1:pg161_p0_C0 C2:pg161_p0_C1 C3:pg161_p0_C2 C4:pg161_p0_C3 C5:pg161_p0_C4 C6:pg161_p0_C5) + 0.000279*Ec_biomass_iJO1366_WT_53p95M_accoa_c_62.balance (C1:accoa_c0_C0 C2:accoa_c0_C1 C3:accoa_c0_C2 C4:accoa_c0_C3 C5:accoa_c0_C4 C6:accoa_c0_C5 C7:accoa_c0_C6 C8:accoa_c0_C7 C9:accoa_c0_C8 C10:accoa_c0_C9 C11:accoa_c0_C10 C12:accoa_c0_C11 C13:accoa_c0_C12 C14:accoa_c0_C13 C15:accoa_c0_C14 C16:accoa_c0_C15 C17:accoa_c0_C16 C18:accoa_c0_C17 C19:accoa_c0_C18 C20:accoa_c0_C19 C21:accoa_c0_C20 C22:accoa_c0_C21 C23:accoa_c0_C22) + 54.119975*Ec_biomass_iJO1366_WT_53p95M_atp_c_63.balance (C1:atp_c0_C0 C2:atp_c0_C1 C3:atp_c0_C2 C4:atp_c0_C3 C5:atp_c0_C4 C6:atp_c0_C5 C7:atp_c0_C6 C8:atp_c0_C7 C9:atp_c0_C8 C10:atp_c0_C9) + 0.133993*Ec_biomass_iJO1366_WT_53p95M_tyr_DASH_L_c_64.balance (C1:tyr_DASH_L_c0_C0 C2:tyr_DASH_L_c0_C1 C3:tyr_DASH_L_c0_C2 C4:tyr_DASH_L_c0_C3 C5:tyr_DASH_L_c0_C4 C6:tyr_DASH_L_c0_C5 C7:tyr_DASH_L_c0_C6 C8:tyr_DASH_L_c0_C7 C9:tyr_DASH_L_c0_C8) + 0.006744*Ec_biomass_iJO1366_WT_53p95M_spmd_c_65.balance (C1:spmd_c0_C0 C2:spmd_c0_C1 C3:spmd_c0_C2 C4:spmd_c0_C3 C5:spmd_c0_C4 C6:spmd_c0_C5 C7:spmd_c0_C6) + 0.002944*Ec_biomass_iJO1366_WT_53p95M_clpn160_p_66.balance (C1:clpn160_p0_C0 C2:clpn160_p0_C1 C3:clpn160_p0_C2 C4:clpn160_p0_C3 C5:clpn160_p0_C4 C6:clpn160_p0_C5 C7:clpn160_p0_C6 C8:clpn160_p0_C7 C9:clpn160_p0_C8) + 0.00229*Ec_biomass_iJO1366_WT_53p95M_clpn161_p_67.balance (C1:clpn161_p0_C0 C2:clpn161_p0_C1 C3:clpn161_p0_C2 C4:clpn161_p0_C3 C5:clpn161_p0_C4 C6:clpn161_p0_C5 C7:clpn161_p0_C6 C8:clpn161_p0_C7 C9:clpn161_p0_C8) + 53.945874*pi_c + 53.95*h_c ';
+    def set_profiler(self, profiler_I=None):
+        '''record the time and items of the script sections (model.reactions, model.symmetry, model.states,
+        model.bounds, model.rates, experiment.partition, experiment.data_file, experiment.definitions,
+        and experiment.mdvs) with an inca_profiler (None: stop recording)'''
+        self.profiler = profiler_I if profiler_I is not None else null_profiler;
     def write_isotopomerExperiment_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
                                         measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
-                                        parallel_I = 'experiment_id'):
-        '''Write matlab script file that describes the fluxomics experiment for INCA1.1'''
+                                        parallel_I = 'experiment_id', file_I = None, mdv_format_I = 'cell',
+                                        data_file_I = None, modelCache_I = None, rxnMappings_I = None, n_workers_I = 1,
+                                        relative_data_file_I = False, fit_starts_I = 10):
+        '''Write matlab script file that describes the fluxomics experiment for INCA1.1
+        INPUT:
+        parallel_I = string, key of the parallel labeling experiments (e.g., 'experiment_id' or 'sample_name_abbreviation')
+            or tuple of strings, composite key (e.g., ('experiment_id','sample_name_abbreviation'));
+            the MS data, measured fluxes, and tracers are grouped into one experiment per key
+        mdv_format_I = string, 'cell' (one assignment per MDV element) or 'matrix' (one matrix/cell literal
+            per fragment for mdvs.val, std, id, and time)
+        data_file_I = optional string, name of a .mat file; if given, the measured fluxes, tracer fractions,
+            and MDVs are written to the file (full precision) and loaded by the script instead of being
+            written inline (mdv_format_I is then ignored)
+        relative_data_file_I = boolean, load the data file from the directory of the script
+            (by its name, instead of by the path data_file_I; the script must be saved next to the data file)
+        file_I = optional file-like object or filename; if given, the script is streamed to the file
+            (and None is returned) instead of being returned as a string
+        modelCache_I = optional inca_scriptCache; the rendered model section is reused for identical
+            reactions, metabolites, and measured flux bounds
+        rxnMappings_I = optional {}, rxn_id: {} of the atom mapping of the reaction (the arguments of
+            make_isotopomerRxnEquations_batch); the equations of these reactions are generated from the
+            atom mappings instead of being taken from rxn_equation
+        n_workers_I = int, number of worker processes used to generate the equations of rxnMappings_I
+            (see make_isotopomerRxnEquations_batch)
+        fit_starts_I = int, number of restarts during the estimation procedure
+            (see writeScript_simulationOptions_Inca)
+        OUTPUT:
+        mat_script = string, matlab script'''
+        return self._write_scriptChunks(self.iterScript_isotopomerExperiment_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,parallel_I,mdv_format_I,data_file_I,
+                                        modelCache_I,rxnMappings_I,n_workers_I,relative_data_file_I,fit_starts_I),file_I);
+    def iterScript_isotopomerExperiment_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
+                                        parallel_I = 'experiment_id', mdv_format_I = 'cell', data_file_I = None,
+                                        modelCache_I = None, rxnMappings_I = None, n_workers_I = 1,
+                                        relative_data_file_I = False, fit_starts_I = 10):
+        '''Generate the chunks of the matlab script that describes the fluxomics experiment for INCA1.1
+        (see write_isotopomerExperiment_INCA)'''
 
-        mat_script = 'clear functions\n';
+        yield 'clear functions\n';
 
         ##1. Define the model:
-
-        ## debug reaction equations
-        #tmp_script = ''
-        #for rxn in modelReaction_data_I:
-        #    #TODO check on how the reactions are named  
-        #    tmp_script = tmp_script + 'r = reaction({...\n';
-        #    tmp_script = tmp_script + "'" + rxn['rxn_equation'] + "';...\n"
-        #    tmp_script = tmp_script + '});\n';
-        #mat_script = mat_script + tmp_script;
-
-        # write out reaction equations
-        tmp_script = ''
-        tmp_script = tmp_script + 'r = reaction({...\n';
-        rxn_ids_INCA = {};
-        cnt = 0
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                rxn_ids_INCA[rxn['rxn_id']] = ('R'+str(cnt+1));
-                cnt+=1;
-                if rxn['rxn_id'] == 'Ec_biomass_iJO1366_WT_53p95M':
-                    tmp_script = tmp_script + "'" + self.biomass_INCA + "';...\n"
-                    #tmp_script = tmp_script + "'" + self.biomass_INCA_iJS2012 + "';...\n"
-                else:
-                    tmp_script = tmp_script + "'" + rxn['rxn_equation'] + "';...\n"
-                #tmp_script = tmp_script + "'" + rxn['rxn_equation'] + "';...\n"
-            #else:
-            #    print 'rxn_id ' + rxn['rxn_id'] + ' will be excluded from INCA' 
-        tmp_script = tmp_script + '});\n';
-        mat_script = mat_script + tmp_script;
-
-        # setup the model
-        mat_script = mat_script + 'm = model(r);\n'
-
-        # Take care of symmetrical metabolites if not done so in the reaction equations
-        tmp_script = ''
-        for met in modelMetabolite_data_I:
-            if met['met_symmetry_atompositions']:
-                tmp_script = tmp_script + "m.mets{'" + met['met_id'] + "'}.sym = list('rotate180',map('";
-                for cnt,atompositions in enumerate(met['met_atompositions']):
-                    tmp_script = tmp_script + met['met_elements'][cnt] + str(atompositions+1) + ':' + met['met_symmetry_elements'][cnt] + str(met['met_symmetry_atompositions'][cnt]+1) + ' ';
-                tmp_script = tmp_script[:-1];
-                tmp_script = tmp_script + "'));\n";
-        mat_script = mat_script + tmp_script;
-
-        # Add in the metabolite states (balance), value, and lb/ub)
-        tmp_script = ''
-        # specify reactions that should be forcible unbalanced
-        #NOTE: hard-coded for now until a better workaround can be done
-        metabolites_all = [x['met_id'] for x in modelMetabolite_data_I];
-        for met in ['co2_e','h2o_e','h_e','na1_e']:
-            if met in metabolites_all:
-                tmp_script = tmp_script + "m.states{'" + met + ".EX" + "'}.bal = false";
-                tmp_script = tmp_script + "'));\n";
-        mat_script = mat_script + tmp_script;
-
-        # Add in initial fluxes (values lb/ub) and define the reaction ids
-        tmp_script = ''
-        tmp_script = tmp_script + 'm.rates.flx.lb = [...\n';
-        # lower bounds
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                if measuredFluxes_data_I:
-                    for flux in measuredFluxes_data_I:
-                        if rxn['rxn_id'] == flux['rxn_id']:
-                            tmp_script = tmp_script + str(flux['flux_lb']) + ',...\n'
-                            break;
-                        else:
-                            tmp_script = tmp_script + str(rxn['lower_bound']) + ',...\n'
-                            break;
-                else: tmp_script = tmp_script + str(rxn['lower_bound']) + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.flx.ub = [...\n';
-        # upper bounds
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                if measuredFluxes_data_I:
-                    for flux in measuredFluxes_data_I:
-                        if rxn['rxn_id'] == flux['rxn_id']:
-                            tmp_script = tmp_script + str(flux['flux_ub']) + ',...\n'
-                            break;
-                        else:
-                            tmp_script = tmp_script + str(rxn['upper_bound']) + ',...\n'
-                            break;
-                else: tmp_script = tmp_script + str(rxn['upper_bound']) + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.flx.val = [...\n';
-        # intial flux values
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                tmp_script = tmp_script + str(rxn['flux_val']) + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.on = [...\n';
-        # include/exclude a reaction from the simulation
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            if rxn['flux_val']==0.0 and rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0:
-                #tmp_script = tmp_script + 'm.rates.on(' + str(rxn_cnt) + ') = 0;\n'
-                tmp_script = tmp_script + 'false' + ',...\n'
-            else:
-                #tmp_script = tmp_script + 'm.rates.on(' + str(rxn_cnt) + ') = 1;\n'
-                tmp_script = tmp_script + 'true' + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.id = {...\n';
-        # rxn_ids
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                tmp_script = tmp_script + "'" + rxn['rxn_id'] + "',...\n"
-        tmp_script = tmp_script + '};\n';
-        tmp_script = tmp_script + 'm.rates.id = {...\n';
-
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            tmp_script = tmp_script + "'" + rxn['rxn_id'] + "',...\n"
-        tmp_script = tmp_script + '};\n';
-        mat_script = mat_script + tmp_script;
-
-        ## Check that fluxes are feasible
-        #mat_script = mat_script + "m.rates.flx.val = mod2stoich(m)';\n"
-
-        ## Add in the metabolite states (value and lb/ub)
-        ##TODO: decide on met_equations structure
-        ##NOTE: lb, ub, val = 0 for steady-state
-        #mat_script = mat_script + 'm.states.flx.lb = [...';
-        #for met in modelMetabolite_data_I:
-        #    #TODO check on how the metabolites are named
-        #    mat_script = mat_script + met['lower_bound'] + ',...\n'
-        #mat_script = mat_script + '];\n';
-        #mat_script = mat_script + 'm.states.flx.ub = [...';
-        #for met in modelMetabolite_data_I:
-        #    #TODO check on how the metabolites are named
-        #    mat_script = mat_script + met['upper_bound'] + ',...\n'
-        #mat_script = mat_script + '];\n';
-        #mat_script = mat_script + 'm.states.flx.ub = [...';
-        #for met in modelMetabolite_data_I:
-        #    #TODO check on how the metabolites are named
-        #    mat_script = mat_script + met['flux'] + ',...\n'
-        #mat_script = mat_script + '];\n';
+        yield from self._iterScript_model_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I=False,modelCache_I=modelCache_I,
+                                        rxnMappings_I=rxnMappings_I,n_workers_I=n_workers_I);
 
         ##2. Set simulation options
 
@@ -173,632 +117,737 @@ class inca_api():
         m.options.sim_ss = false;
         m.options.sim_sens = true;'''
 
-        tmp_script = ''
-        tmp_script = tmp_script + 'm.options.fit_starts = 10;\n' #10 restarts during the estimation procedure
-        mat_script = mat_script + tmp_script;
+        yield self.writeScript_simulationOptions_Inca(fit_starts_I=fit_starts_I);
         
         ##3. Define the experiment
-
-        # write out the measured fragment information
-        # (actual MS measurements will be written to the script later)
-
-        if parallel_I == 'experiment_id':
-            experiments_all = [x['experiment_id'] for x in experimentalMS_data_I];
-            experiments = list(set(experiments_all));
-            experiments.sort();
-        
-            fragments_all = [x['fragment_id'] for x in experimentalMS_data_I];
-            fragments = list(set(fragments_all));
-            fragments.sort();
-            mets_all = [x['met_id'] for x in experimentalMS_data_I];
-            mets = list(set(mets_all));
-            mets.sort();
-            times_all = [x['time_point'] for x in experimentalMS_data_I];
-            times = list(set(times_all));
-            times.sort();
-
-            for experiment_cnt,experiment in enumerate(experiments):
-                tmp_script = ''
-                tmp_script = tmp_script + 'd = msdata({...\n';
-                for fragment in fragments:
-                    for ms_data in experimentalMS_data_I:
-                        if ms_data['fragment_id'] == fragment and ms_data['experiment_id'] == experiment:
-                            tmp_script = tmp_script + "'" + ms_data['fragment_id'] + ': ' + ms_data['met_id'] + ' @ ';
-                            for pos_cnt,pos in enumerate(ms_data['met_atompositions']):
-                                    tmp_script = tmp_script + ms_data['met_elements'][pos_cnt] + str(pos+1) + ' ';
-                            tmp_script = tmp_script[:-1];
-                            tmp_script = tmp_script + "';\n"
-                            break;
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 'd.mdvs = mdv;\n';
-                mat_script = mat_script + tmp_script;
-
-                ## write substrate labeling (i.e. tracer) information
-                tmp_script = ''
-                tmp_script = tmp_script + 't = tracer({...\n';
-                for tracer in tracer_I:
-                    if tracer['experiment_id'] == experiment:
-                        tmp_script = tmp_script + "'" + tracer['met_name'] + ': ' + tracer['met_id'] + '.EX' + ' @ '
-                        for cnt,met_atompositions in enumerate(tracer['met_atompositions']):
-                                tmp_script = tmp_script + tracer['met_elements'][cnt]+str(met_atompositions) + ' '
-                        tmp_script = tmp_script[:-1]; #remove extra white space
-                        tmp_script = tmp_script + "';...\n";
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 't.frac = [';
-                for tracer in tracer_I:
-                    if tracer['experiment_id'] == experiment:
-                        tmp_script = tmp_script + str(tracer['ratio']) + ',';
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + '];\n'; #remove extra ,
-                mat_script = mat_script + tmp_script;
-                    
-                ## write flux measurements
-                tmp_script = ''
-                tmp_script = tmp_script + "f = data('";
-                for flux in measuredFluxes_data_I:
-                    if flux['experiment_id'] == experiment:
-                        ## Temporary fix until reactions can be properly named
-                        #tmp_script = tmp_script + rxn_ids_INCA[flux['rxn_id']] + " ";
-                        tmp_script = tmp_script + flux['rxn_id'] + " ";
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + "');\n";
-                tmp_script = tmp_script + 'f.val = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['experiment_id'] == experiment: tmp_script = tmp_script + str(flux['flux_average']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-                tmp_script = tmp_script + 'f.std = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['experiment_id'] == experiment: tmp_script = tmp_script + str(flux['flux_stdev']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-
-                tmp_script = tmp_script + 'x = experiment(t);\n'
-                tmp_script = tmp_script + 'x.data_flx = f;\n'
-                tmp_script = tmp_script + 'x.data_ms = d;\n'
-                tmp_script = tmp_script + ('m.expts(%d) = x;\n' %(experiment_cnt+1));
-                tmp_script = tmp_script + ("m.expts(%d).id = {'%s'};\n" %(experiment_cnt+1,experiment));
-                mat_script = mat_script + tmp_script;
-
-            # Add in ms data or Write ms data to separate file
-            for experiment_cnt,experiment in enumerate(experiments):
-                tmp_script = ''
-                for i,fragment in enumerate(fragments):
-                    for j,time in enumerate(times):
-                        # Pad the data file:
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,1,j+1,'NaN'));
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,1,j+1,'NaN'));
-                        for ms_data in experimentalMS_data_I:
-                            if ms_data['fragment_id']==fragments[i] and \
-                                ms_data['time_point']==times[j] and \
-                                ms_data['experiment_id'] == experiment:
-                                for cnt,intensity in enumerate(ms_data['intensity_normalized_average']):
-                                    # each column is a seperate time point
-                                    # each row is a seperate mdv
-                                    # Assign names and times
-                                    name = fragment + '_' + str(cnt) + '_' + str(j) + '_' + str(experiment);
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.id(%d,%d) = {'%s'};\n" %(experiment_cnt+1,i+1,1,j+1,name));
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.time(%d,%d) = %s;\n" %(experiment_cnt+1,i+1,1,j+1,time));
-                                    # Assign values
-                                    ave = ms_data['intensity_normalized_average'][cnt]
-                                    stdev = ms_data['intensity_normalized_stdev'][cnt]
-                                    # remove 0.0000 values and replace with NaN
-                                    if ave < 1e-6: 
-                                        ave = 'NaN';
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,ave));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %f;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,ave));
-                                    if stdev < 1e-3:
-                                        # check if the ave is NaN
-                                        if ave=='NaN': stdev = 'NaN';
-                                        elif stdev == 0.0: stdev = 0.05;
-                                        else: stdev = 0.001;
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,stdev));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %f;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,stdev));
-                mat_script = mat_script + tmp_script;
-        elif parallel_I == 'sample_name_abbreviation':
-            snas_all = [x['sample_name_abbreviation'] for x in experimentalMS_data_I];
-            snas = list(set(snas_all));
-            snas.sort();
-        
-            fragments_all = [x['fragment_id'] for x in experimentalMS_data_I];
-            fragments = list(set(fragments_all));
-            fragments.sort();
-            mets_all = [x['met_id'] for x in experimentalMS_data_I];
-            mets = list(set(mets_all));
-            mets.sort();
-            times_all = [x['time_point'] for x in experimentalMS_data_I];
-            times = list(set(times_all));
-            times.sort();
-        
-            for sna_cnt,sna in enumerate(snas):
-                tmp_script = ''
-                tmp_script = tmp_script + 'd = msdata({...\n';
-                for fragment in fragments:
-                    for ms_data in snaalMS_data_I:
-                        if ms_data['fragment_id'] == fragment and ms_data['sample_name_abbreviation'] == sna:
-                            tmp_script = tmp_script + "'" + ms_data['fragment_id'] + ': ' + ms_data['met_id'] + ' @ ';
-                            for pos_cnt,pos in enumerate(ms_data['met_atompositions']):
-                                    tmp_script = tmp_script + ms_data['met_elements'][pos_cnt] + str(pos+1) + ' ';
-                            tmp_script = tmp_script[:-1];
-                            tmp_script = tmp_script + "';\n"
-                            break;
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 'd.mdvs = mdv;\n';
-                mat_script = mat_script + tmp_script;
-
-                ## write substrate labeling (i.e. tracer) information
-                tmp_script = ''
-                tmp_script = tmp_script + 't = tracer({...\n';
-                for tracer in tracer_I:
-                    if tracer['sample_name_abbreviation'] == sna:
-                        tmp_script = tmp_script + "'" + tracer['met_name'] + ': ' + tracer['met_id'] + '.EX' + ' @ '
-                        for cnt,met_atompositions in enumerate(tracer['met_atompositions']):
-                                tmp_script = tmp_script + tracer['met_elements'][cnt]+str(met_atompositions) + ' '
-                        tmp_script = tmp_script[:-1]; #remove extra white space
-                        tmp_script = tmp_script + "';...\n";
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 't.frac = [';
-                for tracer in tracer_I:
-                    if tracer['sample_name_abbreviation'] == sna:
-                        tmp_script = tmp_script + str(tracer['ratio']) + ',';
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + '];\n'; #remove extra ,
-                mat_script = mat_script + tmp_script;
-                    
-                ## write flux measurements
-                tmp_script = ''
-                tmp_script = tmp_script + "f = data('";
-                for flux in measuredFluxes_data_I:
-                    if flux['sample_name_abbreviation'] == sna:
-                        ## Temporary fix until reactions can be properly named
-                        #tmp_script = tmp_script + rxn_ids_INCA[flux['rxn_id']] + " ";
-                        tmp_script = tmp_script + flux['rxn_id'] + " ";
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + "');\n";
-                tmp_script = tmp_script + 'f.val = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['sample_name_abbreviation'] == sna: tmp_script = tmp_script + str(flux['flux_average']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-                tmp_script = tmp_script + 'f.std = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['sample_name_abbreviation'] == sna: tmp_script = tmp_script + str(flux['flux_stdev']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-
-                tmp_script = tmp_script + 'x = sna(t);\n'
-                tmp_script = tmp_script + 'x.data_flx = f;\n'
-                tmp_script = tmp_script + 'x.data_ms = d;\n'
-                tmp_script = tmp_script + ('m.expts(%d) = x;\n' %(sna_cnt+1));
-                tmp_script = tmp_script + ("m.expts(%d).id = {'%s'};\n" %(sna_cnt+1,sna));
-                mat_script = mat_script + tmp_script;
-
-            # Add in ms data or Write ms data to separate file
-            for sna_cnt,sna in enumerate(snas):
-                tmp_script = ''
-                for i,fragment in enumerate(fragments):
-                    for j,time in enumerate(times):
-                        # Pad the data file:
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(sna_cnt+1,i+1,1,j+1,'NaN'));
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(sna_cnt+1,i+1,1,j+1,'NaN'));
-                        for ms_data in snaalMS_data_I:
-                            if ms_data['fragment_id']==fragments[i] and \
-                                ms_data['time_point']==times[j] and \
-                                ms_data['sample_name_abbreviation'] == sna:
-                                for cnt,intensity in enumerate(ms_data['intensity_normalized_average']):
-                                    # each column is a seperate time point
-                                    # each row is a seperate mdv
-                                    # Assign names and times
-                                    name = fragment + '_' + str(cnt) + '_' + str(j) + '_' + str(sna);
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.id(%d,%d) = {'%s'};\n" %(sna_cnt+1,i+1,1,j+1,name));
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.time(%d,%d) = %s;\n" %(sna_cnt+1,i+1,1,j+1,time));
-                                    # Assign values
-                                    ave = ms_data['intensity_normalized_average'][cnt]
-                                    stdev = ms_data['intensity_normalized_stdev'][cnt]
-                                    # remove 0.0000 values and replace with NaN
-                                    if ave < 1e-4: 
-                                        ave = 'NaN';
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(sna_cnt+1,i+1,cnt+1,j+1,ave));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %f;\n' %(sna_cnt+1,i+1,cnt+1,j+1,ave));
-                                    if stdev < 1e-3:
-                                        # check if the ave is NaN
-                                        if ave=='NaN': stdev = 'NaN';
-                                        elif stdev == 0.0: stdev = 0.05;
-                                        else: stdev = 0.001;
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(sna_cnt+1,i+1,cnt+1,j+1,stdev));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %f;\n' %(sna_cnt+1,i+1,cnt+1,j+1,stdev));
-                mat_script = mat_script + tmp_script;
-
-        return mat_script;
+        yield from self.iterScript_experiment_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,parallel_I,mdv_format_I,data_file_I,
+                                        relative_data_file_I);
+    # arguments of a job of write_isotopomerExperiments_batch (name without the _I suffix, default)
+    _isotopomerExperiment_arguments = [('modelReaction_data',None),('modelMetabolite_data',None),
+        ('measuredFluxes_data',None),('experimentalMS_data',None),('tracer',None),('parallel','experiment_id'),
+        ('mdv_format','cell'),('data_file',None),('rxnMappings',None),('fit_starts',10)];
+    def write_isotopomerExperiments_batch(self, jobs_I, directory_I, n_workers_I=None, chunk_size_I=None,
+                                          manifest_I='manifest.json', force_I=False):
+        '''Write the matlab scripts of many fluxomics experiments (see write_isotopomerExperiment_INCA)
+        using a pool of worker processes
+        INPUT:
+        jobs_I = [], of {} with 'name' (name of the script file in directory_I, e.g., 'iJO1366_glc_1.m')
+            and the arguments of write_isotopomerExperiment_INCA without the _I suffix
+            (modelReaction_data, modelMetabolite_data, measuredFluxes_data, experimentalMS_data, tracer,
+            and, optionally, parallel, mdv_format, data_file, rxnMappings, and fit_starts);
+            data_file is the name of the data file in directory_I (loaded by the script relative to its own
+            location, so that directory_I can be moved or copied, e.g., to a cluster)
+        directory_I = string, output directory (created if needed)
+        n_workers_I = int, number of worker processes
+            (default: number of cpus; 1 writes the scripts in the current process)
+        chunk_size_I = int, number of jobs per task sent to a worker
+            (the jobs of a task share a model cache; default: about 4 tasks per worker)
+        manifest_I = string, name of the json manifest in directory_I
+        force_I = boolean, write all the scripts (by default, jobs whose inputs are unchanged
+            since the last run and whose files are intact are skipped)
+        OUTPUT:
+        manifest_O = {}, job name: {} of name, script, data_file, input_hash, script_hash, data_hash,
+            seconds (time to render and write the job), written (date and time), status
+            ('written', 'skipped', or 'failed'), and error (traceback of a failed job)
+        Note: scripts and data files are written to a temporary file and renamed, so that an interrupted run
+        never leaves a partially written file; the manifest is updated once all the jobs are done'''
+        if not os.path.isdir(directory_I):
+            os.makedirs(directory_I);
+        manifest_filename = os.path.join(directory_I,manifest_I);
+        manifest = {};
+        if os.path.isfile(manifest_filename):
+            with open(manifest_filename,'r') as f:
+                manifest = json.load(f);
+        names = [job['name'] for job in jobs_I];
+        if len(set(names)) != len(names):
+            raise ValueError('the names of the jobs are not unique');
+        # skip the jobs whose inputs and files are unchanged
+        manifest_O = {};
+        jobs = [];
+        for job in jobs_I:
+            input_hash = self._get_isotopomerExperimentHash(job);
+            entry = manifest.get(job['name']);
+            if not force_I and entry is not None and entry.get('status') != 'failed' and \
+                    entry['input_hash'] == input_hash and self._check_isotopomerExperimentFiles(entry, directory_I):
+                manifest_O[job['name']] = dict(entry, status='skipped');
+            else:
+                jobs.append(job);
+        # render the remaining jobs
+        if n_workers_I is None:
+            n_workers_I = os.cpu_count() or 1;
+        if n_workers_I == 1 or len(jobs) < 2:
+            entries = _write_isotopomerExperiments_chunk(jobs, directory_I);
+        else:
+            if chunk_size_I is None:
+                chunk_size_I = max(1, -(-len(jobs)//(4*n_workers_I)));
+            chunks = [jobs[start:start+chunk_size_I] for start in range(0, len(jobs), chunk_size_I)];
+            chunk_entries = [None]*len(chunks);
+            broken = [];
+            with ProcessPoolExecutor(max_workers=n_workers_I) as executor:
+                futures = [executor.submit(_write_isotopomerExperiments_chunk, chunk, directory_I) for chunk in chunks];
+                for cnt,future in enumerate(futures):
+                    try:
+                        chunk_entries[cnt] = future.result();
+                    except BrokenProcessPool:
+                        broken.append(cnt);
+                    except Exception:
+                        error = traceback.format_exc();
+                        chunk_entries[cnt] = [self._get_isotopomerExperimentEntry(job, error) for job in chunks[cnt]];
+            # a worker died (e.g., out of memory) and the pool cannot run the unfinished chunks:
+            # retry each of their jobs in its own worker process
+            for cnt in broken:
+                chunk_entries[cnt] = [_write_isotopomerExperiments_isolated(job, directory_I) for job in chunks[cnt]];
+            entries = [entry for chunk in chunk_entries for entry in chunk];
+        for entry in entries:
+            manifest_O[entry['name']] = entry;
+            if entry['status'] == 'failed':
+                print('failed to write', entry['name']);
+        # record the jobs in the order of jobs_I (entries of jobs that were not part of this run are kept)
+        manifest.update([(name,manifest_O[name]) for name in names if manifest_O[name]['status'] != 'skipped']);
+        temporary = manifest_filename + '.tmp';
+        with open(temporary,'w') as f:
+            json.dump(manifest, f, indent=1);
+        os.replace(temporary, manifest_filename);
+        return dict([(name,manifest_O[name]) for name in names]);
+    def _get_isotopomerExperimentHash(self, job_I):
+        '''return the (sha1) hash of the inputs of a job of write_isotopomerExperiments_batch
+        (the output directory is not part of the hash: the scripts load their data file relative
+        to their own location, so a moved or copied directory is still up to date)'''
+        arguments = [(name,job_I.get(name,default)) for name,default in self._isotopomerExperiment_arguments];
+        return hashlib.sha1(repr((job_I['name'],arguments)).encode('utf-8')).hexdigest();
+    def _get_fileHash(self, filename_I):
+        '''return the (sha1) hash of the contents of a file'''
+        sha1 = hashlib.sha1();
+        with open(filename_I,'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha1.update(block);
+        return sha1.hexdigest();
+    def _check_isotopomerExperimentFiles(self, entry_I, directory_I):
+        '''check that the files of a manifest entry exist and are unchanged'''
+        for filename,file_hash in [(entry_I['script'],entry_I['script_hash']),(entry_I['data_file'],entry_I['data_hash'])]:
+            if filename is None: continue;
+            filename = os.path.join(directory_I,filename);
+            if not os.path.isfile(filename) or self._get_fileHash(filename) != file_hash:
+                return False;
+        return True;
+    def _write_isotopomerExperiment_job(self, job_I, directory_I, modelCache_I=None):
+        '''render and write the script (and data file) of a job of write_isotopomerExperiments_batch
+        OUTPUT:
+        entry_O = {}, manifest entry of the job'''
+        start = time.perf_counter();
+        arguments = dict([(name,job_I.get(name,default)) for name,default in self._isotopomerExperiment_arguments]);
+        entry_O = self._get_isotopomerExperimentEntry(job_I);
+        data_file = os.path.join(directory_I,arguments['data_file']) if arguments['data_file'] else None;
+        filename = os.path.join(directory_I,job_I['name']);
+        temporary = filename + '.tmp';
+        try:
+            self._write_scriptChunks(self.iterScript_isotopomerExperiment_INCA(arguments['modelReaction_data'],
+                arguments['modelMetabolite_data'],arguments['measuredFluxes_data'],arguments['experimentalMS_data'],
+                arguments['tracer'],arguments['parallel'],arguments['mdv_format'],data_file,
+                modelCache_I,arguments['rxnMappings'],relative_data_file_I=True,
+                fit_starts_I=arguments['fit_starts']),temporary);
+            os.replace(temporary,filename);
+            entry_O['script_hash'] = self._get_fileHash(filename);
+            if data_file:
+                entry_O['data_hash'] = self._get_fileHash(data_file);
+        except Exception:
+            if os.path.isfile(temporary):
+                os.remove(temporary);
+            entry_O['status'] = 'failed';
+            entry_O['error'] = traceback.format_exc();
+        entry_O['seconds'] = time.perf_counter() - start;
+        return entry_O;
+    def _get_isotopomerExperimentEntry(self, job_I, error_I=None):
+        '''return the manifest entry of a job of write_isotopomerExperiments_batch (before it is written)
+        INPUT:
+        error_I = optional string, error of a failed job (the status of the entry is then 'failed')'''
+        return {'name':job_I['name'],'script':job_I['name'],'data_file':job_I.get('data_file'),
+            'input_hash':self._get_isotopomerExperimentHash(job_I),
+            'script_hash':None,'data_hash':None,'seconds':None,'written':dt.now().isoformat(),
+            'status':'written' if error_I is None else 'failed','error':error_I};
     #Matlab Scripts for INCA
     def writeScript_model_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
-                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I):
-        '''Generate the model information for INCA'''
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
+                                        file_I = None, modelCache_I = None, rxnMappings_I = None, n_workers_I = 1):
+        '''Generate the model information for INCA
+        INPUT:
+        file_I = optional file-like object or filename; if given, the script is streamed to the file
+            (and None is returned) instead of being returned as a string
+        modelCache_I = optional inca_scriptCache; the rendered model section is reused for identical
+            reactions, metabolites, and measured flux bounds
+        rxnMappings_I = optional {}, rxn_id: {} of the atom mapping of the reaction (the arguments of
+            make_isotopomerRxnEquations_batch); the equations of these reactions are generated from the
+            atom mappings instead of being taken from rxn_equation
+        n_workers_I = int, number of worker processes used to generate the equations of rxnMappings_I
+            (see make_isotopomerRxnEquations_batch)'''
+        return self._write_scriptChunks(self.iterScript_model_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,modelCache_I,
+                                        rxnMappings_I,n_workers_I),file_I);
+    def iterScript_model_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
+                                        modelCache_I = None, rxnMappings_I = None, n_workers_I = 1):
+        '''Generate the chunks of the model information for INCA
+        (see writeScript_model_INCA)'''
 
-        mat_script = 'clear functions\n';
+        yield 'clear functions\n';
 
         ##1. Define the model:
+        yield from self._iterScript_model_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I=True,modelCache_I=modelCache_I,
+                                        rxnMappings_I=rxnMappings_I,n_workers_I=n_workers_I);
+    def _iterScript_model_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I=True,modelCache_I=None,
+                                        rxnMappings_I=None,n_workers_I=1):
+        '''Generate the chunks of the model definition, using the cache if given
+        INPUT:
+        balance_I = boolean, unbalance the states of metabolites with '.balance' in the met_id
+        modelCache_I = optional inca_scriptCache
+        rxnMappings_I = optional {}, rxn_id: {} of the atom mapping of the reaction
+        n_workers_I = int, number of worker processes used to generate the equations of rxnMappings_I'''
+        if modelCache_I is None:
+            yield from self._iterScript_modelSection_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I,rxnMappings_I,n_workers_I);
+            return;
+        key = modelCache_I.get_key(*self._get_modelSectionInputs(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I,rxnMappings_I));
+        section = modelCache_I.get(key);
+        if section is None:
+            section = ''.join(self._iterScript_modelSection_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I,rxnMappings_I,n_workers_I));
+            modelCache_I.set(key,section);
+        yield section;
+    def _get_modelSectionInputs(self, modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I=True,rxnMappings_I=None):
+        '''return the inputs that determine the model definition (used as the cache key):
+        the fields of the reactions and metabolites that are rendered, the measured flux bounds
+        of the reactions, the biomass equation, balance_I, and the atom mappings of the reactions (if given)'''
+        reactions = [(rxn['rxn_id'],rxn['rxn_equation'],rxn['lower_bound'],rxn['upper_bound'],rxn['flux_val'])
+                     for rxn in modelReaction_data_I];
+        metabolites = [(met['met_id'],met['met_atompositions'],met['met_elements'],
+                        met['met_symmetry_atompositions'],met['met_symmetry_elements'])
+                       for met in modelMetabolite_data_I];
+        measuredFluxes_index = self._index_measuredFluxes(measuredFluxes_data_I);
+        bounds = sorted([(rxn_id,flux['flux_lb'],flux['flux_ub']) for rxn_id,flux in measuredFluxes_index.items()]);
+        if rxnMappings_I:
+            mappings = [(rxn['rxn_id'],rxnMappings_I[rxn['rxn_id']]) for rxn in modelReaction_data_I
+                        if rxn['rxn_id'] in rxnMappings_I];
+            return reactions,metabolites,bounds,self.biomass_INCA,balance_I,mappings;
+        return reactions,metabolites,bounds,self.biomass_INCA,balance_I;
+    def _iterScript_modelSection_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,balance_I=True,rxnMappings_I=None,n_workers_I=1):
+        '''Generate the chunks of the model definition (reactions, symmetry, states, and rates)
+        INPUT:
+        balance_I = boolean, unbalance the states of metabolites with '.balance' in the met_id
+        rxnMappings_I = optional {}, rxn_id: {} of the atom mapping of the reaction
+        n_workers_I = int, number of worker processes used to generate the equations of rxnMappings_I'''
+        profiler = self.profiler;
+        yield from profiler.iter_stage('model.reactions',self._iterScript_modelReactions_INCA(modelReaction_data_I,
+                                        rxnMappings_I,n_workers_I),len(modelReaction_data_I));
+        yield from profiler.iter_stage('model.symmetry',self._iterScript_modelSymmetry_INCA(modelMetabolite_data_I),
+                                        len(modelMetabolite_data_I));
+        yield from profiler.iter_stage('model.states',self._iterScript_modelStates_INCA(modelMetabolite_data_I,balance_I),
+                                        len(modelMetabolite_data_I));
+        yield from profiler.iter_stage('model.bounds',self._iterScript_modelBounds_INCA(modelReaction_data_I,measuredFluxes_data_I),
+                                        len(modelReaction_data_I));
+        yield from profiler.iter_stage('model.rates',self._iterScript_modelRateIds_INCA(modelReaction_data_I),
+                                        len(modelReaction_data_I));
+    def _iterScript_modelReactions_INCA(self, modelReaction_data_I, rxnMappings_I=None, n_workers_I=1):
+        '''Generate the chunks of the reaction equations and the model'''
 
         ## debug reaction equations
-        #tmp_script = ''
+        #yield 'r = reaction({...\n';
         #for rxn in modelReaction_data_I:
         #    #TODO check on how the reactions are named  
-        #    tmp_script = tmp_script + 'r = reaction({...\n';
-        #    tmp_script = tmp_script + "'" + rxn['rxn_equation'] + "';...\n"
-        #    tmp_script = tmp_script + '});\n';
-        #mat_script = mat_script + tmp_script;
+        #    yield "'" + rxn['rxn_equation'] + "';...\n"
+        #yield '});\n';
 
         # write out reaction equations
-        tmp_script = ''
-        tmp_script = tmp_script + 'r = reaction({...\n';
-        rxn_ids_INCA = {};
-        cnt = 0
+        rxn_equations = self._get_rxnEquations(modelReaction_data_I,rxnMappings_I,n_workers_I);
+        yield 'r = reaction({...\n';
         for rxn_cnt,rxn in enumerate(modelReaction_data_I):
             #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                rxn_ids_INCA[rxn['rxn_id']] = ('R'+str(cnt+1));
-                cnt+=1;
                 if rxn['rxn_id'] == 'Ec_biomass_iJO1366_WT_53p95M':
-                    tmp_script = tmp_script + "'" + self.biomass_INCA + "';...\n"
-                #    #tmp_script = tmp_script + "'" + self.biomass_INCA_iJS2012 + "';...\n"
+                    yield "'" + self.biomass_INCA + "';...\n"
+                    #yield "'" + self.biomass_INCA_iJS2012 + "';...\n"
                 else:
-                    tmp_script = tmp_script + "'" + rxn['rxn_equation'] + "';...\n"
-                #tmp_script = tmp_script + "'" + rxn['rxn_equation'] + "';...\n"
+                    yield "'" + rxn_equations[rxn_cnt] + "';...\n"
             #else:
             #    print 'rxn_id ' + rxn['rxn_id'] + ' will be excluded from INCA' 
-        tmp_script = tmp_script + '});\n';
-        mat_script = mat_script + tmp_script;
+        yield '});\n';
 
         # setup the model
-        mat_script = mat_script + 'm = model(r);\n'
+        yield 'm = model(r);\n'
+    def _iterScript_modelSymmetry_INCA(self, modelMetabolite_data_I):
+        '''Generate the chunks of the symmetrical metabolites'''
 
         # Take care of symmetrical metabolites if not done so in the reaction equations
-        tmp_script = ''
+        # (met_symmetry_atompositions may also be an inca_atomMapping of the atoms onto the rotated atoms)
         for met in modelMetabolite_data_I:
-            if met['met_symmetry_atompositions']:
-                tmp_script = tmp_script + "m.mets{'" + met['met_id'] + "'}.sym = list('rotate180',map('";
+            if isinstance(met['met_symmetry_atompositions'], inca_atomMapping):
+                yield "m.mets{'" + met['met_id'] + "'}.sym = list('rotate180',map('" + met['met_symmetry_atompositions'].to_INCA() + "'));\n";
+            elif met['met_symmetry_atompositions']:
+                tmp_script = "m.mets{'" + met['met_id'] + "'}.sym = list('rotate180',map('";
                 for cnt,atompositions in enumerate(met['met_atompositions']):
                     tmp_script = tmp_script + met['met_elements'][cnt] + str(atompositions+1) + ':' + met['met_symmetry_elements'][cnt] + str(met['met_symmetry_atompositions'][cnt]+1) + ' ';
                 tmp_script = tmp_script[:-1];
-                tmp_script = tmp_script + "'));\n";
-        mat_script = mat_script + tmp_script;
+                yield tmp_script + "'));\n";
+    def _iterScript_modelStates_INCA(self, modelMetabolite_data_I, balance_I=True):
+        '''Generate the chunks of the unbalanced metabolite states'''
 
         # Add in the metabolite states (balance), value, and lb/ub)
-        tmp_script = ''
         # specify metabolites that should be forcible unbalanced
         #NOTE: hard-coded for now until a better workaround can be done
         metabolites_all = [x['met_id'] for x in modelMetabolite_data_I];
         for met in ['co2_e','h2o_e','h_e','na1_e']:
             if met in metabolites_all:
-                tmp_script = tmp_script + "m.states{'" + met + ".EX" + "'}.bal = false";
-                tmp_script = tmp_script + ";\n";
-        for met in modelMetabolite_data_I:
-            if '.balance' in met['met_id']:
-                tmp_script = tmp_script + "m.states{'" + met['met_id']  + "'}.bal = false";
-                tmp_script = tmp_script + ";\n";
-        mat_script = mat_script + tmp_script;
+                yield "m.states{'" + met + ".EX" + "'}.bal = false;\n";
+        if balance_I:
+            for met in modelMetabolite_data_I:
+                if '.balance' in met['met_id']:
+                    yield "m.states{'" + met['met_id']  + "'}.bal = false;\n";
+    def _iterScript_modelBounds_INCA(self, modelReaction_data_I, measuredFluxes_data_I):
+        '''Generate the chunks of the flux bounds, initial values, and on/off states of the reactions'''
 
         # Add in initial fluxes (values lb/ub) and define the reaction ids
-        tmp_script = ''
-        tmp_script = tmp_script + 'm.rates.flx.lb = [...\n';
-        # lower bounds
+        # (measured fluxes override the lower/upper bounds of their reaction)
+        measuredFluxes_index = self._index_measuredFluxes(measuredFluxes_data_I, warn_I=True);
+        lbs = []; ubs = []; vals = []; ons = [];
         for rxn_cnt,rxn in enumerate(modelReaction_data_I):
             #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                if measuredFluxes_data_I:
-                    for flux in measuredFluxes_data_I:
-                        if rxn['rxn_id'] == flux['rxn_id']:
-                            tmp_script = tmp_script + str(flux['flux_lb']) + ',...\n'
-                            break;
-                        else:
-                            tmp_script = tmp_script + str(rxn['lower_bound']) + ',...\n'
-                            break;
-                else: tmp_script = tmp_script + str(rxn['lower_bound']) + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.flx.ub = [...\n';
+                flux = measuredFluxes_index.get(rxn['rxn_id']);
+                if flux is not None:
+                    lbs.append(str(flux['flux_lb']) + ',...\n');
+                    ubs.append(str(flux['flux_ub']) + ',...\n');
+                else:
+                    lbs.append(str(rxn['lower_bound']) + ',...\n');
+                    ubs.append(str(rxn['upper_bound']) + ',...\n');
+                # intial flux values
+                vals.append(str(rxn['flux_val']) + ',...\n');
+                # include/exclude a reaction from the simulation
+                if rxn['flux_val']==0.0 and rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0:
+                    ons.append('false' + ',...\n');
+                else:
+                    ons.append('true' + ',...\n');
+        # lower bounds
+        yield 'm.rates.flx.lb = [...\n';
+        yield ''.join(lbs);
+        yield '];\n';
         # upper bounds
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                if measuredFluxes_data_I:
-                    for flux in measuredFluxes_data_I:
-                        if rxn['rxn_id'] == flux['rxn_id']:
-                            tmp_script = tmp_script + str(flux['flux_ub']) + ',...\n'
-                            break;
-                        else:
-                            tmp_script = tmp_script + str(rxn['upper_bound']) + ',...\n'
-                            break;
-                else: tmp_script = tmp_script + str(rxn['upper_bound']) + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.flx.val = [...\n';
-        # intial flux values
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                tmp_script = tmp_script + str(rxn['flux_val']) + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.on = [...\n';
-        # include/exclude a reaction from the simulation
-        for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            if rxn['flux_val']==0.0 and rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0:
-                #tmp_script = tmp_script + 'm.rates.on(' + str(rxn_cnt) + ') = 0;\n'
-                tmp_script = tmp_script + 'false' + ',...\n'
-            else:
-                #tmp_script = tmp_script + 'm.rates.on(' + str(rxn_cnt) + ') = 1;\n'
-                tmp_script = tmp_script + 'true' + ',...\n'
-        tmp_script = tmp_script + '];\n';
-        tmp_script = tmp_script + 'm.rates.id = {...\n';
+        yield 'm.rates.flx.ub = [...\n';
+        yield ''.join(ubs);
+        yield '];\n';
+        yield 'm.rates.flx.val = [...\n';
+        yield ''.join(vals);
+        yield '];\n';
+        yield 'm.rates.on = [...\n';
+        yield ''.join(ons);
+        yield '];\n';
+    def _iterScript_modelRateIds_INCA(self, modelReaction_data_I):
+        '''Generate the chunks of the reaction ids'''
+
+        yield 'm.rates.id = {...\n';
         # rxn_ids
         for rxn_cnt,rxn in enumerate(modelReaction_data_I):
             #if not(rxn['upper_bound']==0.0 and rxn['lower_bound']==0.0):
-                tmp_script = tmp_script + "'" + rxn['rxn_id'] + "',...\n"
-        tmp_script = tmp_script + '};\n';
-        tmp_script = tmp_script + 'm.rates.id = {...\n';
+                yield "'" + rxn['rxn_id'] + "',...\n"
+        yield '};\n';
+        yield 'm.rates.id = {...\n';
 
         for rxn_cnt,rxn in enumerate(modelReaction_data_I):
-            tmp_script = tmp_script + "'" + rxn['rxn_id'] + "',...\n"
-        tmp_script = tmp_script + '};\n';
-        mat_script = mat_script + tmp_script;
+            yield "'" + rxn['rxn_id'] + "',...\n"
+        yield '};\n';
 
         ## Check that fluxes are feasible
-        #mat_script = mat_script + "m.rates.flx.val = mod2stoich(m)';\n"
+        #yield "m.rates.flx.val = mod2stoich(m)';\n"
 
         ## Add in the metabolite states (value and lb/ub)
         ##TODO: decide on met_equations structure
         ##NOTE: lb, ub, val = 0 for steady-state
-        #mat_script = mat_script + 'm.states.flx.lb = [...';
+        #yield 'm.states.flx.lb = [...';
         #for met in modelMetabolite_data_I:
         #    #TODO check on how the metabolites are named
-        #    mat_script = mat_script + met['lower_bound'] + ',...\n'
-        #mat_script = mat_script + '];\n';
-        #mat_script = mat_script + 'm.states.flx.ub = [...';
+        #    yield met['lower_bound'] + ',...\n'
+        #yield '];\n';
+        #yield 'm.states.flx.ub = [...';
         #for met in modelMetabolite_data_I:
         #    #TODO check on how the metabolites are named
-        #    mat_script = mat_script + met['upper_bound'] + ',...\n'
-        #mat_script = mat_script + '];\n';
-        #mat_script = mat_script + 'm.states.flx.ub = [...';
+        #    yield met['upper_bound'] + ',...\n'
+        #yield '];\n';
+        #yield 'm.states.flx.ub = [...';
         #for met in modelMetabolite_data_I:
         #    #TODO check on how the metabolites are named
-        #    mat_script = mat_script + met['flux'] + ',...\n'
-        #mat_script = mat_script + '];\n';
-
-        return mat_script;
+        #    yield met['flux'] + ',...\n'
+        #yield '];\n';
+    def _get_rxnEquations(self, modelReaction_data_I, rxnMappings_I=None, n_workers_I=1):
+        '''return the reaction equations in the order of the reactions
+        (generated from the atom mappings for the reactions in rxnMappings_I)'''
+        rxn_equations_O = [rxn['rxn_equation'] for rxn in modelReaction_data_I];
+        if not rxnMappings_I:
+            return rxn_equations_O;
+        mapped = [rxn_cnt for rxn_cnt,rxn in enumerate(modelReaction_data_I)
+                  if rxn['rxn_id'] in rxnMappings_I and rxn['rxn_id'] != 'Ec_biomass_iJO1366_WT_53p95M'];
+        rxn_equations = self.make_isotopomerRxnEquations_batch([rxnMappings_I[modelReaction_data_I[rxn_cnt]['rxn_id']] for rxn_cnt in mapped],
+                                        n_workers_I=n_workers_I);
+        for rxn_cnt,rxn_equation in zip(mapped,rxn_equations):
+            rxn_equations_O[rxn_cnt] = rxn_equation;
+        return rxn_equations_O;
     def writeScript_experiment_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
                                         measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
-                                        parallel_I = 'experiment_id'):
-        '''Generate the experimental information for INCA'''
+                                        parallel_I = 'experiment_id', file_I = None, mdv_format_I = 'cell',
+                                        data_file_I = None, relative_data_file_I = False):
+        '''Generate the experimental information for INCA
+        INPUT:
+        parallel_I = string, key of the parallel labeling experiments (e.g., 'experiment_id' or 'sample_name_abbreviation')
+            or tuple of strings, composite key (e.g., ('experiment_id','sample_name_abbreviation'));
+            the MS data, measured fluxes, and tracers are grouped into one experiment per key
+        mdv_format_I = string, 'cell' (one assignment per MDV element) or 'matrix' (one matrix/cell literal
+            per fragment for mdvs.val, std, id, and time)
+        data_file_I = optional string, name of a .mat file; if given, the measured fluxes, tracer fractions,
+            and MDVs are written to the file (full precision) and loaded by the script instead of being
+            written inline (mdv_format_I is then ignored)
+        relative_data_file_I = boolean, load the data file from the directory of the script
+            (by its name, instead of by the path data_file_I; the script must be saved next to the data file)
+        file_I = optional file-like object or filename; if given, the script is streamed to the file
+            (and None is returned) instead of being returned as a string'''
+        return self._write_scriptChunks(self.iterScript_experiment_INCA(modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,parallel_I,mdv_format_I,data_file_I,
+                                        relative_data_file_I),file_I);
+    def iterScript_experiment_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
+                                        measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
+                                        parallel_I = 'experiment_id', mdv_format_I = 'cell', data_file_I = None,
+                                        relative_data_file_I = False):
+        '''Generate the chunks of the experimental information for INCA
+        (see writeScript_experiment_INCA)'''
         
         ##3. Define the experiment
+        if not mdv_format_I in ['cell','matrix']:
+            raise ValueError('mdv_format ' + str(mdv_format_I) + ' not recognized');
+
+        # partition the MS data, measured fluxes, and tracers by experiment
+        profiler = self.profiler;
+        profiler.start('experiment.partition');
+        experiments_data,fragments,times = self._partition_experiments(experimentalMS_data_I,measuredFluxes_data_I,tracer_I,parallel_I);
+        experiments = [x for x in experiments_data.keys() if experiments_data[x]['fragments']];
+        experiments.sort();
+        profiler.stop('experiment.partition',len(experimentalMS_data_I));
+
+        # write the measurements to the data file
+        if data_file_I:
+            with profiler.stage('experiment.data_file',len(experiments)):
+                self._write_experimentData(data_file_I,experiments,experiments_data,fragments,times);
+            if relative_data_file_I:
+                yield ("inca_data = load(fullfile(fileparts(mfilename('fullpath')),'%s'));\n" %(os.path.basename(data_file_I)));
+            else:
+                yield ("inca_data = load('%s');\n" %(data_file_I));
 
         # write out the measured fragment information
         # (actual MS measurements will be written to the script later)
-        mat_script = '';
-
-        if parallel_I == 'experiment_id':
-            experiments_all = [x['experiment_id'] for x in experimentalMS_data_I];
-            experiments = list(set(experiments_all));
-            experiments.sort();
-        
-            fragments_all = [x['fragment_id'] for x in experimentalMS_data_I];
-            fragments = list(set(fragments_all));
-            fragments.sort();
-            mets_all = [x['met_id'] for x in experimentalMS_data_I];
-            mets = list(set(mets_all));
-            mets.sort();
-            times_all = [x['time_point'] for x in experimentalMS_data_I];
-            times = list(set(times_all));
-            times.sort();
-
-            for experiment_cnt,experiment in enumerate(experiments):
-                tmp_script = ''
-                tmp_script = tmp_script + 'd = msdata({...\n';
-                for fragment in fragments:
-                    for ms_data in experimentalMS_data_I:
-                        if ms_data['fragment_id'] == fragment and ms_data['experiment_id'] == experiment:
-                            tmp_script = tmp_script + "'" + ms_data['fragment_id'] + ': ' + ms_data['met_id'] + ' @ ';
-                            for pos_cnt,pos in enumerate(ms_data['met_atompositions']):
-                                    tmp_script = tmp_script + ms_data['met_elements'][pos_cnt] + str(pos+1) + ' ';
-                            tmp_script = tmp_script[:-1];
-                            tmp_script = tmp_script + "';\n"
-                            break;
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 'd.mdvs = mdv;\n';
-                mat_script = mat_script + tmp_script;
-
-                ## write substrate labeling (i.e. tracer) information
-                tmp_script = ''
-                tmp_script = tmp_script + 't = tracer({...\n';
-                for tracer in tracer_I:
-                    if tracer['experiment_id'] == experiment:
-                        tmp_script = tmp_script + "'" + tracer['met_name'] + ': ' + tracer['met_id'] + '.EX' + ' @ '
-                        for cnt,met_atompositions in enumerate(tracer['met_atompositions']):
-                                tmp_script = tmp_script + tracer['met_elements'][cnt]+str(met_atompositions) + ' '
-                        tmp_script = tmp_script[:-1]; #remove extra white space
-                        tmp_script = tmp_script + "';...\n";
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 't.frac = [';
-                for tracer in tracer_I:
-                    if tracer['experiment_id'] == experiment:
-                        tmp_script = tmp_script + str(tracer['ratio']) + ',';
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + '];\n'; #remove extra ,
-                mat_script = mat_script + tmp_script;
-                    
-                ## write flux measurements
-                tmp_script = ''
-                tmp_script = tmp_script + "f = data('";
-                for flux in measuredFluxes_data_I:
-                    if flux['experiment_id'] == experiment:
-                        ## Temporary fix until reactions can be properly named
-                        #tmp_script = tmp_script + rxn_ids_INCA[flux['rxn_id']] + " ";
-                        tmp_script = tmp_script + flux['rxn_id'] + " ";
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + "');\n";
-                tmp_script = tmp_script + 'f.val = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['experiment_id'] == experiment: tmp_script = tmp_script + str(flux['flux_average']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-                tmp_script = tmp_script + 'f.std = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['experiment_id'] == experiment: tmp_script = tmp_script + str(flux['flux_stdev']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-
-                tmp_script = tmp_script + 'x = experiment(t);\n'
-                tmp_script = tmp_script + 'x.data_flx = f;\n'
-                tmp_script = tmp_script + 'x.data_ms = d;\n'
-                tmp_script = tmp_script + ('m.expts(%d) = x;\n' %(experiment_cnt+1));
-                tmp_script = tmp_script + ("m.expts(%d).id = {'%s'};\n" %(experiment_cnt+1,experiment));
-                mat_script = mat_script + tmp_script;
-
-            # Add in ms data or Write ms data to separate file
-            for experiment_cnt,experiment in enumerate(experiments):
-                tmp_script = ''
-                for i,fragment in enumerate(fragments):
-                    for j,time in enumerate(times):
-                        # Pad the data file:
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,1,j+1,'NaN'));
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,1,j+1,'NaN'));
-                        for ms_data in experimentalMS_data_I:
-                            if ms_data['fragment_id']==fragments[i] and \
-                                ms_data['time_point']==times[j] and \
-                                ms_data['experiment_id'] == experiment:
-                                if not ms_data['intensity_normalized_average']: continue; #measurements will need to be added/simulated later
-                                for cnt,intensity in enumerate(ms_data['intensity_normalized_average']):
-                                    # each column is a seperate time point
-                                    # each row is a seperate mdv
-                                    # Assign names and times
-                                    name = fragment + '_' + str(cnt) + '_' + str(j) + '_' + str(experiment);
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.id(%d,%d) = {'%s'};\n" %(experiment_cnt+1,i+1,1,j+1,name));
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.time(%d,%d) = %s;\n" %(experiment_cnt+1,i+1,1,j+1,time));
-                                    # Assign values
-                                    ave = ms_data['intensity_normalized_average'][cnt]
-                                    stdev = ms_data['intensity_normalized_stdev'][cnt]
-                                    # remove 0.0000 values and replace with NaN
-                                    if ave < 1e-6: 
-                                        ave = 'NaN';
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,ave));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %f;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,ave));
-                                    if stdev < 1e-3:
-                                        # check if the ave is NaN
-                                        if ave=='NaN': stdev = 'NaN';
-                                        elif stdev == 0.0: stdev = 0.05;
-                                        else: stdev = 0.001;
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,stdev));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %f;\n' %(experiment_cnt+1,i+1,cnt+1,j+1,stdev));
-                mat_script = mat_script + tmp_script;
-        elif parallel_I == 'sample_name_abbreviation':
-            snas_all = [x['sample_name_abbreviation'] for x in experimentalMS_data_I];
-            snas = list(set(snas_all));
-            snas.sort();
-        
-            fragments_all = [x['fragment_id'] for x in experimentalMS_data_I];
-            fragments = list(set(fragments_all));
-            fragments.sort();
-            mets_all = [x['met_id'] for x in experimentalMS_data_I];
-            mets = list(set(mets_all));
-            mets.sort();
-            times_all = [x['time_point'] for x in experimentalMS_data_I];
-            times = list(set(times_all));
-            times.sort();
-        
-            for sna_cnt,sna in enumerate(snas):
-                tmp_script = ''
-                tmp_script = tmp_script + 'd = msdata({...\n';
-                for fragment in fragments:
-                    for ms_data in experimentalMS_data_I:
-                        if ms_data['fragment_id'] == fragment and ms_data['sample_name_abbreviation'] == sna:
-                            tmp_script = tmp_script + "'" + ms_data['fragment_id'] + ': ' + ms_data['met_id'] + ' @ ';
-                            for pos_cnt,pos in enumerate(ms_data['met_atompositions']):
-                                    tmp_script = tmp_script + ms_data['met_elements'][pos_cnt] + str(pos+1) + ' ';
-                            tmp_script = tmp_script[:-1];
-                            tmp_script = tmp_script + "';\n"
-                            break;
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 'd.mdvs = mdv;\n';
-                mat_script = mat_script + tmp_script;
-
-                ## write substrate labeling (i.e. tracer) information
-                tmp_script = ''
-                tmp_script = tmp_script + 't = tracer({...\n';
-                for tracer in tracer_I:
-                    if tracer['sample_name_abbreviation'] == sna:
-                        tmp_script = tmp_script + "'" + tracer['met_name'] + ': ' + tracer['met_id'] + '.EX' + ' @ '
-                        for cnt,met_atompositions in enumerate(tracer['met_atompositions']):
-                                tmp_script = tmp_script + tracer['met_elements'][cnt]+str(met_atompositions) + ' '
-                        tmp_script = tmp_script[:-1]; #remove extra white space
-                        tmp_script = tmp_script + "';...\n";
-                tmp_script = tmp_script + '});\n';
-                tmp_script = tmp_script + 't.frac = [';
-                for tracer in tracer_I:
-                    if tracer['sample_name_abbreviation'] == sna:
-                        tmp_script = tmp_script + str(tracer['ratio']) + ',';
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + '];\n'; #remove extra ,
-                mat_script = mat_script + tmp_script;
-                    
-                ## write flux measurements
-                tmp_script = ''
-                tmp_script = tmp_script + "f = data('";
-                for flux in measuredFluxes_data_I:
-                    if flux['sample_name_abbreviation'] == sna:
-                        ## Temporary fix until reactions can be properly named
-                        #tmp_script = tmp_script + rxn_ids_INCA[flux['rxn_id']] + " ";
-                        tmp_script = tmp_script + flux['rxn_id'] + " ";
-                tmp_script = tmp_script[:-1]; #remove extra ,
-                tmp_script = tmp_script + "');\n";
-                tmp_script = tmp_script + 'f.val = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['sample_name_abbreviation'] == sna: tmp_script = tmp_script + str(flux['flux_average']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
-                tmp_script = tmp_script + 'f.std = [...\n';
-                for flux in measuredFluxes_data_I:
-                    if flux['sample_name_abbreviation'] == sna: tmp_script = tmp_script + str(flux['flux_stdev']) + ',...\n';
-                tmp_script = tmp_script + '];\n';
+        for experiment_cnt,experiment in enumerate(experiments):
+            yield from profiler.iter_stage('experiment.definitions',
+                                        self._iterScript_experimentDefinition_INCA(experiment_cnt,experiment,experiments_data[experiment],
+                                        fragments,data_file_I),len(experiments_data[experiment]['fragments']));
+
+        # Add in ms data or Write ms data to separate file
+        if data_file_I:
+            yield 'for i = 1:size(inca_data.mdv_val,1)\n';
+            yield '\tfor j = 1:size(inca_data.mdv_val,2)\n';
+            yield '\t\tm.expts(i).data_ms(j).mdvs.val = inca_data.mdv_val{i,j};\n';
+            yield '\t\tm.expts(i).data_ms(j).mdvs.std = inca_data.mdv_std{i,j};\n';
+            yield '\t\tif ~isempty(inca_data.mdv_id{i,j})\n';
+            yield '\t\t\tm.expts(i).data_ms(j).mdvs.id = inca_data.mdv_id{i,j};\n';
+            yield '\t\t\tm.expts(i).data_ms(j).mdvs.time = inca_data.mdv_time{i,j};\n';
+            yield '\t\tend\n';
+            yield '\tend\n';
+            yield 'end\n';
+            return;
+        for experiment_cnt,experiment in enumerate(experiments):
+            yield from profiler.iter_stage('experiment.mdvs',
+                                        self._iterScript_experimentMDVs_INCA(experiment_cnt,experiment,experiments_data[experiment],
+                                        fragments,times,mdv_format_I),len(experiments_data[experiment]['ms_data']));
+    def _iterScript_experimentDefinition_INCA(self, experiment_cnt_I, experiment_I, experiment_data_I, fragments_I, data_file_I=None):
+        '''Generate the definition of an experiment (fragments, tracers, and measured fluxes)
+        INPUT:
+        experiment_cnt_I = int, index of the experiment
+        experiment_I = experiment (value of the parallel key)
+        experiment_data_I = {}, partition of the experiment (see _partition_experiments)
+        fragments_I = [], of all fragment_ids
+        data_file_I = optional string, name of the .mat file with the measurements'''
+        yield 'd = msdata({...\n';
+        for fragment in fragments_I:
+            ms_data = experiment_data_I['fragments'].get(fragment);
+            if ms_data is not None:
+                tmp_script = "'" + ms_data['fragment_id'] + ': ' + ms_data['met_id'] + ' @ ';
+                if isinstance(ms_data['met_atompositions'], inca_atomMapping):
+                    # atoms of the fragment as an inca_atomMapping
+                    yield tmp_script + ms_data['met_atompositions'].to_atoms() + "';\n";
+                    continue;
+                for pos_cnt,pos in enumerate(ms_data['met_atompositions']):
+                        tmp_script = tmp_script + ms_data['met_elements'][pos_cnt] + str(pos+1) + ' ';
+                tmp_script = tmp_script[:-1];
+                yield tmp_script + "';\n"
+        yield '});\n';
+        yield 'd.mdvs = mdv;\n';
+
+        ## write substrate labeling (i.e. tracer) information
+        yield 't = tracer({...\n';
+        for tracer in experiment_data_I['tracers']:
+            tmp_script = "'" + tracer['met_name'] + ': ' + tracer['met_id'] + '.EX' + ' @ '
+            for cnt,met_atompositions in enumerate(tracer['met_atompositions']):
+                    tmp_script = tmp_script + tracer['met_elements'][cnt]+str(met_atompositions) + ' '
+            tmp_script = tmp_script[:-1]; #remove extra white space
+            yield tmp_script + "';...\n";
+        yield '});\n';
+        if data_file_I:
+            yield ('t.frac = inca_data.tracer_frac{%d};\n' %(experiment_cnt_I+1));
+        else:
+            tmp_script = 't.frac = [';
+            for tracer in experiment_data_I['tracers']:
+                tmp_script = tmp_script + str(tracer['ratio']) + ',';
+            tmp_script = tmp_script[:-1]; #remove extra ,
+            yield tmp_script + '];\n';
                 
-                tmp_script = tmp_script + 'x = experiment(t);\n'
-                tmp_script = tmp_script + 'x.data_flx = f;\n'
-                tmp_script = tmp_script + 'x.data_ms = d;\n'
-                tmp_script = tmp_script + ('m.expts(%d) = x;\n' %(sna_cnt+1));
-                tmp_script = tmp_script + ("m.expts(%d).id = {'%s'};\n" %(sna_cnt+1,sna));
-                mat_script = mat_script + tmp_script;
-
-            # Add in ms data or Write ms data to separate file
-            for sna_cnt,sna in enumerate(snas):
-                tmp_script = ''
-                for i,fragment in enumerate(fragments):
-                    for j,time in enumerate(times):
-                        # Pad the data file:
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(sna_cnt+1,i+1,1,j+1,'NaN'));
-                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(sna_cnt+1,i+1,1,j+1,'NaN'));
-                        for ms_data in experimentalMS_data_I:
-                            if ms_data['fragment_id']==fragments[i] and \
-                                ms_data['time_point']==times[j] and \
-                                ms_data['sample_name_abbreviation'] == sna:
-                                if not ms_data['intensity_normalized_average']: continue; #measurements will need to be added/simulated later
-                                for cnt,intensity in enumerate(ms_data['intensity_normalized_average']):
-                                    # each column is a seperate time point
-                                    # each row is a seperate mdv
-                                    # Assign names and times
-                                    name = fragment + '_' + str(cnt) + '_' + str(j) + '_' + str(sna);
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.id(%d,%d) = {'%s'};\n" %(sna_cnt+1,i+1,1,j+1,name));
-                                    tmp_script = tmp_script + ("m.expts(%d).data_ms(%d).mdvs.time(%d,%d) = %s;\n" %(sna_cnt+1,i+1,1,j+1,time));
-                                    # Assign values
-                                    ave = ms_data['intensity_normalized_average'][cnt]
-                                    stdev = ms_data['intensity_normalized_stdev'][cnt]
-                                    # remove 0.0000 values and replace with NaN
-                                    if ave < 1e-6: 
-                                        ave = 'NaN';
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(sna_cnt+1,i+1,cnt+1,j+1,ave));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %f;\n' %(sna_cnt+1,i+1,cnt+1,j+1,ave));
-                                    if stdev < 1e-3:
-                                        # check if the ave is NaN
-                                        if ave=='NaN': stdev = 'NaN';
-                                        elif stdev == 0.0: stdev = 0.05;
-                                        else: stdev = 0.001;
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(sna_cnt+1,i+1,cnt+1,j+1,stdev));
-                                    else:
-                                        tmp_script = tmp_script + ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %f;\n' %(sna_cnt+1,i+1,cnt+1,j+1,stdev));
-                mat_script = mat_script + tmp_script;
-        return mat_script
+        ## write flux measurements
+        tmp_script = "f = data('";
+        for flux in experiment_data_I['fluxes']:
+            ## Temporary fix until reactions can be properly named
+            #tmp_script = tmp_script + rxn_ids_INCA[flux['rxn_id']] + " ";
+            tmp_script = tmp_script + flux['rxn_id'] + " ";
+        tmp_script = tmp_script[:-1]; #remove extra ,
+        yield tmp_script + "');\n";
+        if data_file_I:
+            yield ('f.val = inca_data.flx_val{%d};\n' %(experiment_cnt_I+1));
+            yield ('f.std = inca_data.flx_std{%d};\n' %(experiment_cnt_I+1));
+        else:
+            yield 'f.val = [...\n';
+            for flux in experiment_data_I['fluxes']:
+                yield str(flux['flux_average']) + ',...\n';
+            yield '];\n';
+            yield 'f.std = [...\n';
+            for flux in experiment_data_I['fluxes']:
+                yield str(flux['flux_stdev']) + ',...\n';
+            yield '];\n';
+
+        yield 'x = experiment(t);\n'
+        yield 'x.data_flx = f;\n'
+        yield 'x.data_ms = d;\n'
+        yield ('m.expts(%d) = x;\n' %(experiment_cnt_I+1));
+        yield ("m.expts(%d).id = {'%s'};\n" %(experiment_cnt_I+1,self._get_experimentName(experiment_I)));
+    def _iterScript_experimentMDVs_INCA(self, experiment_cnt_I, experiment_I, experiment_data_I, fragments_I, times_I, mdv_format_I='cell'):
+        '''Generate the MDVs of an experiment
+        INPUT:
+        experiment_cnt_I = int, index of the experiment
+        experiment_I = experiment (value of the parallel key)
+        experiment_data_I = {}, partition of the experiment (see _partition_experiments)
+        fragments_I = [], of all fragment_ids
+        times_I = [], of all time points
+        mdv_format_I = string, 'cell' or 'matrix' '''
+        experiment_name = self._get_experimentName(experiment_I);
+        for i,fragment in enumerate(fragments_I):
+            if mdv_format_I == 'matrix':
+                yield from self._iterScript_mdvMatrix_INCA(experiment_cnt_I,i,experiment_name,fragment,times_I,experiment_data_I['ms_data']);
+                continue;
+            for j,time in enumerate(times_I):
+                # Pad the data file:
+                yield ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(experiment_cnt_I+1,i+1,1,j+1,'NaN'));
+                yield ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(experiment_cnt_I+1,i+1,1,j+1,'NaN'));
+                for ms_data in experiment_data_I['ms_data'].get((fragment,time),[]):
+                    if not ms_data['intensity_normalized_average']: continue; #measurements will need to be added/simulated later
+                    for cnt,intensity in enumerate(ms_data['intensity_normalized_average']):
+                        # each column is a seperate time point
+                        # each row is a seperate mdv
+                        # Assign names and times
+                        name = fragment + '_' + str(cnt) + '_' + str(j) + '_' + experiment_name;
+                        yield ("m.expts(%d).data_ms(%d).mdvs.id(%d,%d) = {'%s'};\n" %(experiment_cnt_I+1,i+1,1,j+1,name));
+                        yield ("m.expts(%d).data_ms(%d).mdvs.time(%d,%d) = %s;\n" %(experiment_cnt_I+1,i+1,1,j+1,time));
+                        # Assign values
+                        ave = ms_data['intensity_normalized_average'][cnt]
+                        stdev = ms_data['intensity_normalized_stdev'][cnt]
+                        # remove 0.0000 values and replace with NaN
+                        if ave < 1e-6: 
+                            ave = 'NaN';
+                            yield ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %s;\n' %(experiment_cnt_I+1,i+1,cnt+1,j+1,ave));
+                        else:
+                            yield ('m.expts(%d).data_ms(%d).mdvs.val(%d,%d) = %f;\n' %(experiment_cnt_I+1,i+1,cnt+1,j+1,ave));
+                        if stdev < 1e-3:
+                            # check if the ave is NaN
+                            if ave=='NaN': stdev = 'NaN';
+                            elif stdev == 0.0: stdev = 0.05;
+                            else: stdev = 0.001;
+                            yield ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %s;\n' %(experiment_cnt_I+1,i+1,cnt+1,j+1,stdev));
+                        else:
+                            yield ('m.expts(%d).data_ms(%d).mdvs.std(%d,%d) = %f;\n' %(experiment_cnt_I+1,i+1,cnt+1,j+1,stdev));
+    def _iterScript_mdvMatrix_INCA(self, experiment_cnt_I, fragment_cnt_I, experiment_name_I, fragment_I, times_I, ms_data_I):
+        '''Generate the MDVs of a fragment as one matrix (val, std) or cell (id) literal per field
+        (see _make_mdvMatrix)
+        INPUT:
+        experiment_cnt_I = int, index of the experiment
+        fragment_cnt_I = int, index of the fragment
+        experiment_name_I = string, name of the experiment
+        fragment_I = string, fragment_id
+        times_I = [], of time points (columns)
+        ms_data_I = {}, (fragment_id, time_point): [] of MS data of the experiment'''
+        val,std,ids,time_values = self._make_mdvMatrix(experiment_name_I,fragment_I,times_I,ms_data_I);
+        yield ('m.expts(%d).data_ms(%d).mdvs.val = %s;\n' %(experiment_cnt_I+1,fragment_cnt_I+1,self._format_matrix(val)));
+        yield ('m.expts(%d).data_ms(%d).mdvs.std = %s;\n' %(experiment_cnt_I+1,fragment_cnt_I+1,self._format_matrix(std)));
+        if ids:
+            yield ("m.expts(%d).data_ms(%d).mdvs.id = {%s};\n" %(experiment_cnt_I+1,fragment_cnt_I+1,
+                ','.join(["'" + name + "'" if name is not None else '[]' for name in ids])));
+            yield ("m.expts(%d).data_ms(%d).mdvs.time = [%s];\n" %(experiment_cnt_I+1,fragment_cnt_I+1,
+                ','.join([str(time) if time is not None else '0' for time in time_values])));
+    def _make_mdvMatrix(self, experiment_name_I, fragment_I, times_I, ms_data_I):
+        '''Make the MDV matrices of a fragment
+        The matrices are the same as those built by the element-wise assignments of the 'cell' format:
+        row 1 is padded with NaN, MDV elements that are not measured at a time point are 0,
+        and id/time span the time points up to the last one with measurements
+        OUTPUT:
+        val_O = numpy array, MDV values (rows: MDV elements, columns: time points)
+        std_O = numpy array, MDV standard deviations
+        ids_O = [], of MDV ids (None for time points without measurements)
+        time_values_O = [], of time points (None for time points without measurements)'''
+        # collect the measured MDVs of each time point
+        mdvs = [];
+        nrows = 1;
+        for j,time in enumerate(times_I):
+            for ms_data in ms_data_I.get((fragment_I,time),[]):
+                if not ms_data['intensity_normalized_average']: continue; #measurements will need to be added/simulated later
+                mdvs.append((j,time,ms_data));
+                nrows = max(nrows,len(ms_data['intensity_normalized_average']));
+        val_O = numpy.zeros((nrows,len(times_I)));
+        std_O = numpy.zeros((nrows,len(times_I)));
+        # Pad the data file:
+        val_O[0,:] = numpy.nan;
+        std_O[0,:] = numpy.nan;
+        last = max([j for j,time,ms_data in mdvs]) + 1 if mdvs else 0;
+        ids_O = [None for j in range(last)];
+        time_values_O = [None for j in range(last)];
+        for j,time,ms_data in mdvs:
+            ave = numpy.array(ms_data['intensity_normalized_average'],dtype=numpy.float64);
+            stdev = numpy.array(ms_data['intensity_normalized_stdev'][:len(ave)],dtype=numpy.float64);
+            # remove 0.0000 values and replace with NaN
+            ave_nan = ave < 1e-6;
+            val_O[:len(ave),j] = numpy.where(ave_nan,numpy.nan,ave);
+            # replace small stdevs (NaN if the value is NaN)
+            std_O[:len(ave),j] = numpy.where(stdev < 1e-3,numpy.where(ave_nan,numpy.nan,numpy.where(stdev == 0.0,0.05,0.001)),stdev);
+            # Assign names and times
+            ids_O[j] = fragment_I + '_' + str(len(ave)-1) + '_' + str(j) + '_' + experiment_name_I;
+            time_values_O[j] = time;
+        return val_O,std_O,ids_O,time_values_O;
+    def _write_experimentData(self, data_file_I, experiments_I, experiments_data_I, fragments_I, times_I):
+        '''write the measurements of the experiments to a .mat file (loaded by the experiment script)
+        The file holds the cell arrays:
+        tracer_frac{experiment} = tracer fractions
+        flx_val{experiment}, flx_std{experiment} = measured flux averages and standard deviations
+        mdv_val{experiment,fragment}, mdv_std{experiment,fragment} = MDV matrices (see _make_mdvMatrix)
+        mdv_id{experiment,fragment}, mdv_time{experiment,fragment} = MDV ids and time points (empty without measurements)'''
+        data = {};
+        for name in ['tracer_frac','flx_val','flx_std']:
+            data[name] = numpy.empty((1,len(experiments_I)),dtype=object);
+        for name in ['mdv_val','mdv_std','mdv_id','mdv_time']:
+            data[name] = numpy.empty((len(experiments_I),len(fragments_I)),dtype=object);
+        for experiment_cnt,experiment in enumerate(experiments_I):
+            experiment_data = experiments_data_I[experiment];
+            data['tracer_frac'][0,experiment_cnt] = numpy.array([[float(tracer['ratio']) for tracer in experiment_data['tracers']]]);
+            data['flx_val'][0,experiment_cnt] = numpy.array([[float(flux['flux_average']) for flux in experiment_data['fluxes']]]);
+            data['flx_std'][0,experiment_cnt] = numpy.array([[float(flux['flux_stdev']) for flux in experiment_data['fluxes']]]);
+            for fragment_cnt,fragment in enumerate(fragments_I):
+                val,std,ids,time_values = self._make_mdvMatrix(self._get_experimentName(experiment),fragment,times_I,experiment_data['ms_data']);
+                data['mdv_val'][experiment_cnt,fragment_cnt] = val;
+                data['mdv_std'][experiment_cnt,fragment_cnt] = std;
+                mdv_id = numpy.empty((1,len(ids)),dtype=object);
+                for cnt,name in enumerate(ids):
+                    mdv_id[0,cnt] = name if name is not None else numpy.zeros((0,0));
+                data['mdv_id'][experiment_cnt,fragment_cnt] = mdv_id;
+                data['mdv_time'][experiment_cnt,fragment_cnt] = numpy.array([[float(time) if time is not None else 0.0 for time in time_values]]);
+        # write to a temporary file first so that the data file is replaced atomically
+        temporary = data_file_I + '.tmp';
+        with open(temporary,'wb') as f:
+            scipy.io.savemat(f,data);
+        os.replace(temporary,data_file_I);
+    def _format_matrix(self, matrix_I):
+        '''format a 2D numpy array as a matlab matrix literal (%f, as the element-wise assignments)'''
+        return '[' + ';'.join([','.join(['NaN' if isnan(v) else '%f' %(v) for v in row]) for row in matrix_I.tolist()]) + ']';
+    def _index_measuredFluxes(self, measuredFluxes_data_I, warn_I=False):
+        '''index the measured flux bounds by rxn_id in a single pass
+        (the bounds of the model are shared by all the experiments: a reaction measured in several
+        experiments is bounded by the envelope of its measurements, so that each measurement is feasible)
+        INPUT:
+        warn_I = boolean, print the reactions whose measured bounds differ between experiments
+        OUTPUT:
+        index_O = {}, rxn_id: {} of flux_lb (minimum) and flux_ub (maximum) of the measurements of the reaction'''
+        index_O = {};
+        conflicts = [];
+        for flux in measuredFluxes_data_I:
+            bounds = index_O.get(flux['rxn_id']);
+            if bounds is None:
+                index_O[flux['rxn_id']] = {'flux_lb':flux['flux_lb'],'flux_ub':flux['flux_ub']};
+            elif (bounds['flux_lb'],bounds['flux_ub']) != (flux['flux_lb'],flux['flux_ub']):
+                if not flux['rxn_id'] in conflicts:
+                    conflicts.append(flux['rxn_id']);
+                bounds['flux_lb'] = min(bounds['flux_lb'],flux['flux_lb']);
+                bounds['flux_ub'] = max(bounds['flux_ub'],flux['flux_ub']);
+        if warn_I:
+            for rxn_id in conflicts:
+                print('measured flux bounds of', rxn_id, 'differ between experiments; using [%s, %s]'
+                      %(index_O[rxn_id]['flux_lb'],index_O[rxn_id]['flux_ub']));
+        return index_O;
+    def _get_experimentKey(self, row_I, parallel_I):
+        '''return the experiment of a row (a tuple of values for a composite key)'''
+        if isinstance(parallel_I, (tuple, list)):
+            return tuple([row_I[key] for key in parallel_I]);
+        return row_I[parallel_I];
+    def _get_experimentName(self, experiment_I):
+        '''return the name of an experiment (the values of a composite key are joined by '_')'''
+        if isinstance(experiment_I, tuple):
+            return '_'.join([str(x) for x in experiment_I]);
+        return str(experiment_I);
+    def _partition_experiments(self, experimentalMS_data_I, measuredFluxes_data_I, tracer_I, parallel_I):
+        '''partition the MS data, measured fluxes, and tracers by experiment in a single pass over each input
+        INPUT:
+        parallel_I = string or tuple of strings, (composite) key of the parallel labeling experiments
+        OUTPUT:
+        experiments_O = {}, experiment: {'ms_data': {(fragment_id, time_point): [] of MS data in their original order},
+                                         'fragments': {fragment_id: first MS data of the fragment (defines the fragment)},
+                                         'fluxes': [] of measured fluxes in their original order,
+                                         'tracers': [] of tracers in their original order}
+        fragments_O = [], of sorted fragment_ids
+        times_O = [], of sorted time points'''
+        experiments_O = {};
+        def get_experiment(row):
+            experiment = self._get_experimentKey(row, parallel_I);
+            if not experiment in experiments_O:
+                experiments_O[experiment] = {'ms_data':{},'fragments':{},'fluxes':[],'tracers':[]};
+            return experiments_O[experiment];
+        fragments_O = set();
+        times_O = set();
+        for ms_data in experimentalMS_data_I:
+            experiment_data = get_experiment(ms_data);
+            experiment_data['ms_data'].setdefault((ms_data['fragment_id'],ms_data['time_point']),[]).append(ms_data);
+            if not ms_data['fragment_id'] in experiment_data['fragments']:
+                experiment_data['fragments'][ms_data['fragment_id']] = ms_data;
+            fragments_O.add(ms_data['fragment_id']);
+            times_O.add(ms_data['time_point']);
+        for flux in measuredFluxes_data_I:
+            get_experiment(flux)['fluxes'].append(flux);
+        for tracer in tracer_I:
+            get_experiment(tracer)['tracers'].append(tracer);
+        return experiments_O,sorted(fragments_O),sorted(times_O);
+    def _write_scriptChunks(self, chunks_I, file_I=None):
+        '''join the chunks of a matlab script into a string or stream them to a file
+        INPUT:
+        chunks_I = iterable of strings
+        file_I = optional file-like object (with a write method) or filename
+        OUTPUT:
+        mat_script = string, matlab script (None if the chunks were written to file_I)'''
+        if file_I is None:
+            return ''.join(chunks_I);
+        if isinstance(file_I, str):
+            with open(file_I, 'w') as f:
+                for chunk in chunks_I:
+                    f.write(chunk);
+        else:
+            for chunk in chunks_I:
+                file_I.write(chunk);
     def writeScript_experimentFromMSData_INCA(self, modelReaction_data_I,modelMetabolite_data_I,
                                         measuredFluxes_data_I,experimentalMS_data_I,tracer_I,
                                         experiment_index_I=1,experiment_name_I=None):
@@ -830,8 +879,10 @@ class inca_api():
         mat_script += "end\n"
 
         return mat_script
-    def writeScript_simulationOptions_Inca(self,stationary_I=True):
-        '''Generate parameters for isotopomer simulation for INCA1.1'''
+    def writeScript_simulationOptions_Inca(self,stationary_I=True,fit_starts_I=10):
+        '''Generate parameters for isotopomer simulation for INCA1.1
+        INPUT:
+        fit_starts_I = int, number of restarts during the estimation procedure'''
 
         # Specify simulation parameters (non-stationary only!)
         '''% simulate MS measurements
@@ -844,14 +895,86 @@ class inca_api():
         m.options.sim_sens = true;'''
 
         mat_script = ''
-        mat_script += 'm.options.fit_starts = 10;\n' #10 restarts during the estimation procedure
+        mat_script += 'm.options.fit_starts = %d;\n' %(fit_starts_I) #restarts during the estimation procedure
+
+        return mat_script
+    def writeScript_parameterEstimation_Inca(self,restarts_I=10,seed_I=None):
+        '''Run parameter estimations INCA1.1
+        INPUT:
+        restarts_I = int, number of restarts
+        seed_I = optional int, seed of the random number generator (set before the estimation)'''
+
+        mat_script = ''
+        if seed_I is not None:
+            mat_script += "rng(%d);\n" %(seed_I)
+        mat_script += "f=estimate(m,%d);\n" %(restarts_I)
 
         return mat_script
-    def writeScript_parameterEstimation_Inca(self):
-        '''Run parameter estimations INCA1.1'''
+    def writeScripts_parameterEstimationArray_Inca(self,model_file_I,n_jobs_I,n_restarts_I=200,seed_I=1,
+                                                   result_prefix_I='estimate',directory_I=None):
+        '''Split a multi-start parameter estimation into independent scripts (e.g., the tasks of an HPC job array)
+        INPUT:
+        model_file_I = string, name of the .mat file with the model (m) shared by the jobs
+            (e.g., saved with save('model.mat','m') after running the experiment script)
+        n_jobs_I = int, number of estimation scripts
+        n_restarts_I = int, total number of restarts (split as evenly as possible over the jobs)
+        seed_I = int, seed of the random number generator of the first job (job i uses seed_I + i - 1)
+        result_prefix_I = string, prefix of the script and result files: job i writes
+            [result_prefix_I]_[i].m, which saves m and f to [result_prefix_I]_[i].mat,
+            and [result_prefix_I]_collect.m saves the fit with the lowest chi2 to [result_prefix_I]_best.mat
+            (the partial results can also be merged with inca_i.import_isotopomerSimulationResults_best)
+        directory_I = optional string, directory the scripts are written to (created if needed)
+        OUTPUT:
+        scripts_O = {}, name of the script file: matlab script
+            (the estimation scripts in the order of the jobs, followed by the collection script)'''
+        if n_jobs_I < 1 or n_restarts_I < n_jobs_I:
+            raise ValueError('n_restarts_I must be at least n_jobs_I (and n_jobs_I at least 1)');
+        scripts_O = {};
+        results = [];
+        for job in range(n_jobs_I):
+            restarts = n_restarts_I//n_jobs_I + (1 if job < n_restarts_I%n_jobs_I else 0);
+            result_file = '%s_%d.mat' %(result_prefix_I,job+1);
+            mat_script = 'clear functions\n';
+            mat_script += "load('%s','m');\n" %(model_file_I);
+            mat_script += self.writeScript_simulationOptions_Inca(fit_starts_I=restarts);
+            mat_script += self.writeScript_parameterEstimation_Inca(restarts_I=restarts,seed_I=seed_I+job);
+            mat_script += "save('%s','m','f');\n" %(result_file);
+            scripts_O['%s_%d.m' %(result_prefix_I,job+1)] = mat_script;
+            results.append(result_file);
+        scripts_O['%s_collect.m' %(result_prefix_I)] = self.writeScript_collectParameterEstimation_Inca(
+            results,'%s_best.mat' %(result_prefix_I));
+        if directory_I:
+            if not os.path.isdir(directory_I):
+                os.makedirs(directory_I);
+            for filename,mat_script in scripts_O.items():
+                self._write_scriptChunks([mat_script],os.path.join(directory_I,filename));
+        return scripts_O;
+    def writeScript_collectParameterEstimation_Inca(self,result_files_I,best_file_I):
+        '''Select the parameter estimation with the lowest chi2 among the results of several jobs
+        (missing result files, e.g., of failed jobs, are skipped)
+        INPUT:
+        result_files_I = [], names of the .mat files with the m and f of each job
+        best_file_I = string, name of the .mat file the best m and f are saved to'''
 
         mat_script = ''
-        mat_script += "f=estimate(m,10);\n" #10 restarts
+        mat_script += 'clear functions\n'
+        mat_script += 'files = {%s};\n' %(','.join(["'%s'" %(filename) for filename in result_files_I]))
+        mat_script += 'best_chi2 = Inf;\n'
+        mat_script += "best_file = '';\n"
+        mat_script += 'for i = 1:length(files)\n'
+        mat_script += "\tif exist(files{i},'file')\n"
+        mat_script += "\t\tresult = load(files{i},'f');\n"
+        mat_script += '\t\tif result.f.chi2 < best_chi2\n'
+        mat_script += '\t\t\tbest_chi2 = result.f.chi2;\n'
+        mat_script += '\t\t\tbest_file = files{i};\n'
+        mat_script += '\t\tend\n'
+        mat_script += '\tend\n'
+        mat_script += 'end\n'
+        mat_script += "if isempty(best_file)\n"
+        mat_script += "\terror('no parameter estimation results were found');\n"
+        mat_script += 'end\n'
+        mat_script += "load(best_file,'m','f');\n"
+        mat_script += "save('%s','m','f');\n" %(best_file_I)
 
         return mat_script
     def writeScript_parameterContinuation_Inca(self):
@@ -876,12 +999,119 @@ class inca_api():
                                         products_positions_tracked_I = [[]],
                                         reactants_mapping_I = [],
                                         products_mapping_I = []):
-        '''Generate string represention of reactions equations for INCA1.1'''
+        '''Generate string represention of reactions equations for INCA1.1
+        (see make_isotopomerRxnEquations_batch to generate the equations of many reactions)'''
 
         #e.g. A (AabB) + H (c) -> B (AbBc) + H (a)
         #e.g. A (C1:A C2:B H1R:a H1S:b) + H (H1:c) -> B (C1:A C2:B H1:a H2:c) + H (H1:a)
 
-        rxn_equations_INCA = '';
+        return self._make_isotopomerRxnEquation(reactants_ids_I,products_ids_I,
+                                        reactants_stoichiometry_I,products_stoichiometry_I,reversibility_I,
+                                        reactants_stoichiometry_tracked_I,products_stoichiometry_tracked_I,
+                                        reactants_ids_tracked_I,products_ids_tracked_I,
+                                        reactants_elements_tracked_I,products_elements_tracked_I,
+                                        reactants_positions_tracked_I,products_positions_tracked_I,
+                                        reactants_mapping_I,products_mapping_I);
+    def make_isotopomerRxnEquations_batch(self, rxns_I, memoize_I=False, n_workers_I=1, chunk_size_I=None, min_parallel_I=1000):
+        '''Generate the string representions of the reaction equations of many reactions for INCA1.1
+        INPUT:
+        rxns_I = [], of {} with the arguments of make_isotopomerRxnEquations_INCA without the _I suffix
+            (e.g., reactants_ids, products_ids, reactants_stoichiometry, ..., reactants_mapping, products_mapping;
+            missing arguments take their default values; the entries of reactants_mapping/products_mapping
+            may be inca_atomMapping, in which case the elements and positions are taken from the mapping)
+        memoize_I = boolean, generate the equation of identical reaction definitions only once
+            (repeated definition objects are recognized by their id; other definitions are compared
+            by the repr of their arguments if they have the same reactants and products)
+        n_workers_I = int, number of worker processes
+            (default 1: the equations are generated in the current process; None: number of cpus)
+        chunk_size_I = int, number of reactions sent to a worker at a time
+            (default: about 4 chunks per worker)
+        min_parallel_I = int, models with fewer reactions are generated in the current process
+            (starting the pool would take longer than generating the equations)
+        OUTPUT:
+        rxn_equations_O = [], of reaction equations in the order of rxns_I
+            (identical to calling make_isotopomerRxnEquations_INCA for each reaction)'''
+        rxns_I = list(rxns_I);
+        if n_workers_I != 1 and len(rxns_I) >= min_parallel_I:
+            n_workers = n_workers_I or os.cpu_count() or 1;
+            chunk_size = chunk_size_I or -(-len(rxns_I)//(4*n_workers));
+            chunks = [rxns_I[start:start+chunk_size] for start in range(0,len(rxns_I),chunk_size)];
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                # map returns the chunks in order (independent of the order in which the workers complete)
+                rxn_equations = executor.map(_make_isotopomerRxnEquations_chunk, chunks, [memoize_I]*len(chunks));
+                return [rxn_equation for chunk in rxn_equations for rxn_equation in chunk];
+        mappings = {}; # parsed atom mappings shared by all reactions
+        equations_ids = {}; # memoized equations by id of the reaction definition (rxns_I keeps the objects alive)
+        equations_firsts = {}; # (arguments, equation) of the first definition of each reactants and products
+        equations = {}; # memoized equations by the repr of their arguments
+        rxn_equations_O = [];
+        for rxn in rxns_I:
+            if memoize_I and id(rxn) in equations_ids:
+                rxn_equations_O.append(equations_ids[id(rxn)]);
+                continue;
+            arguments = [rxn.get(name,default) for name,default in self._rxnEquation_arguments];
+            key = None;
+            if memoize_I:
+                # definitions are only compared (by repr, which distinguishes 1, 1.0, and True, which are
+                # formatted differently) if they have the same reactants and products: building the key of
+                # every definition would take longer than generating the equations
+                bucket = (tuple(arguments[0]),tuple(arguments[1]));
+                first = equations_firsts.get(bucket);
+                if first is not None:
+                    if first[0] is not None:
+                        # the definitions of the bucket are compared by repr from now on
+                        equations[repr(first[0])] = first[1];
+                        equations_firsts[bucket] = (None,None);
+                    key = repr(arguments);
+                    rxn_equation = equations.get(key);
+                    if rxn_equation is not None:
+                        equations_ids[id(rxn)] = rxn_equation;
+                        rxn_equations_O.append(rxn_equation);
+                        continue;
+            rxn_equation = self._make_isotopomerRxnEquation(*arguments, mappings_I=mappings);
+            if memoize_I:
+                equations_ids[id(rxn)] = rxn_equation;
+                if key is None:
+                    equations_firsts[bucket] = (arguments,rxn_equation);
+                else:
+                    equations[key] = rxn_equation;
+            rxn_equations_O.append(rxn_equation);
+        return rxn_equations_O;
+    # argument names (without the _I suffix) and defaults of make_isotopomerRxnEquations_INCA
+    _rxnEquation_arguments = [('reactants_ids',[]),('products_ids',[]),
+        ('reactants_stoichiometry',[]),('products_stoichiometry',[]),('reversibility',True),
+        ('reactants_stoichiometry_tracked',[]),('products_stoichiometry_tracked',[]),
+        ('reactants_ids_tracked',[]),('products_ids_tracked',[]),
+        ('reactants_elements_tracked',[[]]),('products_elements_tracked',[[]]),
+        ('reactants_positions_tracked',[[]]),('products_positions_tracked',[[]]),
+        ('reactants_mapping',[]),('products_mapping',[])];
+    def _parse_mapping(self, mapping_I, mappings_I=None):
+        '''parse an atom mapping ('[a][b][c]' or 'abc') into the list of mapped atoms
+        INPUT:
+        mappings_I = optional {}, cache of parsed mappings'''
+        if mappings_I is not None and isinstance(mapping_I, str):
+            mapping = mappings_I.get(mapping_I);
+            if mapping is not None:
+                return mapping;
+        if '[' in mapping_I:
+            mapping = mapping_I.split('][');
+            mapping = [m.replace('[','').replace(']','') for m in mapping];
+        else:
+            mapping = list(mapping_I);
+        if mappings_I is not None and isinstance(mapping_I, str):
+            mappings_I[mapping_I] = mapping;
+        return mapping;
+    def _make_isotopomerRxnEquation(self,reactants_ids_I,products_ids_I,
+                                        reactants_stoichiometry_I,products_stoichiometry_I,reversibility_I,
+                                        reactants_stoichiometry_tracked_I,products_stoichiometry_tracked_I,
+                                        reactants_ids_tracked_I,products_ids_tracked_I,
+                                        reactants_elements_tracked_I,products_elements_tracked_I,
+                                        reactants_positions_tracked_I,products_positions_tracked_I,
+                                        reactants_mapping_I,products_mapping_I,mappings_I=None):
+        '''Generate the string represention of a reaction equation for INCA1.1
+        (see make_isotopomerRxnEquations_INCA)
+        INPUT:
+        mappings_I = optional {}, cache of parsed atom mappings'''
 
         #add balance dummy metabolite for an exchange reaction
         if len(reactants_ids_I)==0 and len(products_ids_I)==1:
@@ -907,159 +1137,112 @@ class inca_api():
         pseudo_mets = [];
 
         #build the string for the reactants
-        for reactant_cnt,reactant in enumerate(reactants_ids_I):
-            reactants_stoichiometry = abs(reactants_stoichiometry_I[reactant_cnt]);
-            if reactant in reactants_ids_tracked_I:
-                for reactant_tracked_cnt, reactant_tracked in enumerate(reactants_ids_tracked_I):
-                    if reactant_tracked == reactant and \
-                        reactants_stoichiometry == abs(reactants_stoichiometry_tracked_I[reactant_tracked_cnt]):
-                        # if the tracked reactant matches and the stoichiometry aggrees, 
-                        # combine the information for the tracked_reactant and the reactant
-                        #rxn_equations_INCA += ('%f' % reactants_stoichiometry) + '*' + reactant + ' ';
-                        rxn_equations_INCA += str(reactants_stoichiometry) + '*' + reactant + ' ';
-                        rxn_equations_INCA += '(';
-                        if reactants_mapping_I[reactant_tracked_cnt]:
-                            reactants_mapping = reactants_mapping_I[reactant_tracked_cnt];
-                            if '[' in reactants_mapping_I[reactant_tracked_cnt]:
-                                reactants_mapping = reactants_mapping_I[reactant_tracked_cnt].split('][');
-                                reactants_mapping = [m.replace('[','') for m in reactants_mapping];
-                                reactants_mapping = [m.replace(']','') for m in reactants_mapping];
-                            for mapping_cnt, mapping in enumerate(reactants_mapping):
-                                rxn_equations_INCA += reactants_elements_tracked_I[reactant_tracked_cnt][mapping_cnt] + \
-                                    str(reactants_positions_tracked_I[reactant_tracked_cnt][mapping_cnt]+1) + \
-                                    ':' + mapping + ' ';
-                            rxn_equations_INCA = rxn_equations_INCA[:-1];
-                            rxn_equations_INCA += ') ';
-                            rxn_equations_INCA += '+ ';
-                            reactants_stoichiometry -= abs(reactants_stoichiometry_tracked_I[reactant_tracked_cnt]); # subtract out the stoichiometry of the tracked reactant from the reactant
-                    elif reactant_tracked == reactant and \
-                        reactants_stoichiometry > abs(reactants_stoichiometry_tracked_I[reactant_tracked_cnt]):
-                        # if the tracked reactant matches and the stoichiometry of the reactant is greater than the tracked_reactant, 
-                        # combine the information for the tracked_reactant and the reactant after substracking out the stoichiometry of the tracked_reactant
-                        rxn_equations_INCA += str(abs(reactants_stoichiometry_tracked_I[reactant_tracked_cnt])) + '*' + reactant + ' ';
-                        rxn_equations_INCA += '(';
-                        if reactants_mapping_I[reactant_tracked_cnt]:
-                            reactants_mapping = reactants_mapping_I[reactant_tracked_cnt];
-                            if '[' in reactants_mapping_I[reactant_tracked_cnt]:
-                                reactants_mapping = reactants_mapping_I[reactant_tracked_cnt].split('][');
-                                reactants_mapping = [m.replace('[','') for m in reactants_mapping];
-                                reactants_mapping = [m.replace(']','') for m in reactants_mapping];
-                            for mapping_cnt, mapping in enumerate(reactants_mapping):
-                                rxn_equations_INCA += reactants_elements_tracked_I[reactant_tracked_cnt][mapping_cnt] + \
-                                    str(reactants_positions_tracked_I[reactant_tracked_cnt][mapping_cnt]+1) + \
-                                    ':' + mapping + ' ';
-                            rxn_equations_INCA = rxn_equations_INCA[:-1];
-                            rxn_equations_INCA += ') ';
-                            rxn_equations_INCA += '+ ';
-                            reactants_stoichiometry -= abs(reactants_stoichiometry_tracked_I[reactant_tracked_cnt]) # subtract out the stoichiometry of the tracked reactant from the reactant and continue
-                    elif not reactant_tracked in reactants_ids_I:
-                        print('unaccounted for reactant_tracked: ' + reactant_tracked);
-                        if reactants_stoichiometry_tracked_I[reactant_tracked_cnt]==-1e-13 and not reactant_tracked in pseudo_mets:
-                            #add in the pseudo-metabolite used to complete the atom mapping
-                            rxn_equations_INCA += '0.0000000000001' + '*' + reactant_tracked + ' ';
-                            rxn_equations_INCA += '(';
-                            if reactants_mapping_I[reactant_tracked_cnt]:
-                                reactants_mapping = reactants_mapping_I[reactant_tracked_cnt];
-                                if '[' in reactants_mapping_I[reactant_tracked_cnt]:
-                                    reactants_mapping = reactants_mapping_I[reactant_tracked_cnt].split('][');
-                                    reactants_mapping = [m.replace('[','') for m in reactants_mapping];
-                                    reactants_mapping = [m.replace(']','') for m in reactants_mapping];
-                                for mapping_cnt, mapping in enumerate(reactants_mapping):
-                                    rxn_equations_INCA += reactants_elements_tracked_I[reactant_tracked_cnt][mapping_cnt] + \
-                                        str(reactants_positions_tracked_I[reactant_tracked_cnt][mapping_cnt]+1) + \
-                                        ':' + mapping + ' ';
-                                rxn_equations_INCA = rxn_equations_INCA[:-1];
-                                rxn_equations_INCA += ') ';
-                                rxn_equations_INCA += '+ ';
-                                pseudo_mets.append(reactant_tracked); # only 1 unique pseudo_met per reaction
-                if reactants_stoichiometry>0.0: # check if there is a remainder of the reactant stoichiometry that has not yet been accounted for
-                                                # after iterating through all reactants
-                                                # if so, the molecule is not tracked
-                    rxn_equations_INCA += str(reactants_stoichiometry) + '*' + reactant + ' ';
-                    rxn_equations_INCA += '+ ';
-            else:
-                rxn_equations_INCA += str(reactants_stoichiometry) + '*' + reactant + ' ';
-                rxn_equations_INCA += '+ ';
+        rxn_equations_INCA = self._make_isotopomerRxnEquationSide(reactants_ids_I,reactants_stoichiometry_I,
+                                        reactants_ids_tracked_I,reactants_stoichiometry_tracked_I,
+                                        reactants_elements_tracked_I,reactants_positions_tracked_I,reactants_mapping_I,
+                                        pseudo_mets,'reactant',mappings_I);
         rxn_equations_INCA = rxn_equations_INCA[:-2];
         if reversibility_I:
             rxn_equations_INCA += '<->  ';
         else:
             rxn_equations_INCA += '->  ';
         #build the string for the products
-        for product_cnt,product in enumerate(products_ids_I):
-            if product_cnt == 0: rxn_equations_INCA = rxn_equations_INCA[:-1];
-            #rxn_equations_INCA += str(abs(reactants_stoichiometry_I[product_cnt])) + '*' + product + ' ';
-            products_stoichiometry = abs(products_stoichiometry_I[product_cnt]);
-            if product in products_ids_tracked_I:
-                for product_tracked_cnt, product_tracked in enumerate(products_ids_tracked_I):
-                    if product_tracked == product and \
-                        products_stoichiometry == abs(products_stoichiometry_tracked_I[product_tracked_cnt]):
-                        # if the tracked product matches and the stoichiometry aggrees, 
-                        # combine the information for the tracked_product and the product
-                        rxn_equations_INCA += str(products_stoichiometry) + '*' + product + ' ';
-                        rxn_equations_INCA += '(';
-                        if products_mapping_I[product_tracked_cnt]:
-                            products_mapping = products_mapping_I[product_tracked_cnt];
-                            if '[' in products_mapping_I[product_tracked_cnt]:
-                                products_mapping = products_mapping_I[product_tracked_cnt].split('][');
-                                products_mapping = [m.replace('[','') for m in products_mapping];
-                                products_mapping = [m.replace(']','') for m in products_mapping];
-                            for mapping_cnt, mapping in enumerate(products_mapping):
-                                rxn_equations_INCA += products_elements_tracked_I[product_tracked_cnt][mapping_cnt] + \
-                                    str(products_positions_tracked_I[product_tracked_cnt][mapping_cnt]+1) + \
-                                    ':' + mapping + ' ';
-                            rxn_equations_INCA = rxn_equations_INCA[:-1];
-                            rxn_equations_INCA += ') ';
-                            rxn_equations_INCA += '+ ';
-                            products_stoichiometry -= abs(products_stoichiometry_tracked_I[product_tracked_cnt]);
-                    elif product_tracked == product and \
-                        products_stoichiometry > abs(products_stoichiometry_tracked_I[product_tracked_cnt]):
-                        # if the tracked product matches and the stoichiometry of the product is greater than the tracked_product, 
-                        # combine the information for the tracked_product and the product after substracking out the stoichiometry of the tracked_product
-                        rxn_equations_INCA += str(products_stoichiometry_tracked_I[product_tracked_cnt]) + '*' + product + ' ';
-                        rxn_equations_INCA += '(';
-                        if products_mapping_I[product_tracked_cnt]:
-                            products_mapping = products_mapping_I[product_tracked_cnt];
-                            if '[' in products_mapping_I[product_tracked_cnt]:
-                                products_mapping = products_mapping_I[product_tracked_cnt].split('][');
-                                products_mapping = [m.replace('[','') for m in products_mapping];
-                                products_mapping = [m.replace(']','') for m in products_mapping];
-                            for mapping_cnt, mapping in enumerate(products_mapping):
-                                rxn_equations_INCA += products_elements_tracked_I[product_tracked_cnt][mapping_cnt] + \
-                                    str(products_positions_tracked_I[product_tracked_cnt][mapping_cnt]+1) + \
-                                    ':' + mapping + ' ';
-                            rxn_equations_INCA = rxn_equations_INCA[:-1];
-                            rxn_equations_INCA += ') ';
-                            rxn_equations_INCA += '+ ';
-                            products_stoichiometry -= abs(products_stoichiometry_tracked_I[product_tracked_cnt])
-                    elif not product_tracked in products_ids_I:
-                        print('unaccounted for product_tracked: ' + product_tracked);
-                        if '.balance' in product_tracked and not product_tracked in pseudo_mets:
-                            #add in the pseudo-metabolite used to complete the atom mapping
-                            rxn_equations_INCA += str(products_stoichiometry_tracked_I[product_tracked_cnt]) + '*' + product_tracked + ' ';
-                            rxn_equations_INCA += '(';
-                            if products_mapping_I[product_tracked_cnt]:
-                                products_mapping = products_mapping_I[product_tracked_cnt];
-                                if '[' in products_mapping_I[product_tracked_cnt]:
-                                    products_mapping = products_mapping_I[product_tracked_cnt].split('][');
-                                    products_mapping = [m.replace('[','') for m in products_mapping];
-                                    products_mapping = [m.replace(']','') for m in products_mapping];
-                                for mapping_cnt, mapping in enumerate(products_mapping):
-                                    rxn_equations_INCA += products_elements_tracked_I[product_tracked_cnt][mapping_cnt] + \
-                                        str(products_positions_tracked_I[product_tracked_cnt][mapping_cnt]+1) + \
-                                        ':' + mapping + ' ';
-                                rxn_equations_INCA = rxn_equations_INCA[:-1];
-                                rxn_equations_INCA += ') ';
-                                rxn_equations_INCA += '+ ';
-                                pseudo_mets.append(product_tracked); # only 1 unique pseudo_met per reaction
-                if products_stoichiometry>0.0:
-                    rxn_equations_INCA += str(products_stoichiometry) + '*' + product + ' ';
-                    rxn_equations_INCA += '+ ';
-            else:
-                rxn_equations_INCA += str(products_stoichiometry) + '*' + product + ' ';
-                rxn_equations_INCA += '+ ';
+        if products_ids_I:
+            rxn_equations_INCA = rxn_equations_INCA[:-1];
+            rxn_equations_INCA += self._make_isotopomerRxnEquationSide(products_ids_I,products_stoichiometry_I,
+                                        products_ids_tracked_I,products_stoichiometry_tracked_I,
+                                        products_elements_tracked_I,products_positions_tracked_I,products_mapping_I,
+                                        pseudo_mets,'product',mappings_I);
         rxn_equations_INCA = rxn_equations_INCA[:-2];
 
         #add in unbalanced metabolites to the products
 
-        return rxn_equations_INCA;
\ No newline at end of file
+        return rxn_equations_INCA;
+    def _make_isotopomerRxnEquationSide(self,ids_I,stoichiometry_I,ids_tracked_I,stoichiometry_tracked_I,
+                                        elements_tracked_I,positions_tracked_I,mapping_I,pseudo_mets_I,side_I,mappings_I=None):
+        '''Generate the string represention of the reactants or products of a reaction equation
+        INPUT:
+        side_I = string, 'reactant' or 'product'
+        pseudo_mets_I = [], of pseudo metabolites already added to the reaction (updated)
+        OUTPUT:
+        rxn_equations_INCA = string, terms of the side joined by '+ ' (with a trailing '+ ')'''
+
+        # index the tracked species by id, and find the tracked species that are not reactants/products
+        # (visited in the order of the tracked species, as pseudo metabolites, for each tracked reactant/product)
+        ids = set(ids_I);
+        tracked = {};
+        unaccounted = [];
+        for cnt,met_tracked in enumerate(ids_tracked_I):
+            if met_tracked in ids:
+                tracked.setdefault(met_tracked,[]).append(cnt);
+            else:
+                unaccounted.append(cnt);
+        if unaccounted:
+            for met in tracked.keys():
+                tracked[met] = sorted(tracked[met] + unaccounted);
+
+        rxn_equations_INCA = '';
+        for met_cnt,met in enumerate(ids_I):
+            stoichiometry = abs(stoichiometry_I[met_cnt]);
+            if met in tracked:
+                for tracked_cnt in tracked[met]:
+                    met_tracked = ids_tracked_I[tracked_cnt];
+                    if met_tracked == met and \
+                        stoichiometry == abs(stoichiometry_tracked_I[tracked_cnt]):
+                        # if the tracked species matches and the stoichiometry aggrees, 
+                        # combine the information for the tracked species and the species
+                        rxn_equations_INCA += str(stoichiometry) + '*' + met + ' (';
+                        mapping = self._get_isotopomerRxnEquationMapping(elements_tracked_I,positions_tracked_I,mapping_I,tracked_cnt,mappings_I);
+                        if mapping:
+                            rxn_equations_INCA += mapping;
+                            stoichiometry -= abs(stoichiometry_tracked_I[tracked_cnt]); # subtract out the stoichiometry of the tracked species from the species
+                    elif met_tracked == met and \
+                        stoichiometry > abs(stoichiometry_tracked_I[tracked_cnt]):
+                        # if the tracked species matches and the stoichiometry of the species is greater than the tracked species, 
+                        # combine the information for the tracked species and the species after substracking out the stoichiometry of the tracked species
+                        if side_I == 'reactant':
+                            rxn_equations_INCA += str(abs(stoichiometry_tracked_I[tracked_cnt])) + '*' + met + ' (';
+                        else:
+                            rxn_equations_INCA += str(stoichiometry_tracked_I[tracked_cnt]) + '*' + met + ' (';
+                        mapping = self._get_isotopomerRxnEquationMapping(elements_tracked_I,positions_tracked_I,mapping_I,tracked_cnt,mappings_I);
+                        if mapping:
+                            rxn_equations_INCA += mapping;
+                            stoichiometry -= abs(stoichiometry_tracked_I[tracked_cnt]); # subtract out the stoichiometry of the tracked species and continue
+                    elif met_tracked != met:
+                        print('unaccounted for ' + side_I + '_tracked: ' + met_tracked);
+                        if side_I == 'reactant':
+                            pseudo_met = stoichiometry_tracked_I[tracked_cnt]==-1e-13;
+                            coefficient = '0.0000000000001';
+                        else:
+                            pseudo_met = '.balance' in met_tracked;
+                            coefficient = str(stoichiometry_tracked_I[tracked_cnt]);
+                        if pseudo_met and not met_tracked in pseudo_mets_I:
+                            #add in the pseudo-metabolite used to complete the atom mapping
+                            rxn_equations_INCA += coefficient + '*' + met_tracked + ' (';
+                            mapping = self._get_isotopomerRxnEquationMapping(elements_tracked_I,positions_tracked_I,mapping_I,tracked_cnt,mappings_I);
+                            if mapping:
+                                rxn_equations_INCA += mapping;
+                                pseudo_mets_I.append(met_tracked); # only 1 unique pseudo_met per reaction
+                if stoichiometry>0.0: # check if there is a remainder of the stoichiometry that has not yet been accounted for
+                                      # after iterating through all tracked species
+                                      # if so, the molecule is not tracked
+                    rxn_equations_INCA += str(stoichiometry) + '*' + met + ' + ';
+            else:
+                rxn_equations_INCA += str(stoichiometry) + '*' + met + ' + ';
+        return rxn_equations_INCA;
+    def _get_isotopomerRxnEquationMapping(self,elements_tracked_I,positions_tracked_I,mapping_I,tracked_cnt_I,mappings_I=None):
+        '''Generate the atom mapping of a tracked species (e.g., 'C1:a C2:b) + ')
+        from the elements, positions, and mapping string, or from an inca_atomMapping
+        OUTPUT:
+        mapping_O = string ('' if the tracked species is not mapped)'''
+        mapping = mapping_I[tracked_cnt_I];
+        if isinstance(mapping, inca_atomMapping):
+            if mapping.labels is None: return '';
+            return mapping.to_INCA() + ') + ';
+        if not mapping: return '';
+        return self._make_isotopomerRxnEquationMapping(elements_tracked_I[tracked_cnt_I],
+            positions_tracked_I[tracked_cnt_I],self._parse_mapping(mapping,mappings_I));
+    def _make_isotopomerRxnEquationMapping(self,elements_I,positions_I,mapping_I):
+        '''Generate the atom mapping of a tracked species (e.g., 'C1:a C2:b) + ')'''
+        return ' '.join([elements_I[mapping_cnt] + str(positions_I[mapping_cnt]+1) + ':' + mapping
+                         for mapping_cnt,mapping in enumerate(mapping_I)]) + ') + ';
\ No newline at end of file
@@ -0,0 +1,179 @@
+# System
+# Dependencies from 3rd party
+import numpy
+
+class inca_symbolTable():
+    '''interned table of the symbols of atom mappings (element symbols and mapping labels)
+    Each symbol is stored once and referenced by an int32 code'''
+    __slots__ = ('symbols','codes');
+    def __init__(self):
+        self.symbols = []; # code: symbol
+        self.codes = {}; # symbol: code
+    def __len__(self):
+        return len(self.symbols);
+    def get_code(self, symbol_I):
+        '''return the code of a symbol (adding the symbol if needed)'''
+        code = self.codes.get(symbol_I);
+        if code is None:
+            code = len(self.symbols);
+            self.codes[symbol_I] = code;
+            self.symbols.append(symbol_I);
+        return code;
+    def get_codes(self, symbols_I):
+        '''return the codes of a list of symbols as an int32 array'''
+        return numpy.array([self.get_code(s) for s in symbols_I], dtype=numpy.int32);
+    def get_symbols(self, codes_I):
+        '''return the symbols of an array of codes'''
+        symbols = self.symbols;
+        return [symbols[code] for code in codes_I.tolist()];
+class inca_atomMapping():
+    '''atom mapping of a tracked species
+    elements = int32 array, codes of the element of each atom
+    positions = int32 array, (0-based) position of each atom
+    labels = int32 array, codes of the label each atom is mapped to (None if the atoms are not mapped)
+    symbols = inca_symbolTable of the codes
+    INCA syntax: 'C1:a C2:b' (to_INCA) or 'C1 C2' (to_atoms)'''
+    __slots__ = ('elements','positions','labels','symbols');
+    def __init__(self, elements_I, positions_I, labels_I=None, symbols_I=None):
+        self.elements = elements_I;
+        self.positions = positions_I;
+        self.labels = labels_I;
+        self.symbols = symbols_I;
+    def __len__(self):
+        return len(self.positions);
+    def __eq__(self, other_I):
+        if not isinstance(other_I, inca_atomMapping):
+            return NotImplemented;
+        return self.to_INCA() == other_I.to_INCA();
+    def __hash__(self):
+        return hash(self.to_INCA());
+    def __repr__(self):
+        return "inca_atomMapping('" + self.to_INCA() + "')";
+    def get_elements(self):
+        '''return the elements of the atoms'''
+        return self.symbols.get_symbols(self.elements);
+    def get_positions(self):
+        '''return the (0-based) positions of the atoms'''
+        return self.positions.tolist();
+    def get_labels(self):
+        '''return the labels of the atoms (None if the atoms are not mapped)'''
+        if self.labels is None: return None;
+        return self.symbols.get_symbols(self.labels);
+    def to_atoms(self):
+        '''return the atoms in INCA syntax (e.g., 'C1 C2 C3')'''
+        symbols = self.symbols.symbols;
+        return ' '.join([symbols[element] + str(position+1)
+                         for element,position in zip(self.elements.tolist(),self.positions.tolist())]);
+    def to_INCA(self):
+        '''return the atom mapping in INCA syntax (e.g., 'C1:a C2:b C3:c')'''
+        if self.labels is None:
+            return self.to_atoms();
+        symbols = self.symbols.symbols;
+        return ' '.join([symbols[element] + str(position+1) + ':' + symbols[label]
+                         for element,position,label in zip(self.elements.tolist(),self.positions.tolist(),self.labels.tolist())]);
+class inca_atomMappings():
+    '''compact store of the atom mappings of a model
+    The elements, positions, and labels of all mappings are concatenated into flat int32 arrays
+    (mapping i spans offsets[i]:offsets[i+1]) that share one inca_symbolTable,
+    so that a genome-scale set of mappings is held in a few arrays instead of
+    three python lists (and a mapping string) per tracked species.
+    Mappings are parsed once on append; the store supports len(), indexing (returns an
+    inca_atomMapping view), append(), and extend()'''
+    __slots__ = ('symbols','elements','positions','labels','offsets','pending');
+    def __init__(self, symbols_I=None):
+        self.symbols = symbols_I if symbols_I is not None else inca_symbolTable();
+        self.elements = numpy.zeros(0, dtype=numpy.int32);
+        self.positions = numpy.zeros(0, dtype=numpy.int32);
+        self.labels = numpy.zeros(0, dtype=numpy.int32); # -1 for atoms that are not mapped
+        self.offsets = numpy.zeros(1, dtype=numpy.int64);
+        self.pending = []; # inca_atomMappings that have not been concatenated
+    def __len__(self):
+        return len(self.offsets) - 1 + len(self.pending);
+    def __getitem__(self, index_I):
+        '''return the atom mapping at an index (a view on the flat arrays)'''
+        self.flush();
+        if index_I < 0:
+            index_I += len(self);
+        start,stop = int(self.offsets[index_I]),int(self.offsets[index_I+1]);
+        labels = self.labels[start:stop];
+        if len(labels) and labels[0] < 0:
+            labels = None;
+        return inca_atomMapping(self.elements[start:stop],self.positions[start:stop],labels,self.symbols);
+    def make_atomMapping(self, elements_I, positions_I, mapping_I=None):
+        '''make an atom mapping (that is not added to the store)
+        INPUT:
+        elements_I = [], element of each atom (e.g., ['C','C'])
+        positions_I = [], (0-based) position of each atom
+        mapping_I = string ('[a][b]' or 'ab') or [] of labels, label of each atom (optional)
+        OUTPUT:
+        atomMapping_O = inca_atomMapping'''
+        labels = None;
+        if mapping_I:
+            labels = self.symbols.get_codes(self._parse_mapping(mapping_I));
+            elements_I = elements_I[:len(labels)];
+            positions_I = positions_I[:len(labels)];
+        return inca_atomMapping(self.symbols.get_codes(elements_I),
+            numpy.array(positions_I, dtype=numpy.int32), labels, self.symbols);
+    def make_symmetryMapping(self, elements_I, positions_I, symmetry_elements_I, symmetry_positions_I):
+        '''make the mapping of the atoms of a symmetric metabolite onto the rotated atoms
+        (e.g., 'C1:C4 C2:C3 C3:C2 C4:C1')'''
+        labels = [element + str(position+1) for element,position in zip(symmetry_elements_I,symmetry_positions_I)];
+        return inca_atomMapping(self.symbols.get_codes(elements_I),
+            numpy.array(positions_I, dtype=numpy.int32), self.symbols.get_codes(labels), self.symbols);
+    def parse_INCA(self, atomMapping_I):
+        '''parse an atom mapping in INCA syntax (e.g., 'C1:a C2:b' or 'C1 C2')
+        OUTPUT:
+        atomMapping_O = inca_atomMapping'''
+        elements = []; positions = []; labels = [];
+        for atom in atomMapping_I.split():
+            atom,_,label = atom.partition(':');
+            cnt = len(atom);
+            while cnt and atom[cnt-1].isdigit():
+                cnt -= 1;
+            elements.append(atom[:cnt]);
+            positions.append(int(atom[cnt:])-1);
+            labels.append(label);
+        if not any(labels):
+            return self.make_atomMapping(elements, positions);
+        return self.make_atomMapping(elements, positions, labels);
+    def append(self, elements_I, positions_I, mapping_I=None):
+        '''add an atom mapping (see make_atomMapping)
+        OUTPUT:
+        index_O = int, index of the mapping in the store'''
+        return self.append_atomMapping(self.make_atomMapping(elements_I, positions_I, mapping_I));
+    def append_atomMapping(self, atomMapping_I):
+        '''add an inca_atomMapping
+        OUTPUT:
+        index_O = int, index of the mapping in the store'''
+        if atomMapping_I.symbols is not self.symbols:
+            atomMapping_I = inca_atomMapping(self.symbols.get_codes(atomMapping_I.get_elements()),
+                atomMapping_I.positions,
+                self.symbols.get_codes(atomMapping_I.get_labels()) if atomMapping_I.labels is not None else None,
+                self.symbols);
+        self.pending.append(atomMapping_I);
+        return len(self) - 1;
+    def extend(self, mappings_I):
+        '''add a list of (elements, positions, mapping) tuples
+        OUTPUT:
+        indices_O = [], indices of the mappings in the store'''
+        return [self.append(*mapping) for mapping in mappings_I];
+    def flush(self):
+        '''concatenate the pending mappings onto the flat arrays'''
+        if not self.pending: return;
+        sizes = numpy.array([len(m) for m in self.pending], dtype=numpy.int64);
+        self.elements = numpy.concatenate([self.elements] + [m.elements for m in self.pending]).astype(numpy.int32);
+        self.positions = numpy.concatenate([self.positions] + [m.positions for m in self.pending]).astype(numpy.int32);
+        self.labels = numpy.concatenate([self.labels] + [m.labels if m.labels is not None
+            else numpy.full(len(m), -1, dtype=numpy.int32) for m in self.pending]).astype(numpy.int32);
+        self.offsets = numpy.concatenate([self.offsets, self.offsets[-1] + numpy.cumsum(sizes)]);
+        self.pending = [];
+    def get_nbytes(self):
+        '''return the number of bytes of the flat arrays'''
+        self.flush();
+        return self.elements.nbytes + self.positions.nbytes + self.labels.nbytes + self.offsets.nbytes;
+    def _parse_mapping(self, mapping_I):
+        '''parse an atom mapping ('[a][b][c]', 'abc', or [] of labels) into the list of labels'''
+        if isinstance(mapping_I, str) and '[' in mapping_I:
+            mapping = mapping_I.split('][');
+            return [m.replace('[','').replace(']','') for m in mapping];
+        return list(mapping_I);
@@ -0,0 +1,344 @@
+# System
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+# Dependencies from 3rd party
+import numpy
+import scipy
+import scipy.io
+
+from .INCA_mat import inca_mat
+from .INCA_api import inca_api
+from .INCA_i import inca_i
+class inca_benchmark():
+    '''class of methods to time and memory-profile the INCA input/output methods
+    The synthetic data generators (make_model, make_experiments, make_INCAResults) are deterministic
+    for a given seed and do not require MATLAB; run_suite profiles the script writers and the importer
+    at one of the scales and writes the results as JSON'''
+    # scales of the synthetic data (from toy models up to iJO1366)
+    scales = {'toy':{'n_reactions':50,'n_metabolites':40,'n_experiments':2,'n_fragments':5,'n_time_points':2,'n_parameters':60},
+        'small':{'n_reactions':500,'n_metabolites':400,'n_experiments':2,'n_fragments':20,'n_time_points':3,'n_parameters':300},
+        'iJO1366':{'n_reactions':2583,'n_metabolites':1805,'n_experiments':4,'n_fragments':60,'n_time_points':4,'n_parameters':1000}};
+    def __init__(self):
+        self.results=[];
+    def profile(self, name_I, function_I, *args, **kwargs):
+        '''run a function once and record its wall time and peak (python-allocated) memory
+        INPUT:
+        name_I = string, name of the benchmark
+        function_I = callable
+        OUTPUT:
+        result_O = {}, name, seconds, peak_memory (bytes)'''
+        tracemalloc.start();
+        start = time.perf_counter();
+        function_I(*args, **kwargs);
+        seconds = time.perf_counter() - start;
+        peak_memory = tracemalloc.get_traced_memory()[1];
+        tracemalloc.stop();
+        result_O = {'name':name_I,'seconds':seconds,'peak_memory':peak_memory};
+        self.results.append(result_O);
+        return result_O;
+    def benchmark_loadmat(self, filename_I):
+        '''compare parsing an INCA result file once per variable (m, f, and s)
+        against the single-pass loader used by inca_i
+        INPUT:
+        filename_I = string, name of the matlab file
+        OUTPUT:
+        results_O = [], benchmark results'''
+        def loadmat_legacy():
+            m = scipy.io.loadmat(filename_I)['m'];
+            f = scipy.io.loadmat(filename_I)['f'];
+            s = scipy.io.loadmat(filename_I)['s'];
+        def loadmat_loader():
+            mat = inca_mat(filename_I,variable_names_I=['m','f']);
+        results_O = [];
+        results_O.append(self.profile('loadmat_legacy',loadmat_legacy));
+        results_O.append(self.profile('loadmat_loader',loadmat_loader));
+        return results_O;
+    def make_atomMappings(self, n_reactions_I=2583, n_metabolites_I=1805, n_duplicates_I=500, seed_I=0):
+        '''make a synthetic atom-mapping set (defaults: iJO1366 scale)
+        INPUT:
+        n_reactions_I = int, number of reactions
+        n_metabolites_I = int, number of metabolites
+        n_duplicates_I = int, number of reactions that repeat an earlier reaction definition
+            (e.g., the same mapping listed for several models)
+        seed_I = int, random seed
+        OUTPUT:
+        rxns_O = [], of {} with the arguments of inca_api.make_isotopomerRxnEquations_batch'''
+        rand = random.Random(seed_I);
+        mets = ['met' + str(cnt) + '_c' for cnt in range(n_metabolites_I)];
+        atoms = 'abcdefghijklmnopqrstuvwxyz';
+        def make_side(mets_I, sign_I):
+            side = {'ids':[],'stoichiometry':[],'ids_tracked':[],'stoichiometry_tracked':[],
+                'elements_tracked':[],'positions_tracked':[],'mapping':[]};
+            for met in mets_I:
+                stoichiometry = sign_I*rand.choice([1.0,1.0,1.0,2.0]);
+                side['ids'].append(met);
+                side['stoichiometry'].append(stoichiometry);
+                if rand.random() < 0.2: continue; # untracked (e.g., cofactors)
+                n_atoms = rand.randint(1,7);
+                mapping = [atoms[rand.randint(0,len(atoms)-1)] for cnt in range(n_atoms)];
+                side['ids_tracked'].append(met);
+                side['stoichiometry_tracked'].append(stoichiometry if rand.random() < 0.9 else stoichiometry/2);
+                side['elements_tracked'].append(['C']*n_atoms);
+                side['positions_tracked'].append(list(range(n_atoms)));
+                side['mapping'].append('[' + ']['.join(mapping) + ']' if rand.random() < 0.5 else ''.join(mapping));
+            return side;
+        rxns_O = [];
+        for cnt in range(n_reactions_I - n_duplicates_I):
+            if cnt == 0: # biomass
+                n_reactants,n_products = min(60,n_metabolites_I),min(3,n_metabolites_I);
+            elif rand.random() < 0.1: # exchange
+                n_reactants,n_products = 1,0;
+            else:
+                n_reactants,n_products = rand.randint(1,3),rand.randint(1,3);
+            reactants = make_side(rand.sample(mets,n_reactants),-1);
+            products = make_side(rand.sample(mets,n_products),1);
+            rxn = {'reversibility':rand.random() < 0.5};
+            for key,value in reactants.items():
+                rxn['reactants_' + key] = value;
+            for key,value in products.items():
+                rxn['products_' + key] = value;
+            rxns_O.append(rxn);
+        for cnt in range(n_duplicates_I):
+            rxns_O.append(rxns_O[rand.randint(0,len(rxns_O)-1)]);
+        return rxns_O;
+    def benchmark_rxnEquations(self, rxns_I=None):
+        '''compare generating the reaction equations one reaction at a time
+        against the batched (memoized) entry point
+        INPUT:
+        rxns_I = [], of {} with the arguments of inca_api.make_isotopomerRxnEquations_batch
+            (default: make_atomMappings())
+        OUTPUT:
+        results_O = [], benchmark results'''
+        if rxns_I is None:
+            rxns_I = self.make_atomMappings();
+        api = inca_api();
+        equations = {};
+        def rxnEquations_legacy():
+            equations['legacy'] = [api.make_isotopomerRxnEquations_INCA(**dict([(key + '_I',value) for key,value in rxn.items()]))
+                                   for rxn in rxns_I];
+        def rxnEquations_batch():
+            equations['batch'] = api.make_isotopomerRxnEquations_batch(rxns_I,memoize_I=False);
+        def rxnEquations_memoized():
+            equations['memoized'] = api.make_isotopomerRxnEquations_batch(rxns_I,memoize_I=True);
+        results_O = [];
+        with contextlib.redirect_stdout(io.StringIO()):
+            results_O.append(self.profile('rxnEquations_legacy',rxnEquations_legacy));
+            results_O.append(self.profile('rxnEquations_batch',rxnEquations_batch));
+            results_O.append(self.profile('rxnEquations_memoized',rxnEquations_memoized));
+        if equations['legacy'] != equations['batch'] or equations['legacy'] != equations['memoized']:
+            raise ValueError('batched reaction equations differ from the reaction equations');
+        return results_O;
+    def make_model(self, n_reactions_I=2583, n_metabolites_I=1805, seed_I=0):
+        '''make a synthetic model with atom mappings
+        OUTPUT:
+        modelReaction_data_O = [], of {} rxn_id, rxn_equation, lower_bound, upper_bound, flux_val
+            (the first reaction is the biomass reaction)
+        modelMetabolite_data_O = [], of {} met_id, met_atompositions, met_elements,
+            met_symmetry_atompositions, met_symmetry_elements
+        rxnMappings_O = {}, rxn_id: {} of the atom mapping of the reaction (see make_atomMappings)'''
+        rand = random.Random(seed_I);
+        mappings = self.make_atomMappings(n_reactions_I=n_reactions_I,n_metabolites_I=n_metabolites_I,
+                                          n_duplicates_I=0,seed_I=seed_I);
+        with contextlib.redirect_stdout(io.StringIO()):
+            rxn_equations = inca_api().make_isotopomerRxnEquations_batch(mappings);
+        modelReaction_data_O = [];
+        rxnMappings_O = {};
+        for cnt,(mapping,rxn_equation) in enumerate(zip(mappings,rxn_equations)):
+            rxn_id = 'Ec_biomass_iJO1366_WT_53p95M' if cnt == 0 else 'R' + str(cnt);
+            lower_bound = rand.choice([0.0,-1000.0]) if cnt else 0.0;
+            flux_val = rand.choice([0.0,0.0,rand.random()*10]);
+            modelReaction_data_O.append({'rxn_id':rxn_id,'rxn_equation':rxn_equation,
+                'lower_bound':lower_bound,'upper_bound':1000.0,'flux_val':flux_val});
+            rxnMappings_O[rxn_id] = mapping;
+        modelMetabolite_data_O = [];
+        for cnt in range(n_metabolites_I):
+            n_atoms = rand.randint(1,7);
+            symmetric = n_atoms > 1 and rand.random() < 0.02;
+            modelMetabolite_data_O.append({'met_id':'met' + str(cnt) + '_c',
+                'met_atompositions':list(range(n_atoms)),'met_elements':['C']*n_atoms,
+                'met_symmetry_atompositions':list(range(n_atoms))[::-1] if symmetric else [],
+                'met_symmetry_elements':['C']*n_atoms if symmetric else []});
+        modelMetabolite_data_O.append({'met_id':'co2_e','met_atompositions':[0],'met_elements':['C'],
+            'met_symmetry_atompositions':[],'met_symmetry_elements':[]});
+        return modelReaction_data_O,modelMetabolite_data_O,rxnMappings_O;
+    def make_experiments(self, model_I, n_experiments_I=2, n_fragments_I=20, n_time_points_I=3, seed_I=0):
+        '''make synthetic measured fluxes, MS data, and tracers for a model (see make_model)
+        Each experiment has its own experiment_id and sample_name_abbreviation
+        OUTPUT:
+        measuredFluxes_data_O = [], of {} experiment_id, sample_name_abbreviation, rxn_id, flux_lb, flux_ub,
+            flux_average, flux_stdev
+        experimentalMS_data_O = [], of {} experiment_id, sample_name_abbreviation, fragment_id, met_id,
+            time_point, met_atompositions, met_elements, intensity_normalized_average, intensity_normalized_stdev
+        tracer_O = [], of {} experiment_id, sample_name_abbreviation, met_name, met_id, met_atompositions,
+            met_elements, ratio'''
+        rand = random.Random(seed_I);
+        modelReaction_data,modelMetabolite_data = model_I[0],model_I[1];
+        rxn_ids = [rxn['rxn_id'] for rxn in modelReaction_data[1:]];
+        fragments = rand.sample(modelMetabolite_data[:-1],min(n_fragments_I,len(modelMetabolite_data)-1));
+        measuredFluxes_data_O = []; experimentalMS_data_O = []; tracer_O = [];
+        for experiment_cnt in range(n_experiments_I):
+            experiment_id = 'expt' + str(experiment_cnt);
+            sample_name_abbreviation = 'sna' + str(experiment_cnt);
+            for rxn_id in rand.sample(rxn_ids,min(10,len(rxn_ids))):
+                flux_average = rand.random()*10;
+                measuredFluxes_data_O.append({'experiment_id':experiment_id,'sample_name_abbreviation':sample_name_abbreviation,
+                    'rxn_id':rxn_id,'flux_lb':flux_average*0.9,'flux_ub':flux_average*1.1,
+                    'flux_average':flux_average,'flux_stdev':flux_average*0.05});
+            for met in fragments:
+                n_mdvs = len(met['met_atompositions']) + 1;
+                for time_cnt in range(n_time_points_I):
+                    average = [rand.random() for cnt in range(n_mdvs)];
+                    total = sum(average);
+                    experimentalMS_data_O.append({'experiment_id':experiment_id,'sample_name_abbreviation':sample_name_abbreviation,
+                        'fragment_id':met['met_id'] + '_frag','met_id':met['met_id'],'time_point':str(float(time_cnt)),
+                        'met_atompositions':list(met['met_atompositions']),'met_elements':list(met['met_elements']),
+                        'intensity_normalized_average':[a/total for a in average],
+                        'intensity_normalized_stdev':[rand.random()*0.01 for cnt in range(n_mdvs)]});
+            for met_name,ratio in [('[1-13C]glc',0.5),('[U-13C]glc',0.5)]:
+                tracer_O.append({'experiment_id':experiment_id,'sample_name_abbreviation':sample_name_abbreviation,
+                    'met_name':met_name,'met_id':'glc_DASH_D_e','met_atompositions':[1,2,3,4,5,6],
+                    'met_elements':['C']*6,'ratio':ratio});
+        return measuredFluxes_data_O,experimentalMS_data_O,tracer_O;
+    def make_INCAResults(self, filename_I, model_I, experiments_I, n_parameters_I=300, seed_I=0):
+        '''write a synthetic INCA result file (m, f, and s structs as saved by INCA) for a model and experiments
+        (see make_model and make_experiments)
+        INPUT:
+        filename_I = string, name of the .mat file
+        n_parameters_I = int, number of net flux parameters (one Norm parameter is added per fragment,
+            experiment, and time point; cov, cor, and chi2s rows span all parameters)
+        OUTPUT:
+        simulation_info_O = {}, experiment_id, sample_name_abbreviation, time_point (as expected by inca_i)'''
+        rand = random.Random(seed_I);
+        state = numpy.random.RandomState(seed_I);
+        modelReaction_data = model_I[0];
+        measuredFluxes_data,experimentalMS_data,tracer = experiments_I;
+        experiment_ids = sorted(set([row['experiment_id'] for row in experimentalMS_data]));
+        sample_name_abbreviations = sorted(set([row['sample_name_abbreviation'] for row in experimentalMS_data]));
+        time_points = sorted(set([row['time_point'] for row in experimentalMS_data]));
+        def make_fragmentString(row, mass_I):
+            n_atoms = len(row['met_atompositions']);
+            return row['met_id'] + '_C' + str(n_atoms) + 'H' + str(2*n_atoms) + 'O' + str(n_atoms) + '_' + \
+                str(mass_I) + '_' + row['time_point'];
+        # measurements and residuals
+        mnt = []; norms = [];
+        for row in measuredFluxes_data:
+            mnt.append({'id':row['rxn_id'],'sres':numpy.array([[rand.random()]]),'expt':row['experiment_id'],'type':'Flux',
+                'res':self._make_struct(['val','fit','type','id','std','time','expt','data','peak'],[{
+                    'val':numpy.array([[rand.random()]]),'fit':numpy.array([[row['flux_average']]]),'type':'Flux',
+                    'id':row['rxn_id'],'std':numpy.array([[row['flux_stdev']]]),'time':numpy.array([[numpy.inf]]),
+                    'expt':row['experiment_id'],'data':numpy.array([[row['flux_average']]]),'peak':numpy.zeros((0,0))}])});
+        for row in experimentalMS_data:
+            for mass,average in enumerate(row['intensity_normalized_average']):
+                fragment_string = make_fragmentString(row, mass);
+                mnt.append({'id':fragment_string,'sres':numpy.array([[rand.random()]]),'expt':row['experiment_id'],'type':'MS',
+                    'res':self._make_struct(['val','fit','type','id','std','time','expt','data','peak'],[{
+                        'val':numpy.array([[rand.random()]]),'fit':numpy.array([[average]]),'type':'MS',
+                        'id':fragment_string,'std':numpy.array([[row['intensity_normalized_stdev'][mass]]]),
+                        'time':numpy.array([[float(row['time_point'])]]),'expt':row['experiment_id'],
+                        'data':numpy.array([[average]]),'peak':'M' + str(mass)}])});
+            norms.append(row['experiment_id'] + ' ' + row['fragment_id'] + ' ' + make_fragmentString(row, 0) + ' au');
+        # parameters
+        n_fluxes = min(n_parameters_I,len(modelReaction_data));
+        n_parameters = n_fluxes + len(norms);
+        par = [];
+        for cnt in range(n_parameters):
+            if cnt < n_fluxes:
+                parameter = {'id':modelReaction_data[cnt]['rxn_id'],'type':'Net flux','unit':'mmol*gDCW-1*hr-1',
+                    'val':numpy.array([[rand.random()*10]]),'lb':numpy.array([[rand.random()]]),'ub':numpy.array([[10+rand.random()]])};
+            else:
+                parameter = {'id':norms[cnt-n_fluxes],'type':'Norm','unit':'au',
+                    'val':numpy.array([[rand.random()]]),'lb':numpy.array([[0.0]]),'ub':numpy.array([[1000.0]])};
+            parameter.update({'std':numpy.array([[rand.random()]]),'alf':numpy.array([[0.05]]),
+                'chi2s':state.rand(1,n_parameters),'cor':state.rand(1,n_parameters),'cov':state.rand(1,n_parameters),
+                'free':numpy.array([[float(cnt%2)]])});
+            par.append(parameter);
+        fit = self._make_struct(['Echi2','alf','chi2','dof','mnt','par'],[{
+            'Echi2':numpy.array([[len(mnt)-n_parameters*0.9,len(mnt)+n_parameters*1.1]]),'alf':numpy.array([[0.05]]),
+            'chi2':numpy.array([[float(len(mnt))]]),'dof':numpy.array([[float(max(len(mnt)-n_parameters,1))]]),
+            'mnt':self._make_struct(['id','sres','expt','type','res'],mnt),
+            'par':self._make_struct(['id','val','std','type','lb','ub','unit','alf','chi2s','cor','cov','free'],par)}]);
+        # model (options and experiments)
+        options = {'cont_alpha':0.05,'cont_reltol':0.001,'cont_steps':20.0,'fit_nudge':10.0,'fit_reinit':1.0,
+            'fit_reltol':0.001,'fit_starts':10.0,'fit_tau':1.0,'hpc_on':0.0,'int_maxstep':numpy.inf,'int_reltol':1e-6,
+            'int_senstol':1e-3,'int_timeout':300.0,'int_tspan':numpy.inf,'ms_correct':1.0,'oed_crit':'D','oed_reinit':0.0,
+            'oed_tolf':1e-3,'oed_tolx':1e-3,'sim_more':0.0,'sim_na':1.0,'sim_sens':1.0,'sim_ss':1.0,'sim_tunit':'h',
+            'hpc_bg':0.0,'hpc_sched':'local'};
+        options = self._make_struct(list(options.keys()),[dict([(key,value if isinstance(value,str) else numpy.array([[value]]))
+            for key,value in options.items()])]);
+        expts = [];
+        for experiment_id in experiment_ids:
+            fragment_ids = sorted(set([row['fragment_id'] for row in experimentalMS_data if row['experiment_id'] == experiment_id]));
+            ids = numpy.empty((1,len(fragment_ids)),dtype=object);
+            for cnt,fragment_id in enumerate(fragment_ids):
+                ids[0,cnt] = fragment_id;
+            expts.append({'id':experiment_id,'data_ms':self._make_struct(['id'],[{'id':ids}])});
+        model = self._make_struct(['expts','options'],[{'expts':self._make_struct(['id','data_ms'],expts),'options':options}]);
+        simdata = self._make_struct(['mnt'],[{'mnt':state.rand(len(time_points),len(mnt))}]);
+        scipy.io.savemat(filename_I,{'m':model,'f':fit,'s':simdata});
+        return {'experiment_id':experiment_ids,'sample_name_abbreviation':sample_name_abbreviations,'time_point':time_points};
+    def run_suite(self, scale_I='toy', filename_I=None, directory_I=None, seed_I=0):
+        '''time and memory-profile the script writers, the reaction equations, and the importer
+        on synthetic data
+        INPUT:
+        scale_I = string, name of the scale (see scales) or {} of the scale parameters
+        filename_I = optional string, name of the JSON file the report is written to
+        directory_I = optional string, directory of the synthetic INCA result file (created if needed; default: temporary directory)
+        seed_I = int, random seed of the synthetic data
+        OUTPUT:
+        report_O = {}, scale, parameters, environment, date, and results (name, seconds, peak_memory)'''
+        parameters = self.scales[scale_I] if isinstance(scale_I,str) else scale_I;
+        model = self.make_model(parameters['n_reactions'],parameters['n_metabolites'],seed_I);
+        experiments = self.make_experiments(model,parameters['n_experiments'],parameters['n_fragments'],
+                                            parameters['n_time_points'],seed_I);
+        modelReaction_data,modelMetabolite_data,rxnMappings = model;
+        measuredFluxes_data,experimentalMS_data,tracer = experiments;
+        rxns = list(rxnMappings.values());
+        api = inca_api();
+        results = [];
+        if directory_I and not os.path.isdir(directory_I):
+            os.makedirs(directory_I);
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            filename = os.path.join(directory_I or tmp_directory,'inca_benchmark_' + str(seed_I) + '.mat');
+            simulation_info = self.make_INCAResults(filename,model,experiments,parameters['n_parameters'],seed_I);
+            def import_results(columnar_I):
+                inca_i().import_isotopomerSimulationResults_INCA('benchmark',filename,simulation_info,columnar_I=columnar_I);
+            with contextlib.redirect_stdout(io.StringIO()):
+                results.append(self.profile('make_isotopomerRxnEquations_INCA',
+                    lambda: [api.make_isotopomerRxnEquations_INCA(**dict([(key + '_I',value) for key,value in rxn.items()])) for rxn in rxns]));
+                results.append(self.profile('make_isotopomerRxnEquations_batch',api.make_isotopomerRxnEquations_batch,rxns));
+                results.append(self.profile('writeScript_model_INCA',api.writeScript_model_INCA,
+                    modelReaction_data,modelMetabolite_data,measuredFluxes_data,experimentalMS_data,tracer));
+                results.append(self.profile('writeScript_experiment_INCA',api.writeScript_experiment_INCA,
+                    modelReaction_data,modelMetabolite_data,measuredFluxes_data,experimentalMS_data,tracer));
+                results.append(self.profile('write_isotopomerExperiment_INCA',api.write_isotopomerExperiment_INCA,
+                    modelReaction_data,modelMetabolite_data,measuredFluxes_data,experimentalMS_data,tracer));
+                results.append(self.profile('write_isotopomerExperiment_INCA_matrix',api.write_isotopomerExperiment_INCA,
+                    modelReaction_data,modelMetabolite_data,measuredFluxes_data,experimentalMS_data,tracer,mdv_format_I='matrix'));
+                results.append(self.profile('import_isotopomerSimulationResults_INCA',import_results,False));
+                results.append(self.profile('import_isotopomerSimulationResults_INCA_columnar',import_results,True));
+            file_size = os.path.getsize(filename);
+        report_O = {'scale':scale_I if isinstance(scale_I,str) else 'custom',
+            'parameters':dict(parameters,seed=seed_I,result_file_size=file_size),
+            'environment':{'python':platform.python_version(),'numpy':numpy.__version__,'scipy':scipy.__version__,
+                'platform':platform.platform()},
+            'date':datetime.now().isoformat(),
+            'results':results};
+        if filename_I:
+            with open(filename_I,'w') as f:
+                json.dump(report_O,f,indent=2);
+        return report_O;
+    def _make_struct(self, fields_I, rows_I):
+        '''return a 1xN matlab struct array (as written by scipy.io.savemat) of rows'''
+        struct = numpy.zeros((1,len(rows_I)),dtype=[(field,'O') for field in fields_I]);
+        for cnt,row in enumerate(rows_I):
+            for field in fields_I:
+                struct[0,cnt][field] = row[field];
+        return struct;
@@ -0,0 +1,271 @@
+# System
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import pickle
+import time
+class inca_lruCache():
+    '''size-bounded least-recently-used cache with hit/miss counters'''
+    def __init__(self, maxsize_I=1024):
+        self.maxsize = maxsize_I;
+        self.entries = OrderedDict();
+        self.hits = 0;
+        self.misses = 0;
+    def __len__(self):
+        return len(self.entries);
+    def __contains__(self, key_I):
+        return key_I in self.entries;
+    def get(self, key_I, default_I=None):
+        '''return the cached value of a key (or default_I) and count the hit/miss'''
+        if key_I in self.entries:
+            self.entries.move_to_end(key_I);
+            self.hits += 1;
+            return self.entries[key_I];
+        self.misses += 1;
+        return default_I;
+    def set(self, key_I, value_I):
+        '''cache a value, evicting the least recently used entry if the cache is full'''
+        self.entries[key_I] = value_I;
+        self.entries.move_to_end(key_I);
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False);
+    def get_or_compute(self, key_I, function_I, *args):
+        '''return the cached value of a key, computing and caching function_I(*args) on a miss'''
+        if key_I in self.entries:
+            self.entries.move_to_end(key_I);
+            self.hits += 1;
+            return self.entries[key_I];
+        self.misses += 1;
+        value = function_I(*args);
+        self.set(key_I, value);
+        return value;
+    def clear(self):
+        '''remove all entries and reset the counters'''
+        self.entries.clear();
+        self.hits = 0;
+        self.misses = 0;
+    def get_statistics(self):
+        '''return the hit/miss counters
+        OUTPUT:
+        statistics_O = {}, hits, misses, size, maxsize'''
+        return {'hits':self.hits,'misses':self.misses,'size':len(self.entries),'maxsize':self.maxsize};
+class inca_importCache():
+    '''on-disk cache of the tables imported from INCA result files
+    A json manifest records, for each imported file, the path, size, mtime,
+    (optionally) a content hash, and a key of the import arguments (including the path
+    and format of the parameter store, if any); the tables
+    are serialized (pickle) to one file per entry. An entry is served only if the file
+    and the import arguments are unchanged, so that re-importing a results directory
+    only parses new or changed files.
+    Cache hits only update the last_used time in memory; the manifest is written by flush()
+    (called by set, invalidate, prune, evict, inca_i.import_isotopomerSimulationResults_batch,
+    and on exit when the cache is used as a context manager)'''
+    def __init__(self, directory_I, hash_I=False, maxsize_I=None):
+        '''INPUT:
+        directory_I = string, directory of the manifest and the serialized tables
+        hash_I = boolean, also compare a sha1 hash of the file contents (slower, but detects
+            changes that preserve the size and mtime)
+        maxsize_I = int, maximum number of entries (least recently used entries are evicted; default: unbounded)'''
+        self.directory = directory_I;
+        self.hash = hash_I;
+        self.maxsize = maxsize_I;
+        self.hits = 0;
+        self.misses = 0;
+        self.dirty = False; # the manifest has changes that are not written
+        self.manifest_filename = os.path.join(directory_I,'manifest.json');
+        if not os.path.isdir(directory_I):
+            os.makedirs(directory_I);
+        self.manifest = {};
+        if os.path.isfile(self.manifest_filename):
+            with open(self.manifest_filename,'r') as f:
+                self.manifest = json.load(f);
+    def __len__(self):
+        return len(self.manifest);
+    def __enter__(self):
+        return self;
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush();
+    def flush(self):
+        '''write the manifest if it has changes that are not written'''
+        if self.dirty:
+            self._write_manifest();
+    def get(self, simulation_id_I, filename_I, simulation_info_I, model_rxn_conversion_I=None, columnar_I=False,
+            parameterStore_I=None):
+        '''return the cached tables of an import (None if the file or the arguments changed)
+        INPUT:
+        parameterStore_I = optional inca_covariance, store of the parameter matrices of the import
+            (the rows of cached tables reference the matrices of the store they were imported with)
+        OUTPUT:
+        tables_O = {}, table name: rows (as returned by inca_i.get_tables())'''
+        entry = self.manifest.get(os.path.abspath(filename_I));
+        if entry is None or entry != self._get_entry(entry, simulation_id_I, filename_I, simulation_info_I,
+                model_rxn_conversion_I, columnar_I, parameterStore_I):
+            self.misses += 1;
+            return None;
+        try:
+            with open(os.path.join(self.directory, entry['result']),'rb') as f:
+                tables_O = pickle.load(f);
+        except (IOError, pickle.UnpicklingError, EOFError):
+            self.misses += 1;
+            return None;
+        self.hits += 1;
+        entry['last_used'] = time.time();
+        self.dirty = True;
+        return tables_O;
+    def set(self, simulation_id_I, filename_I, simulation_info_I, tables_I, model_rxn_conversion_I=None, columnar_I=False,
+            flush_I=True, parameterStore_I=None):
+        '''cache the tables of an import
+        INPUT:
+        tables_I = {}, table name: rows (as returned by inca_i.get_tables())
+        parameterStore_I = optional inca_covariance, store of the parameter matrices of the import (see get)
+        flush_I = boolean, write the manifest (False: the caller calls flush() after a batch of entries)'''
+        entry = self._get_entry(None, simulation_id_I, filename_I, simulation_info_I, model_rxn_conversion_I, columnar_I,
+            parameterStore_I);
+        if entry is None: return;
+        entry['result'] = hashlib.sha1(entry['filename'].encode('utf-8')).hexdigest() + '.pkl';
+        entry['last_used'] = time.time();
+        temporary = os.path.join(self.directory, entry['result'] + '.tmp');
+        with open(temporary,'wb') as f:
+            pickle.dump(tables_I, f, protocol=pickle.HIGHEST_PROTOCOL);
+        os.replace(temporary, os.path.join(self.directory, entry['result']));
+        self.manifest[entry['filename']] = entry;
+        self.dirty = True;
+        if self.maxsize is not None:
+            self._evict(self.maxsize);
+        if flush_I:
+            self.flush();
+    def invalidate(self, filename_I=None):
+        '''remove the entry of a file (or all entries if filename_I is None)'''
+        if filename_I is None:
+            filenames = list(self.manifest.keys());
+        else:
+            filenames = [os.path.abspath(filename_I)];
+        for filename in filenames:
+            self._remove(filename);
+        self.flush();
+    def prune(self):
+        '''remove the entries of files that no longer exist'''
+        for filename in list(self.manifest.keys()):
+            if not os.path.isfile(filename):
+                self._remove(filename);
+        self.flush();
+    def evict(self, maxsize_I):
+        '''remove the least recently used entries until at most maxsize_I entries remain'''
+        self._evict(maxsize_I);
+        self.flush();
+    def get_statistics(self):
+        '''return the hit/miss counters
+        OUTPUT:
+        statistics_O = {}, hits, misses, size, maxsize'''
+        return {'hits':self.hits,'misses':self.misses,'size':len(self.manifest),'maxsize':self.maxsize};
+    def _get_entry(self, entry_I, simulation_id_I, filename_I, simulation_info_I, model_rxn_conversion_I, columnar_I,
+            parameterStore_I=None):
+        '''return the manifest entry describing the current state of a file and the import arguments
+        (the result and last_used fields are copied from entry_I; None if the file cannot be read)'''
+        try:
+            st = os.stat(filename_I);
+        except (IOError, OSError):
+            return None;
+        store = None;
+        if parameterStore_I is not None:
+            store = (os.path.abspath(parameterStore_I.path), parameterStore_I.format);
+        entry_O = {'filename':os.path.abspath(filename_I),
+            'size':st.st_size,
+            'mtime':st.st_mtime,
+            'hash':None,
+            'arguments':hashlib.sha1(repr((simulation_id_I, simulation_info_I,
+                model_rxn_conversion_I, bool(columnar_I), store)).encode('utf-8')).hexdigest()};
+        if entry_I is not None:
+            if (entry_I['size'],entry_I['mtime'],entry_I['arguments']) != (entry_O['size'],entry_O['mtime'],entry_O['arguments']):
+                return entry_O;
+            entry_O['result'] = entry_I['result'];
+            entry_O['last_used'] = entry_I['last_used'];
+        if self.hash:
+            entry_O['hash'] = self._get_hash(filename_I);
+        return entry_O;
+    def _get_hash(self, filename_I, block_size_I=1<<20):
+        '''return the sha1 hash of the contents of a file'''
+        sha1 = hashlib.sha1();
+        with open(filename_I,'rb') as f:
+            for block in iter(lambda: f.read(block_size_I), b''):
+                sha1.update(block);
+        return sha1.hexdigest();
+    def _evict(self, maxsize_I):
+        '''remove the least recently used entries until at most maxsize_I entries remain'''
+        filenames = sorted(self.manifest.keys(), key=lambda k: self.manifest[k]['last_used']);
+        for filename in filenames[:max(len(filenames)-maxsize_I,0)]:
+            self._remove(filename);
+    def _remove(self, filename_I):
+        '''remove an entry and its serialized tables'''
+        entry = self.manifest.pop(filename_I, None);
+        if entry is None: return;
+        self.dirty = True;
+        result = os.path.join(self.directory, entry['result']);
+        if os.path.isfile(result):
+            os.remove(result);
+    def _write_manifest(self):
+        '''write the manifest (atomically, so that an interrupted run leaves a valid manifest)'''
+        temporary = self.manifest_filename + '.tmp';
+        with open(temporary,'w') as f:
+            json.dump(self.manifest, f, indent=1);
+        os.replace(temporary, self.manifest_filename);
+        self.dirty = False;
+class inca_scriptCache():
+    '''content-addressed cache of rendered script sections
+    Sections are stored under a hash of the inputs they were rendered from
+    in a size-bounded in-memory LRU cache and (optionally) as files in a directory,
+    so that the same section can be reused across scripts and sessions.'''
+    def __init__(self, maxsize_I=32, directory_I=None):
+        '''INPUT:
+        maxsize_I = int, maximum number of sections held in memory
+        directory_I = optional string, directory of the on-disk cache'''
+        self.memory = inca_lruCache(maxsize_I);
+        self.directory = directory_I;
+        self.disk_hits = 0;
+        if directory_I and not os.path.isdir(directory_I):
+            os.makedirs(directory_I);
+    def __len__(self):
+        return len(self.memory);
+    def get_key(self, *args):
+        '''return the (sha1) key of the inputs of a section
+        INPUT:
+        args = inputs (python objects with a stable repr, e.g., lists/tuples of strings and numbers)'''
+        return hashlib.sha1(repr(args).encode('utf-8')).hexdigest();
+    def get(self, key_I):
+        '''return a cached section (None on a miss)'''
+        section = self.memory.get(key_I);
+        if section is None and self.directory:
+            filename = os.path.join(self.directory, key_I + '.m');
+            if os.path.isfile(filename):
+                with open(filename,'r') as f:
+                    section = f.read();
+                # counted as a disk hit instead of a miss
+                self.memory.misses -= 1;
+                self.disk_hits += 1;
+                self.memory.set(key_I, section);
+        return section;
+    def set(self, key_I, section_I):
+        '''cache a section'''
+        self.memory.set(key_I, section_I);
+        if self.directory:
+            filename = os.path.join(self.directory, key_I + '.m');
+            temporary = filename + '.tmp';
+            with open(temporary,'w') as f:
+                f.write(section_I);
+            os.replace(temporary, filename);
+    def clear(self, disk_I=False):
+        '''remove all sections from memory (and from the directory if disk_I)'''
+        self.memory.clear();
+        self.disk_hits = 0;
+        if disk_I and self.directory:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.m'):
+                    os.remove(os.path.join(self.directory, filename));
+    def get_statistics(self):
+        '''return the hit/miss counters
+        OUTPUT:
+        statistics_O = {}, hits (memory), disk_hits, misses, size, maxsize'''
+        statistics_O = self.memory.get_statistics();
+        statistics_O['disk_hits'] = self.disk_hits;
+        return statistics_O;
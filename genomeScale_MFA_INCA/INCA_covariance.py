@@ -0,0 +1,119 @@
+# System
+import os
+# Dependencies from 3rd party
+import numpy
+import h5py
+class inca_covariance():
+    '''compact on-disk store of the parameter covariance (cov), correlation (cor),
+    and chi2 profile (chi2s) matrices of INCA fits
+    The matrices are written once per simulation_id; rows of the imported tables
+    reference a matrix row/column by the index of the parameter in f.par.
+    Formats:
+    'hdf5' = one HDF5 file with a group per simulation_id and one compressed,
+        chunked dataset per matrix (slices only read the chunks they touch)
+    'npy' = one directory per simulation_id with one .npy file per matrix
+        (read as read-only memory maps)'''
+    def __init__(self, path_I, format_I='hdf5', chunk_size_I=256, compression_I='gzip'):
+        self.path = path_I;
+        self.format = format_I;
+        self.chunk_size = chunk_size_I;
+        self.compression = compression_I;
+        if not format_I in ['hdf5','npy']:
+            raise ValueError('format ' + str(format_I) + ' not recognized');
+    def write_matrices(self, simulation_id_I, matrices_I, parameter_ids_I=None):
+        '''write the matrices of a simulation (replacing any previous entry)
+        INPUT:
+        simulation_id_I = string, simulation_id
+        matrices_I = {}, matrix name (e.g., cov, cor, chi2s): [] of matrix rows
+            (one row per parameter; rows may be lazy arrays and are written in blocks of chunk_size rows;
+            empty rows and short rows are padded with NaN)
+        parameter_ids_I = [], of parameter ids (optional)'''
+        if self.format == 'hdf5':
+            with h5py.File(self.path,'a') as store:
+                if simulation_id_I in store:
+                    del store[simulation_id_I];
+                group = store.create_group(simulation_id_I);
+                if parameter_ids_I is not None:
+                    group.create_dataset('parameter_ids',data=[str(p) for p in parameter_ids_I],
+                        dtype=h5py.string_dtype());
+                for name,rows in matrices_I.items():
+                    shape = self._get_shape(rows);
+                    if not shape: continue;
+                    dataset = group.create_dataset(name, shape=shape, dtype=numpy.float64,
+                        chunks=(min(shape[0],self.chunk_size),min(shape[1],self.chunk_size)),
+                        compression=self.compression, fillvalue=numpy.nan);
+                    self._write_rows(dataset, rows);
+        else:
+            directory = os.path.join(self.path, simulation_id_I);
+            if not os.path.isdir(directory):
+                os.makedirs(directory);
+            for filename in os.listdir(directory):
+                os.remove(os.path.join(directory, filename));
+            if parameter_ids_I is not None:
+                with open(os.path.join(directory,'parameter_ids.txt'),'w') as f:
+                    f.write('\n'.join([str(p) for p in parameter_ids_I]));
+            for name,rows in matrices_I.items():
+                shape = self._get_shape(rows);
+                if not shape: continue;
+                matrix = numpy.lib.format.open_memmap(os.path.join(directory, name + '.npy'),
+                    mode='w+', dtype=numpy.float64, shape=shape);
+                matrix[:] = numpy.nan;
+                self._write_rows(matrix, rows);
+                matrix.flush();
+                del matrix;
+    def get_simulationIds(self):
+        '''return the simulation_ids in the store'''
+        if self.format == 'hdf5':
+            if not os.path.isfile(self.path): return [];
+            with h5py.File(self.path,'r') as store:
+                return list(store.keys());
+        if not os.path.isdir(self.path): return [];
+        return sorted([d for d in os.listdir(self.path) if os.path.isdir(os.path.join(self.path,d))]);
+    def get_parameterIds(self, simulation_id_I):
+        '''return the parameter ids of a simulation (None if they were not stored)'''
+        if self.format == 'hdf5':
+            with h5py.File(self.path,'r') as store:
+                if not 'parameter_ids' in store[simulation_id_I]: return None;
+                return [p.decode('utf-8') if isinstance(p,bytes) else p for p in store[simulation_id_I]['parameter_ids'][()]];
+        filename = os.path.join(self.path, simulation_id_I, 'parameter_ids.txt');
+        if not os.path.isfile(filename): return None;
+        with open(filename,'r') as f:
+            return f.read().split('\n');
+    def read_matrix(self, simulation_id_I, matrix_I='cov', rows_I=slice(None), columns_I=slice(None)):
+        '''read (a block of) a matrix of a simulation
+        INPUT:
+        simulation_id_I = string, simulation_id
+        matrix_I = string, name of the matrix (cov, cor, or chi2s)
+        rows_I = int or slice, parameter index/indices of the rows
+        columns_I = int or slice, parameter index/indices of the columns
+        OUTPUT:
+        numpy array; only the chunks (hdf5) or pages (npy) of the block are read'''
+        if self.format == 'hdf5':
+            with h5py.File(self.path,'r') as store:
+                return store[simulation_id_I][matrix_I][rows_I,columns_I];
+        matrix = numpy.load(os.path.join(self.path, simulation_id_I, matrix_I + '.npy'), mmap_mode='r');
+        return numpy.array(matrix[rows_I,columns_I]);
+    def read_row(self, simulation_id_I, index_I, matrix_I='cov'):
+        '''read the row of a parameter'''
+        return self.read_matrix(simulation_id_I, matrix_I, rows_I=index_I);
+    def read_column(self, simulation_id_I, index_I, matrix_I='cov'):
+        '''read the column of a parameter'''
+        return self.read_matrix(simulation_id_I, matrix_I, columns_I=index_I);
+    def _get_shape(self, rows_I):
+        '''return the shape of the matrix that holds the rows (None if all rows are empty)'''
+        ncolumns = max([int(numpy.prod(row.shape)) for row in rows_I] + [0]);
+        if not rows_I or not ncolumns: return None;
+        return (len(rows_I), ncolumns);
+    def _write_rows(self, matrix_I, rows_I):
+        '''write the rows in blocks of chunk_size rows so that the full matrix is never held
+        in memory and each (compressed) chunk is only written once'''
+        nrows = min(self.chunk_size, matrix_I.shape[0]);
+        block = numpy.empty((nrows, matrix_I.shape[1]), dtype=numpy.float64);
+        for start in range(0, len(rows_I), nrows):
+            stop = min(start + nrows, len(rows_I));
+            block[:] = numpy.nan;
+            for cnt,row in enumerate(rows_I[start:stop]):
+                size = int(numpy.prod(row.shape));
+                if not size: continue;
+                block[cnt,:size] = numpy.asarray(row, dtype=numpy.float64).ravel();
+            matrix_I[start:stop,:] = block[:stop-start,:];
@@ -0,0 +1,61 @@
+# System
+import re
+# Dependencies from 3rd party
+from molmass.molmass import Formula
+
+from .INCA_cache import inca_lruCache
+from .INCA_profiler import null_profiler
+class inca_fragment():
+    '''parser for the INCA ids of MS fragments
+    (e.g., glu_DASH_L_c_C5H10N2O3_0_1.0 or glu_DASH_L_c_MRM_C5H10N2O3_0_1.0_expt)
+    The parsed fragment ids and the formula masses are kept in bounded LRU caches
+    because the same fragments repeat for every mass, time point, and experiment'''
+    def __init__(self, maxsize_I=4096):
+        # precompiled patterns to decode/encode the INCA fragment ids
+        self.decode_patterns = [(re.compile('_DASH_'),'-'),
+            (re.compile('_LPARANTHES_'),'[(]'),
+            (re.compile('_RPARANTHES_'),'[)]')];
+        self.encode_patterns = [(re.compile('-'),'_DASH_'),
+            (re.compile('[(]'),'_LPARANTHES_'),
+            (re.compile('[)]'),'_RPARANTHES_')];
+        self.fragments = inca_lruCache(maxsize_I);
+        self.formulas = inca_lruCache(maxsize_I);
+        self.profiler = null_profiler; # records the parsed fragments and formula masses (cache misses)
+    def parse_fragmentString(self, fragment_string_I):
+        '''parse an INCA fragment string into the fragment_id, formula, mass, and time_point
+        INPUT:
+        fragment_string_I = string, id of the MS measurement or fragment part of the Norm parameter id
+        OUTPUT:
+        (fragment_id, formula, fragment_mass, time_point)'''
+        return self.fragments.get_or_compute(fragment_string_I, self._parse_fragmentString, fragment_string_I);
+    def get_formulaMass(self, formula_I):
+        '''return the (cached) mass of a formula'''
+        return self.formulas.get_or_compute(formula_I, self._get_formulaMass, formula_I);
+    def get_cacheStatistics(self):
+        '''return the hit/miss counters of the fragment and formula caches
+        OUTPUT:
+        statistics_O = {}, fragments = {}, formulas = {}'''
+        return {'fragments':self.fragments.get_statistics(),
+            'formulas':self.formulas.get_statistics()};
+    def _get_formulaMass(self, formula_I):
+        with self.profiler.stage('import.formula_mass',1):
+            return Formula(formula_I).mass;
+    def _parse_fragmentString(self, fragment_string_I):
+        self.profiler.count('import.fragment_parse');
+        fragment_string = fragment_string_I;
+        for pattern,repl in self.decode_patterns:
+            fragment_string = pattern.sub(repl,fragment_string);
+        fragment_list = fragment_string.split('_');
+        if not len(fragment_list)>5 or not ('MRM' in fragment_list or 'EPI' in fragment_list):
+            fragment_id = '_'.join([fragment_list[0],fragment_list[1],fragment_list[2]])
+            formula = fragment_list[2];
+            fragment_mass = self.get_formulaMass(formula) + float(fragment_list[3]);
+            time_point = fragment_list[4];
+        else:
+            fragment_id = '_'.join([fragment_list[0],fragment_list[1],fragment_list[2],fragment_list[3]])
+            formula = fragment_list[2];
+            fragment_mass = self.get_formulaMass(formula) + float(fragment_list[4]);
+            time_point = fragment_list[5];
+        for pattern,repl in self.encode_patterns:
+            fragment_id = pattern.sub(repl,fragment_id);
+        return (fragment_id, formula, fragment_mass, time_point);
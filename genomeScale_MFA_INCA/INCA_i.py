@@ -1,14 +1,72 @@
 # System
+import os
 from copy import copy
 from math import isnan, isinf
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import traceback
 # Dependencies from 3rd party
-from molmass.molmass import Formula
-import scipy.io
 import numpy
-import h5py
+
+from .INCA_mat import read_INCAResults
+from .INCA_table import inca_table
+from .INCA_fragment import inca_fragment
+from .INCA_profiler import null_profiler
+def _import_isotopomerSimulationResults_job(job_I, columnar_I=False, tables_I=None):
+    '''import a single (simulation_id, filename, simulation_info[, model_rxn_conversion]) job
+    (module level so that it can be sent to worker processes)
+    OUTPUT:
+    tables_O = {}, table name: [] of rows (None if the import failed)
+    error_O = string, description of the failure (None if the import succeeded)'''
+    try:
+        importer = inca_i();
+        importer.import_isotopomerSimulationResults_INCA(*job_I, columnar_I=columnar_I, tables_I=tables_I);
+        if not importer.simulationParameters:
+            return None, 'failed to import ' + str(job_I[1]);
+        return importer.get_tables(), None;
+    except Exception as e:
+        return None, traceback.format_exc();
+def _table_property(table_I):
+    '''return the property of a result table of inca_i
+    (tables that were requested in lazy mode are imported on first access)'''
+    def get_table(self):
+        if table_I in self._pending:
+            self._import_pending(self._pending[table_I]);
+        return self._tables[table_I];
+    def set_table(self, rows_I):
+        if self._pending.pop(table_I, None) is not None and not self._pending:
+            self._close_pending();
+        self._tables[table_I] = rows_I;
+    return property(get_table, set_table);
+def _import_isotopomerSimulationResults_isolated(job_I, columnar_I=False, tables_I=None):
+    '''import a single job in its own worker process
+    (used to retry the jobs of a pool whose worker died, so that a job that kills its worker only fails itself)
+    OUTPUT:
+    tables_O, error_O = see _import_isotopomerSimulationResults_job'''
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return executor.submit(_import_isotopomerSimulationResults_job, job_I, columnar_I, tables_I).result();
+    except Exception:
+        return None, traceback.format_exc();
 class inca_i():
+    # sections of the result file: tables that are imported from the section
+    _import_sections = [('fit',['fittedData']),
+        ('measurements',['fittedMeasuredFluxes','fittedMeasuredFragments']),
+        ('residuals',['fittedMeasuredFluxResiduals','fittedMeasuredFragmentResiduals']),
+        ('parameters',['fittedFluxes','fittedFragments'])];
+    fittedData = _table_property('fittedData');
+    fittedFluxes = _table_property('fittedFluxes');
+    fittedFragments = _table_property('fittedFragments');
+    fittedMeasuredFluxes = _table_property('fittedMeasuredFluxes');
+    fittedMeasuredFragments = _table_property('fittedMeasuredFragments');
+    fittedMeasuredFluxResiduals = _table_property('fittedMeasuredFluxResiduals');
+    fittedMeasuredFragmentResiduals = _table_property('fittedMeasuredFragmentResiduals');
+    simulationParameters = _table_property('simulationParameters');
     def __init__(self):
+        self._tables={}; # table name: rows
+        self._pending={}; # table name: section of the tables that are imported on first access (lazy mode)
+        self._pending_arguments=None;
         self.fittedData=[];
         self.fittedFluxes=[];
         self.fittedFragments=[];
@@ -17,16 +75,181 @@ class inca_i():
         self.fittedMeasuredFluxResiduals=[];
         self.fittedMeasuredFragmentResiduals=[];
         self.simulationParameters=[];
-    def import_isotopomerSimulationResults_INCA(self, simulation_id, filename, simulation_info, model_rxn_conversion_I=None):
+        self.fragmentParser=inca_fragment(); # shared by the MS residual and Norm parameter parsing
+        self.profiler=null_profiler; # see set_profiler
+    def set_profiler(self, profiler_I=None):
+        '''record the time and items of the import stages (import.loadmat, import.options, import.fit,
+        import.measurements, import.residuals, import.fragment_parse, import.formula_mass,
+        import.parameters, import.parameter_store, import.tables, and import.cache_hits)
+        with an inca_profiler (None: stop recording)'''
+        self.profiler = profiler_I if profiler_I is not None else null_profiler;
+        self.fragmentParser.profiler = self.profiler;
+    def get_tables(self):
+        '''return the result tables
+        OUTPUT:
+        tables_O = {}, table name: [] of rows'''
+        tables_O = {'fittedData':self.fittedData,
+            'fittedFluxes':self.fittedFluxes,
+            'fittedFragments':self.fittedFragments,
+            'fittedMeasuredFluxes':self.fittedMeasuredFluxes,
+            'fittedMeasuredFragments':self.fittedMeasuredFragments,
+            'fittedMeasuredFluxResiduals':self.fittedMeasuredFluxResiduals,
+            'fittedMeasuredFragmentResiduals':self.fittedMeasuredFragmentResiduals,
+            'simulationParameters':self.simulationParameters};
+        return tables_O;
+    def set_tables(self, tables_I):
+        '''set the result tables
+        INPUT:
+        tables_I = {}, table name: [] of rows (as returned by get_tables())'''
+        self.fittedData=tables_I['fittedData'];
+        self.fittedFluxes=tables_I['fittedFluxes'];
+        self.fittedFragments=tables_I['fittedFragments'];
+        self.fittedMeasuredFluxes=tables_I['fittedMeasuredFluxes'];
+        self.fittedMeasuredFragments=tables_I['fittedMeasuredFragments'];
+        self.fittedMeasuredFluxResiduals=tables_I['fittedMeasuredFluxResiduals'];
+        self.fittedMeasuredFragmentResiduals=tables_I['fittedMeasuredFragmentResiduals'];
+        self.simulationParameters=tables_I['simulationParameters'];
+    def import_isotopomerSimulationResults_batch(self, jobs_I, n_workers_I=None, columnar_I=False, importCache_I=None,
+                                                 tables_I=None):
+        '''import results from many fluxomics simulations using a pool of worker processes
+        INPUT:
+        jobs_I = [], of (simulation_id, filename, simulation_info) tuples
+            (an optional 4th element is passed as model_rxn_conversion_I)
+        n_workers_I = int, number of worker processes
+            (default: number of cpus; 1 imports the jobs in the current process)
+        columnar_I = boolean, store the tables as inca_table instead of lists of dicts
+        importCache_I = optional inca_importCache; jobs whose file and arguments are unchanged
+            are served from the cache, and only the remaining jobs are imported (and cached)
+            (only used if all the tables are imported)
+        tables_I = optional [], names of the tables to import (see import_isotopomerSimulationResults_INCA)
+        OUTPUT:
+        errors_O = [], of {'simulation_id','filename','error'} for each job that failed
+        Note: the tables of the successful jobs are merged in the order of jobs_I
+        (independent of the order in which the workers complete)'''
+        results = [None]*len(jobs_I);
+        if tables_I is not None:
+            importCache_I = None;
+        if importCache_I is not None:
+            for cnt,job in enumerate(jobs_I):
+                job_tables = importCache_I.get(*job[:3], model_rxn_conversion_I=job[3] if len(job)>3 else None, columnar_I=columnar_I);
+                if job_tables is not None:
+                    results[cnt] = (job_tables, None);
+        misses = [cnt for cnt,result in enumerate(results) if result is None];
+        jobs = [jobs_I[cnt] for cnt in misses];
+        if n_workers_I == 1 or len(jobs) < 2:
+            imported = [_import_isotopomerSimulationResults_job(job, columnar_I, tables_I) for job in jobs];
+        else:
+            imported = [None]*len(jobs);
+            broken = [];
+            with ProcessPoolExecutor(max_workers=n_workers_I) as executor:
+                futures = [executor.submit(_import_isotopomerSimulationResults_job, job, columnar_I, tables_I) for job in jobs];
+                for cnt,future in enumerate(futures):
+                    try:
+                        imported[cnt] = future.result();
+                    except BrokenProcessPool:
+                        broken.append(cnt);
+                    except Exception:
+                        imported[cnt] = (None, traceback.format_exc());
+            # a worker died (e.g., out of memory or a crash on a corrupt file) and the pool cannot run
+            # the unfinished jobs: retry each of them in its own worker process
+            for cnt in broken:
+                imported[cnt] = _import_isotopomerSimulationResults_isolated(jobs[cnt], columnar_I, tables_I);
+        for cnt,job,result in zip(misses,jobs,imported):
+            results[cnt] = result;
+            if importCache_I is not None and result[1] is None:
+                importCache_I.set(*job[:3], result[0], model_rxn_conversion_I=job[3] if len(job)>3 else None, columnar_I=columnar_I,
+                    flush_I=False);
+        if importCache_I is not None:
+            # one manifest write for all the hits and new entries of the batch
+            importCache_I.flush();
+        # merge the tables
+        tables = {table:self._make_table(columnar_I) for table in self.get_tables().keys()};
+        errors_O = [];
+        for job,(job_tables,error) in zip(jobs_I,results):
+            if error:
+                print('failed to import', job[0], 'from', job[1]);
+                errors_O.append({'simulation_id':job[0],'filename':job[1],'error':error});
+                continue;
+            for table,rows in job_tables.items():
+                tables[table].extend(rows);
+        if columnar_I:
+            for table in tables.values():
+                table.flush();
+        self.set_tables(tables);
+        return errors_O;
+    def import_isotopomerSimulationResults_best(self, simulation_id, filenames_I, simulation_info,
+                                                columnar_I=False, parameterStore_I=None):
+        '''import the best fit (lowest chi2) among the results of several parameter estimations of a simulation
+        (e.g., the partial results of the jobs of inca_api.writeScripts_parameterEstimationArray_Inca)
+        INPUT:
+        simulation_id = string, simulation_id
+        filenames_I = [], names of the matlab files (missing files, e.g., of failed jobs, are skipped)
+        simulation_info = {}, see import_isotopomerSimulationResults_INCA
+        columnar_I, parameterStore_I = see import_isotopomerSimulationResults_INCA
+        OUTPUT:
+        fits_O = [], of {} filename, fitted_chi2 (None if the file is missing or could not be imported),
+            and best (True for the imported file), in the order of filenames_I
+        Note: only the fit statistics (fittedData) of each file are read to select the best fit'''
+        fits_O = [];
+        for filename in filenames_I:
+            fitted_chi2 = None;
+            if os.path.isfile(filename):
+                try:
+                    importer = inca_i();
+                    importer.import_isotopomerSimulationResults_INCA(simulation_id, filename, simulation_info,
+                        tables_I=['fittedData']);
+                    if importer.fittedData:
+                        fitted_chi2 = importer.fittedData[0]['fitted_chi2'];
+                except Exception:
+                    print('failed to import', filename);
+            fits_O.append({'filename':filename,'fitted_chi2':fitted_chi2,'best':False});
+        fits = [fit for fit in fits_O if fit['fitted_chi2'] is not None and not isnan(fit['fitted_chi2'])];
+        if not fits:
+            print('no parameter estimation results were found');
+            return fits_O;
+        best = min(fits, key=lambda fit: fit['fitted_chi2']);
+        best['best'] = True;
+        self.import_isotopomerSimulationResults_INCA(simulation_id, best['filename'], simulation_info,
+            columnar_I=columnar_I, parameterStore_I=parameterStore_I);
+        return fits_O;
+    def _make_table(self, columnar_I=False):
+        '''return an empty result table'''
+        if columnar_I:
+            return inca_table();
+        return [];
+    def import_isotopomerSimulationResults_INCA(self, simulation_id, filename, simulation_info, model_rxn_conversion_I=None,
+                                                columnar_I=False, parameterStore_I=None, importCache_I=None,
+                                                tables_I=None, lazy_I=False):
         '''import results from a fluxomics simulation using INCA1.3
         INPUT:
         simulation_id = string, simulation_id
         filename = string, name of the matlab file
         simulation_info = {},
         model_rxn_conversion_I = optional {}, of INCA rxn_ids to model_rxn_ids (deprecated)
+        columnar_I = boolean, store the tables as inca_table (typed column arrays with
+            categorical ids) instead of lists of dicts; use inca_table.to_dicts() to obtain the rows
+        parameterStore_I = optional inca_covariance, store for the parameter covariance, correlation,
+            and chi2s matrices; if given, the matrices are written once for the simulation_id and
+            fit_cov/fit_cor/fit_chi2s of the parameter rows hold the index of the parameter in the store
+        importCache_I = optional inca_importCache; if the file (path, size, mtime, and optional hash)
+            and the arguments (including the parameterStore_I) are unchanged since the last import,
+            the cached tables are used instead of parsing the file; the cache is not used if the
+            parameterStore_I does not hold the matrices of the simulation_id (they are then written again);
+            only used if all the tables are imported (tables_I = None and lazy_I = False);
+            cache hits are recorded in the manifest by importCache_I.flush() (or on exit of a with block)
+        tables_I = optional [], names of the tables to import (default: all tables);
+            the sections of the file that only feed other tables are not read
+            (e.g., ['fittedData','fittedFluxes'] skips the measurements, the residuals (f.mnt.res),
+            and the parsing of the MS fragment ids); the other tables are left empty,
+            except for simulationParameters, which is always imported
+        lazy_I = boolean, import the sections of the requested tables on first access
+            of the tables (e.g., inca_i.fittedFluxes) instead of during the import;
+            the file is kept open until all the requested tables have been accessed
         Note: Please reference the model, fitdata, and simdata class structures in the INCA documentation
         for further information on the .mat file structure'''
 
+        # close the file of a previous lazy import whose tables were not all accessed
+        self._close_pending();
         # extract information about the file
         import os, time
         from datetime import datetime
@@ -40,6 +263,16 @@ class inca_i():
             file_size = st[ST_SIZE]
             simulation_dateAndTime_struct = time.localtime(st[ST_MTIME])
             simulation_dateAndTime = datetime.fromtimestamp(time.mktime(simulation_dateAndTime_struct))
+        full_import = tables_I is None and not lazy_I;
+        if importCache_I is not None and full_import and (parameterStore_I is None or
+                simulation_id in parameterStore_I.get_simulationIds()):
+            tables = importCache_I.get(simulation_id, filename, simulation_info, model_rxn_conversion_I, columnar_I,
+                parameterStore_I=parameterStore_I);
+            if tables is not None:
+                self.profiler.count('import.cache_hits');
+                self.set_tables(tables);
+                return;
+        profiler = self.profiler;
         # determine if the simulation is a parallel labeling experiment, non-stationary, or both
         parallel = False;
         non_stationary = False;
@@ -48,78 +281,116 @@ class inca_i():
         if len(simulation_info['time_point'])>1:
             non_stationary = True;
         # extract out simulation data
-        m = scipy.io.loadmat(filename)['m']; #model
-        f = scipy.io.loadmat(filename)['f']; #fitdata
-        s = scipy.io.loadmat(filename)['s']; #simdata
-        # extract out model information (not currently recorded)
-        m_ms_id = [];
-        m_ms_on = [];
-        m_ms_expt = [];
-        for exp in m['expts']:
-            exp_id = exp[0][0]['id'][0][0]
-            for d in exp[0][0]['data_ms'][0]['id'][0]:
-                m_ms_expt.append(exp_id);
-                m_ms_id.append(d[0]);
-                m_ms_on.append(bool(d[0][0]));
+        # (.mat files are parsed in a single pass without s = simdata;
+        # v7.3/HDF5 files are read lazily)
+        profiler.start('import.loadmat');
+        mat = read_INCAResults(filename,variable_names_I=['m','f']);
+        profiler.stop('import.loadmat');
         # extract out simulation parameters (options)
+        profiler.start('import.options');
+        options = mat.get_options();
         m_options = {
-                    'cont_alpha':float(m['options'][0][0][0]['cont_alpha'][0][0][0]),
-                    'cont_reltol':float(m['options'][0][0][0]['cont_reltol'][0][0][0]),
-                    'cont_steps':float(m['options'][0][0][0]['cont_steps'][0][0][0]),
-                    'fit_nudge':float(m['options'][0][0][0]['fit_nudge'][0][0][0]),
-                    'fit_reinit':bool(m['options'][0][0][0]['fit_reinit'][0][0][0]),
-                    'fit_reltol':float(m['options'][0][0][0]['fit_reltol'][0][0][0]),
-                    'fit_starts':float(m['options'][0][0][0]['fit_starts'][0][0][0]),
-                    'fit_tau':float(m['options'][0][0][0]['fit_tau'][0][0][0]),
-                    'hpc_on':bool(m['options'][0][0][0]['hpc_on'][0][0][0]),
-                    'int_maxstep':float(m['options'][0][0][0]['int_maxstep'][0][0][0]),
-                    'int_reltol':float(m['options'][0][0][0]['int_reltol'][0][0][0]),
-                    'int_senstol':float(m['options'][0][0][0]['int_senstol'][0][0][0]),
-                    'int_timeout':float(m['options'][0][0][0]['int_timeout'][0][0][0]),
-                    'int_tspan':float(m['options'][0][0][0]['int_tspan'][0][0][0]),
-                    'ms_correct':bool(m['options'][0][0][0]['ms_correct'][0][0][0]),
-                    'oed_crit':m['options'][0][0][0]['oed_crit'][0][0],
-                    'oed_reinit':bool(m['options'][0][0][0]['oed_reinit'][0][0][0]),
-                    'oed_tolf':float(m['options'][0][0][0]['oed_tolf'][0][0][0]),
-                    'oed_tolx':float(m['options'][0][0][0]['oed_tolx'][0][0][0]),
-                    'sim_more':bool(m['options'][0][0][0]['sim_more'][0][0][0]),
-                    'sim_na':bool(m['options'][0][0][0]['sim_na'][0][0][0]),
-                    'sim_sens':bool(m['options'][0][0][0]['sim_sens'][0][0][0]),
-                    'sim_ss':bool(m['options'][0][0][0]['sim_ss'][0][0][0]),
-                    'sim_tunit':m['options'][0][0][0]['sim_tunit'][0][0]
+                    'cont_alpha':float(options['cont_alpha']),
+                    'cont_reltol':float(options['cont_reltol']),
+                    'cont_steps':float(options['cont_steps']),
+                    'fit_nudge':float(options['fit_nudge']),
+                    'fit_reinit':bool(options['fit_reinit']),
+                    'fit_reltol':float(options['fit_reltol']),
+                    'fit_starts':float(options['fit_starts']),
+                    'fit_tau':float(options['fit_tau']),
+                    'hpc_on':bool(options['hpc_on']),
+                    'int_maxstep':float(options['int_maxstep']),
+                    'int_reltol':float(options['int_reltol']),
+                    'int_senstol':float(options['int_senstol']),
+                    'int_timeout':float(options['int_timeout']),
+                    'int_tspan':float(options['int_tspan']),
+                    'ms_correct':bool(options['ms_correct']),
+                    'oed_crit':options['oed_crit'],
+                    'oed_reinit':bool(options['oed_reinit']),
+                    'oed_tolf':float(options['oed_tolf']),
+                    'oed_tolx':float(options['oed_tolx']),
+                    'sim_more':bool(options['sim_more']),
+                    'sim_na':bool(options['sim_na']),
+                    'sim_sens':bool(options['sim_sens']),
+                    'sim_ss':bool(options['sim_ss']),
+                    'sim_tunit':options['sim_tunit']
                     };
-        try: m_options['hpc_mcr']=m['options'][0][0][0]['hpc_mcr'][0][0] #deprecated in INCA1.4
-        except Exception as e:
-            m_options['hpc_mcr']=float(m['options'][0][0][0]['hpc_bg'][0][0][0])
-        try: m_options['hpc_serve']=m['options'][0][0][0]['hpc_serve'][0][0]#deprecated in INCA1.4
-        except Exception as e:
-            m_options['hpc_serve']=m['options'][0][0][0]['hpc_sched'][0][0]
-        #if 'hpc_mcr' in m['options'][0][0][0]:
-        #    m_options['hpc_mcr']=m['options'][0][0][0]['hpc_mcr'][0][0] #deprecated in INCA1.4
-        #else:
-        #    m_options['hpc_mcr']=float(m['options'][0][0][0]['hpc_bg'][0][0][0])
-        #if 'hpc_serve' in m['options'][0][0][0]:
-        #    m_options['hpc_serve']=m['options'][0][0][0]['hpc_serve'][0][0]#deprecated in INCA1.4
-        #else:
-        #    m_options['hpc_serve']=m['options'][0][0][0]['hpc_sched'][0][0]
-        simulationParameters = [];
+        if 'hpc_mcr' in options: m_options['hpc_mcr']=options['hpc_mcr'] #deprecated in INCA1.4
+        else: m_options['hpc_mcr']=float(options['hpc_bg'])
+        if 'hpc_serve' in options: m_options['hpc_serve']=options['hpc_serve'] #deprecated in INCA1.4
+        else: m_options['hpc_serve']=options['hpc_sched']
+        simulationParameters = self._make_table(columnar_I);
         m_options.update({'simulation_id':simulation_id,
 		'simulation_dateAndTime':simulation_dateAndTime,
 		'original_filename':filename,
                     'used_':True,
                     'comment_':None});
         simulationParameters.append(m_options);
+        profiler.stop('import.options',1);
+        # import the sections of the requested tables
+        if tables_I is None:
+            tables_I = list(self._tables.keys());
+        tables = dict([(table,self._make_table(columnar_I)) for table in self._tables.keys()]);
+        tables['simulationParameters'] = simulationParameters;
+        arguments = (mat, simulation_id, simulation_dateAndTime, simulation_info, tables_I, columnar_I, parameterStore_I);
+        sections = [section for section,section_tables in self._import_sections
+            if [table for table in section_tables if table in tables_I]];
+        if not lazy_I:
+            for section in sections:
+                tables.update(getattr(self, '_import_' + section)(*arguments));
+        # add data to the database
+        profiler.start('import.tables');
+        self._set_importedTables(tables, columnar_I);
+        if lazy_I:
+            # import the sections on first access of their tables
+            for section,section_tables in self._import_sections:
+                if section in sections:
+                    for table in section_tables:
+                        if table in tables_I:
+                            self._pending[table] = section;
+            self._pending_arguments = arguments;
+        if not self._pending:
+            mat.close();
+        profiler.stop('import.tables',sum([len(table) for table in tables.values()]));
+        if importCache_I is not None and simulationParameters and full_import:
+            importCache_I.set(simulation_id, filename, simulation_info, self.get_tables(), model_rxn_conversion_I, columnar_I,
+                parameterStore_I=parameterStore_I);
+    def _import_pending(self, section_I):
+        '''import the section of a table that was not imported yet (lazy mode)'''
+        arguments = self._pending_arguments;
+        columnar_I = arguments[5];
+        tables = getattr(self, '_import_' + section_I)(*arguments);
+        tables = dict([(table,rows) for table,rows in tables.items() if self._pending.get(table) == section_I]);
+        for table in tables.keys():
+            del self._pending[table];
+        self._set_importedTables(tables, columnar_I);
+        if not self._pending:
+            self._close_pending();
+    def _close_pending(self):
+        '''close the file of a lazy import and drop the tables that were not imported yet'''
+        if self._pending_arguments is not None:
+            self._pending_arguments[0].close();
+            self._pending_arguments = None;
+        self._pending = {};
+    def _set_importedTables(self, tables_I, columnar_I):
+        '''set the imported tables'''
+        for table,rows in tables_I.items():
+            if columnar_I:
+                rows.flush();
+            setattr(self, table, rows);
+    def _import_fit(self, mat, simulation_id, simulation_dateAndTime, simulation_info, tables_I, columnar_I, parameterStore_I):
+        '''import the fit statistics (fittedData)'''
+        profiler = self.profiler;
         # extract out fit information
-        fittedData = [];
+        profiler.start('import.fit');
+        fittedData = self._make_table(columnar_I);
+        fit = mat.get_fit();
         f_Echi2 = None;
-        if not isnan(f['Echi2'][0][0][0][0]):
-            if len(f['Echi2'][0][0][0])>1:
-                f_Echi2 = [f['Echi2'][0][0][0][0],f['Echi2'][0][0][0][1]];
-            else:
-                f_Echi2 = [f['Echi2'][0][0][0][0]];
-        f_alf = f['alf'][0][0][0][0];
-        f_chi2 = f['chi2'][0][0][0][0];
-        f_dof = int(f['dof'][0][0][0][0]);
+        if not isnan(fit['Echi2'][0]):
+            f_Echi2 = fit['Echi2'][:2];
+        f_alf = fit['alf'];
+        f_chi2 = fit['chi2'];
+        f_dof = int(fit['dof']);
         f_ = {'fitted_echi2':f_Echi2,
         'fitted_alf':f_alf,
         'fitted_chi2':f_chi2,
@@ -128,24 +399,24 @@ class inca_i():
                     'used_':True,
                     'comment_':None})
         fittedData.append(f_);
+        profiler.stop('import.fit',1);
+        return {'fittedData':fittedData};
+    def _import_measurements(self, mat, simulation_id, simulation_dateAndTime, simulation_info, tables_I, columnar_I, parameterStore_I):
+        '''import the sum of the squared residuals of the measurements (fittedMeasuredFluxes and fittedMeasuredFragments)'''
+        profiler = self.profiler;
         # extract out sum of the squared residuals of the fitted measurements
-        f_mnt_id = [];
-        f_mnt_sres = [];
-        f_mnt_expt = [];
-        f_mnt_type = []; #Flux or MS
-        for d in f['mnt'][0][0][0]['id']:
-            f_mnt_id.append(d[0]);
-        for d in f['mnt'][0][0][0]['sres']:
-            f_mnt_sres.append(float(d[0][0]));
-        for d in f['mnt'][0][0][0]['expt']:
-            f_mnt_expt.append(d[0]);
-        for d in f['mnt'][0][0][0]['type']:
-            f_mnt_type.append(d[0]);
+        profiler.start('import.measurements');
+        mnt = mat.get_measurements();
+        f_mnt_id = mnt['id'];
+        f_mnt_sres = mnt['sres'];
+        f_mnt_expt = mnt['expt'];
+        f_mnt_type = mnt['type']; #Flux or MS
         # seperate into appropriate table rows
-        fittedMeasuredFluxes = [];
-        fittedMeasuredFragments = [];
+        fittedMeasuredFluxes = self._make_table(columnar_I);
+        fittedMeasuredFragments = self._make_table(columnar_I);
         for cnt,type in enumerate(f_mnt_type):
             if type=='Flux':
+                if not 'fittedMeasuredFluxes' in tables_I: continue;
                 if f_mnt_expt[cnt] in simulation_info['experiment_id']:
                     fittedMeasuredFluxes.append({'simulation_id':simulation_id,
                     'simulation_dateAndTime':simulation_dateAndTime,
@@ -165,6 +436,7 @@ class inca_i():
                     'used_':True,
                     'comment_':None})
             elif type=='MS':
+                if not 'fittedMeasuredFragments' in tables_I: continue;
                 if f_mnt_expt[cnt] in simulation_info['experiment_id']:
                     fittedMeasuredFragments.append({'simulation_id':simulation_id,
                     'simulation_dateAndTime':simulation_dateAndTime,
@@ -185,43 +457,42 @@ class inca_i():
                     'comment_':None})
             else:
                 print('type not recognized');
+        profiler.stop('import.measurements',len(f_mnt_type));
+        return {'fittedMeasuredFluxes':fittedMeasuredFluxes,'fittedMeasuredFragments':fittedMeasuredFragments};
+    def _import_residuals(self, mat, simulation_id, simulation_dateAndTime, simulation_info, tables_I, columnar_I, parameterStore_I):
+        '''import the residuals of the measurements (fittedMeasuredFluxResiduals and fittedMeasuredFragmentResiduals)'''
+        profiler = self.profiler;
         # extract out the residuals of the fitted measurements
-        f_mnt_res_val = [];
-        f_mnt_res_fit = [];
-        f_mnt_res_type = []; #Flux or MS
-        f_mnt_res_id = [];
-        f_mnt_res_std = [];
+        profiler.start('import.residuals');
+        res = mat.get_residuals();
+        f_mnt_res_val = res['val'];
+        f_mnt_res_fit = res['fit'];
+        f_mnt_res_type = res['type']; #Flux or MS
+        f_mnt_res_id = res['id'];
+        f_mnt_res_std = res['std'];
         f_mnt_res_time = [];
         f_mnt_res_expt = [];
-        f_mnt_res_data = [];
-        #f_mnt_res_esens = [];
+        f_mnt_res_data = res['data'];
+        #f_mnt_res_esens = []; #not needed, and matlab->python conversion has several bugs
         #f_mnt_res_msens = [];
-        f_mnt_res_peak = [];
-        for d in f['mnt'][0][0][0]['res']: 
-            f_mnt_res_val.append(float(d[0][0]['val'][0][0]));
-            f_mnt_res_fit.append(float(d[0][0]['fit'][0][0]));
-            f_mnt_res_type.append(d[0][0]['type'][0]);
-            f_mnt_res_id.append(d[0][0]['id'][0]);
-            f_mnt_res_std.append(float(d[0][0]['std'][0][0]));
+        f_mnt_res_peak = res['peak'];
+        for time in res['time']:
             #change default of time inf to 0
-            if isinf(d[0][0]['time'][0][0]):
+            if isinf(time):
                 f_mnt_res_time.append('0');
             else:
-                f_mnt_res_time.append(str(d[0][0]['time'][0][0]));
-            if d[0][0]['expt'][0] == 'Expt #1':
+                f_mnt_res_time.append(str(time));
+        for expt in res['expt']:
+            if expt == 'Expt #1':
                 f_mnt_res_expt.append(simulation_info['experiment_id'][0]);
             else:
-                f_mnt_res_expt.append(d[0][0]['expt'][0]);
-            f_mnt_res_data.append(d[0][0]['data'][0][0]);
-            #f_mnt_res_esens.append(d[0][0]['esens'].data); #not needed, and matlab->python conversion has several bugs
-            #f_mnt_res_msens.append(d[0][0]['msens'].data);
-            if d[0][0]['peak']: f_mnt_res_peak.append(d[0][0]['peak'][0]);
-            else: f_mnt_res_peak.append(None);
+                f_mnt_res_expt.append(expt);
         # seperate into appropriate table rows
-        fittedMeasuredFluxResiduals = [];
-        fittedMeasuredFragmentResiduals = [];
+        fittedMeasuredFluxResiduals = self._make_table(columnar_I);
+        fittedMeasuredFragmentResiduals = self._make_table(columnar_I);
         for cnt,type in enumerate(f_mnt_res_type):
             if type=='Flux':
+                if not 'fittedMeasuredFluxResiduals' in tables_I: continue;
                 if f_mnt_res_expt[cnt] in simulation_info['experiment_id']:
                     fittedMeasuredFluxResiduals.append({'simulation_id':simulation_id,
                     'simulation_dateAndTime':simulation_dateAndTime,
@@ -259,25 +530,9 @@ class inca_i():
                     'used_':True,
                     'comment_':None})
             elif type=='MS':
+                if not 'fittedMeasuredFragmentResiduals' in tables_I: continue;
                 # parse the id into fragment_id and mass
-                fragment_string = f_mnt_res_id[cnt]
-                fragment_string = re.sub('_DASH_','-',fragment_string)
-                fragment_string = re.sub('_LPARANTHES_','[(]',fragment_string)
-                fragment_string = re.sub('_RPARANTHES_','[)]',fragment_string)
-                fragment_list = fragment_string.split('_');
-                if not len(fragment_list)>5 or not ('MRM' in fragment_list or 'EPI' in fragment_list):
-                    fragment_id = '_'.join([fragment_list[0],fragment_list[1],fragment_list[2]])
-                    fragment_mass = Formula(fragment_list[2]).mass + float(fragment_list[3]);
-                    time_point = fragment_list[4];
-                else:
-                    fragment_id = '_'.join([fragment_list[0],fragment_list[1],fragment_list[2],fragment_list[3]])
-                    fragment_mass = Formula(fragment_list[2]).mass + float(fragment_list[4]);
-                    time_point = fragment_list[5];
-                #exp_id = fragment_list[5];
-                #exp_id = fragment_list[6];
-                fragment_id = re.sub('-','_DASH_',fragment_id)
-                fragment_id = re.sub('[(]','_LPARANTHES_',fragment_id)
-                fragment_id = re.sub('[)]','_RPARANTHES_',fragment_id)
+                fragment_id,formula,fragment_mass,time_point = self.fragmentParser.parse_fragmentString(f_mnt_res_id[cnt]);
                 if f_mnt_res_expt[cnt] in simulation_info['experiment_id']:
                     fittedMeasuredFragmentResiduals.append({'simulation_id':simulation_id,
                     'simulation_dateAndTime':simulation_dateAndTime,
@@ -318,85 +573,58 @@ class inca_i():
                     'comment_':None})
             else:
                 print('type not recognized');
+        profiler.stop('import.residuals',len(f_mnt_res_type));
+        return {'fittedMeasuredFluxResiduals':fittedMeasuredFluxResiduals,'fittedMeasuredFragmentResiduals':fittedMeasuredFragmentResiduals};
+    def _import_parameters(self, mat, simulation_id, simulation_dateAndTime, simulation_info, tables_I, columnar_I, parameterStore_I):
+        '''import the fitted parameters (fittedFluxes and fittedFragments)'''
+        profiler = self.profiler;
         # extract out the fitted parameters
+        profiler.start('import.parameters');
+        par = mat.get_parameters(['id','val','std','type','lb','ub','unit','alf','free']);
+        if parameterStore_I:
+            with profiler.stage('import.parameter_store',len(par['id'])):
+                parameterStore_I.write_matrices(simulation_id,
+                    mat.get_parameters(['chi2s','cor','cov']),par['id']);
         f_par_id = [];
-        f_par_val = [];
-        f_par_std = [];
-        f_par_type = []; # 'Net flux' or 'Norm'
-        f_par_lb = [];
-        f_par_ub = [];
-        f_par_unit = [];
-        f_par_alf = [];
-        f_par_chi2s = [];
-        f_par_cor = [];
-        f_par_cov = [];
-        f_par_free = [];
-        for d in f['par'][0][0][0]['id']:
-            if 'Expt #1' in d[0]:
-                id_str = d[0].astype('str')
-                f_par_id.append(id_str.replace('Expt #1',simulation_info['experiment_id'][0]))
+        f_par_type = par['type']; # 'Net flux' or 'Norm'
+        f_par_alf = par['alf'].tolist();
+        f_par_free = numpy.nan_to_num(par['free'], nan=0.0).astype(bool).tolist(); # empty cells (NaN) are not free
+        for d in par['id']:
+            if 'Expt #1' in d:
+                f_par_id.append(d.replace('Expt #1',simulation_info['experiment_id'][0]))
             else:
-                f_par_id.append(d[0])
+                f_par_id.append(d)
         # ensure that there are no negative values or infinite values
-        for d in f['par'][0][0][0]['val']:
-            if not d:
-                f_par_val.append(0.0)
-            #elif isnan(d[0][0]) or d[0][0]<1.0e-6:
-            elif isnan(d[0][0]):
-                f_par_val.append(0.0)
-            #elif isinf(d[0][0]) or d[0][0]>1e3:
-            elif isinf(d[0][0]):
-                f_par_val.append(1.0e3)
-            else:
-                f_par_val.append(float(d[0][0]))
-        for d in f['par'][0][0][0]['std']:
-            if not d:
-                f_par_std.append(0.0)
-            elif isnan(d[0][0]):
-                f_par_val.append(0.0)
-            else:
-                f_par_std.append(float(d[0][0]))
-        for d in f['par'][0][0][0]['type']:
-            f_par_type.append(d[0])
+        # (empty cells are read as NaN)
+        f_par_val = par['val'];
+        #f_par_val[numpy.isnan(f_par_val) | (f_par_val<1.0e-6)] = 0.0;
+        f_par_val[numpy.isnan(f_par_val)] = 0.0;
+        #f_par_val[numpy.isinf(f_par_val) | (f_par_val>1.0e3)] = 1.0e3;
+        f_par_val[numpy.isinf(f_par_val)] = 1.0e3;
+        f_par_std = par['std'];
+        f_par_std[numpy.isnan(f_par_std)] = 0.0;
         #adjust the lb and ub to [0,1000];
-        for cnt,d in enumerate(f['par'][0][0][0]['lb']):
-            if not d:
-                f_par_lb.append(0.0)
-            #elif isnan(d[0][0]) or d[0][0]<1.0e-6:
-            elif isnan(d[0][0]):
-                f_par_lb.append(0.0)
-            else:
-                f_par_lb.append(float(d[0][0]))
-        for d in f['par'][0][0][0]['ub']:
-            if not d:
-                f_par_ub.append(1.0e3)
-            #elif isinf(d[0][0]) or isnan(d[0][0]) or d[0][0]>1.0e3:
-            elif isinf(d[0][0]) or isnan(d[0][0]):
-                f_par_ub.append(1.0e3)
-            else:
-                f_par_ub.append(float(d[0][0]))
-        for d in f['par'][0][0][0]['unit']:
-            if not d:
-                #f_par_unit.append(None);
-                #use default: mmol*gDCW-1*hr-1
-                f_par_unit.append('mmol*gDCW-1*hr-1');
-            else:
-                f_par_unit.append(d[0])
-        for d in f['par'][0][0][0]['alf']:
-            f_par_alf.append(float(d[0][0]))
-        for d in f['par'][0][0][0]['chi2s']:
-            f_par_chi2s.append(d)
-        for d in f['par'][0][0][0]['cor']:
-            f_par_cor.append(d)
-        for d in f['par'][0][0][0]['cov']:
-            f_par_cov.append(d)
-        for d in f['par'][0][0][0]['free']:
-            f_par_free.append(bool(d[0][0]))
+        f_par_lb = par['lb'];
+        #f_par_lb[numpy.isnan(f_par_lb) | (f_par_lb<1.0e-6)] = 0.0;
+        f_par_lb[numpy.isnan(f_par_lb)] = 0.0;
+        f_par_ub = par['ub'];
+        #f_par_ub[numpy.isinf(f_par_ub) | numpy.isnan(f_par_ub) | (f_par_ub>1.0e3)] = 1.0e3;
+        f_par_ub[numpy.isinf(f_par_ub) | numpy.isnan(f_par_ub)] = 1.0e3;
+        f_par_val = f_par_val.tolist();
+        f_par_std = f_par_std.tolist();
+        f_par_lb = f_par_lb.tolist();
+        f_par_ub = f_par_ub.tolist();
+        #use default for empty units: mmol*gDCW-1*hr-1
+        f_par_unit = [d if d is not None else 'mmol*gDCW-1*hr-1' for d in par['unit']];
         # seperate into appropriate table rows
-        fittedFluxes = [];
-        fittedFragments = [];
+        fittedFluxes = self._make_table(columnar_I);
+        fittedFragments = self._make_table(columnar_I);
         for cnt,type in enumerate(f_par_type):
+            # reference to the parameter matrices in the store (if any)
+            if parameterStore_I: f_par_matrix = cnt;
+            else: f_par_matrix = None;
             if type=='Net flux':
+                if not 'fittedFluxes' in tables_I: continue;
                 fittedFluxes.append({'simulation_id':simulation_id,
                 'simulation_dateAndTime':simulation_dateAndTime,
                 'rxn_id':f_par_id[cnt],
@@ -406,39 +634,23 @@ class inca_i():
                 'flux_ub':f_par_ub[cnt],
                 'flux_units':f_par_unit[cnt],
                 'fit_alf':f_par_alf[cnt],
-                'fit_chi2s':None,
-                #'fit_chi2s':f_par_chi2s[cnt],
-                'fit_cor':None,
-                'fit_cov':None,
-                #'fit_cor':f_par_cor[cnt],
-                #'fit_cov':f_par_cov[cnt],
+                'fit_chi2s':f_par_matrix,
+                'fit_cor':f_par_matrix,
+                'fit_cov':f_par_matrix,
                 'free':f_par_free[cnt],
                 'used_':True,
                 'comment_':None})
             elif type=='Norm':
+                if not 'fittedFragments' in tables_I: continue;
                 # parse the id 
                 id_list = f_par_id[cnt].split(' ');
                 expt = id_list[0];
                 fragment_id = id_list[1];
                 fragment_string = id_list[2];
                 units = id_list[3];
-                # parse the id into fragment_id and mass
-                fragment_string = re.sub('_DASH_','-',fragment_string)
-                fragment_string = re.sub('_LPARANTHES_','[(]',fragment_string)
-                fragment_string = re.sub('_RPARANTHES_','[)]',fragment_string)
-                fragment_list = fragment_string.split('_');
-                if not len(fragment_list)>5 or not ('MRM' in fragment_list or 'EPI' in fragment_list):
-                    fragment_mass = Formula(fragment_list[2]).mass + float(fragment_list[3]);
-                    time_point = fragment_list[4];
-                else:
-                    fragment_mass = Formula(fragment_list[2]).mass + float(fragment_list[4]);
-                    time_point = fragment_list[5];
-                #fragment_id = '_'.join([fragment_list[0],fragment_list[1],fragment_list[2],fragment_list[3]])
-                #fragment_id = re.sub('-','_DASH_',fragment_id)
-                #fragment_id = re.sub('[(]','_LPARANTHES_',fragment_id)
-                #fragment_id = re.sub('[)]','_RPARANTHES_',fragment_id)
-                #expt_id = fragment_list[5];
-                #expt_id = fragment_list[6];
+                # parse the id into mass and time_point
+                # (the fragment_id of the parameter id is used instead of the parsed fragment_id)
+                fragment_id_parsed,formula,fragment_mass,time_point = self.fragmentParser.parse_fragmentString(fragment_string);
                 if expt in simulation_info['experiment_id']:
                     fittedFragments.append({'simulation_id':simulation_id,
                     'simulation_dateAndTime':simulation_dateAndTime,
@@ -451,10 +663,8 @@ class inca_i():
                     'fit_stdev':f_par_std[cnt],
                     'fit_units':units,
                     'fit_alf':f_par_alf[cnt],
-                    'fit_cor':None,
-                    'fit_cov':None,
-                    #'fit_cor':f_par_cor[cnt],
-                    #'fit_cov':f_par_cov[cnt],
+                    'fit_cor':f_par_matrix,
+                    'fit_cov':f_par_matrix,
                     'free':f_par_free[cnt],
                     'used_':True,
                     'comment_':None})
@@ -470,21 +680,12 @@ class inca_i():
                     'fit_stdev':f_par_std[cnt],
                     'fit_units':units,
                     'fit_alf':f_par_alf[cnt],
-                    'fit_cor':None,
-                    'fit_cov':None,
-                    #'fit_cor':f_par_cor[cnt],
-                    #'fit_cov':f_par_cov[cnt],
+                    'fit_cor':f_par_matrix,
+                    'fit_cov':f_par_matrix,
                     'free':f_par_free[cnt],
                     'used_':True,
                     'comment_':None})
             else:
                 print('type not recognized');
-        # add data to the database
-        self.fittedData=fittedData;
-        self.fittedFluxes=fittedFluxes;
-        self.fittedFragments=fittedFragments;
-        self.fittedMeasuredFluxes=fittedMeasuredFluxes;
-        self.fittedMeasuredFragments=fittedMeasuredFragments;
-        self.fittedMeasuredFluxResiduals=fittedMeasuredFluxResiduals;
-        self.fittedMeasuredFragmentResiduals=fittedMeasuredFragmentResiduals;
-        self.simulationParameters=simulationParameters;
\ No newline at end of file
+        profiler.stop('import.parameters',len(f_par_type));
+        return {'fittedFluxes':fittedFluxes,'fittedFragments':fittedFragments};
@@ -0,0 +1,269 @@
+# Dependencies from 3rd party
+import scipy.io
+import numpy
+import h5py
+def read_INCAResults(filename_I, variable_names_I=['m','f']):
+    '''return the loader for an INCA result file
+    INPUT:
+    filename_I = string, name of the matlab file
+    variable_names_I = [], names of the variables to read (v7 and earlier files)
+    OUTPUT:
+    inca_matH5 for MATLAB v7.3 (HDF5) files, inca_mat otherwise'''
+    if h5py.is_hdf5(filename_I):
+        return inca_matH5(filename_I);
+    return inca_mat(filename_I, variable_names_I);
+class inca_mat():
+    '''single-pass loader for INCA result files (.mat)
+    The file is parsed once and only the variables that are consumed by inca_i
+    (m = model, f = fitdata) are read; the simdata (s) is only parsed on request.
+    The get_* methods return the struct fields used by inca_i
+    as plain python lists (one entry per struct element)'''
+    def __init__(self, filename_I=None, variable_names_I=['m','f']):
+        self.filename = None;
+        self.variables = {};
+        if filename_I:
+            self.load(filename_I, variable_names_I);
+    def load(self, filename_I, variable_names_I=['m','f']):
+        '''parse the requested variables from the .mat file in a single pass
+        INPUT:
+        filename_I = string, name of the matlab file
+        variable_names_I = [], names of the variables to read (None reads all)'''
+        self.filename = filename_I;
+        self.variables = scipy.io.loadmat(filename_I, variable_names=variable_names_I);
+    def close(self):
+        '''release the parsed variables'''
+        self.variables = {};
+    def get_variable(self, variable_name_I):
+        '''return a variable, reading it from the file if it was not part of the initial load'''
+        if not variable_name_I in self.variables:
+            self.variables.update(scipy.io.loadmat(self.filename, variable_names=[variable_name_I]));
+        return self.variables[variable_name_I];
+    def get_options(self):
+        '''return the model options (m.options)
+        OUTPUT:
+        options_O = {}, option name: unwrapped value'''
+        options = self.get_variable('m')['options'][0][0][0];
+        options_O = {};
+        for field in options.dtype.names:
+            options_O[field] = self._unwrap(options[field][0]);
+        return options_O;
+    def get_fit(self):
+        '''return the fit statistics (f.Echi2, f.alf, f.chi2, f.dof)
+        OUTPUT:
+        fit_O = {}, Echi2 = [] of floats, alf/chi2/dof = float'''
+        f = self.get_variable('f');
+        fit_O = {'Echi2':[float(d) for d in f['Echi2'][0][0][0]],
+            'alf':float(f['alf'][0][0][0][0]),
+            'chi2':float(f['chi2'][0][0][0][0]),
+            'dof':float(f['dof'][0][0][0][0])};
+        return fit_O;
+    def get_measurements(self):
+        '''return the measurement summaries (f.mnt)
+        OUTPUT:
+        mnt_O = {}, id/expt/type = [] of strings, sres = [] of floats'''
+        mnt = self.get_variable('f')['mnt'][0][0][0];
+        mnt_O = {'id':[str(d[0]) for d in mnt['id']],
+            'sres':[float(d[0][0]) for d in mnt['sres']],
+            'expt':[str(d[0]) for d in mnt['expt']],
+            'type':[str(d[0]) for d in mnt['type']]};
+        return mnt_O;
+    def get_residuals(self, fields_I=['val','fit','type','id','std','time','expt','data','peak']):
+        '''return the first residual of each measurement (f.mnt.res)
+        INPUT:
+        fields_I = [], names of the f.mnt.res fields to extract
+        OUTPUT:
+        res_O = {}, val/fit/std/time/data = [] of floats, type/id/expt = [] of strings,
+            peak = [] of strings (None if empty), esens/msens = [] of the raw arrays'''
+        res_O = {field:[] for field in fields_I};
+        for d in self.get_variable('f')['mnt'][0][0][0]['res']:
+            res = d[0][0];
+            for field in fields_I:
+                if field in ['esens','msens']:
+                    res_O[field].append(res[field]);
+                elif field in ['type','id','expt','peak']:
+                    res_O[field].append(str(res[field][0]) if res[field].size else None);
+                else:
+                    res_O[field].append(float(res[field][0][0]));
+        return res_O;
+    def get_parameters(self, fields_I=['id','val','std','type','lb','ub','unit','alf','free']):
+        '''return the fitted parameters (f.par)
+        INPUT:
+        fields_I = [], names of the f.par fields to extract
+        OUTPUT:
+        par_O = {}, field: one entry per parameter;
+            numeric fields as float64 arrays (NaN for empty cells),
+            string fields as [] of strings (None for empty cells),
+            chi2s/cor/cov are returned as the raw arrays'''
+        par = self.get_variable('f')['par'][0][0][0];
+        par_O = {};
+        for field in fields_I:
+            if field in ['chi2s','cor','cov']:
+                par_O[field] = [d for d in par[field]];
+            elif field in ['id','type','unit']:
+                par_O[field] = [str(d[0]) if d.size else None for d in par[field]];
+            else:
+                par_O[field] = numpy.fromiter((d.flat[0] if d.size else numpy.nan for d in par[field]),
+                    dtype=numpy.float64, count=len(par[field]));
+        return par_O;
+    def _unwrap(self, value_I):
+        '''unwrap a matlab char array to a string or a numeric array to its first element'''
+        if not value_I.size:
+            return None;
+        elif value_I.dtype.kind == 'U':
+            return str(value_I[0]);
+        return value_I[0][0];
+class inca_matH5():
+    '''lazy loader for INCA result files saved as MATLAB v7.3 (HDF5) .mat files
+    The m/f/s structs are navigated without reading them; a dataset is only read
+    when the get_* method that consumes it is called.
+    Large numeric blocks (e.g., f.par.cov or f.mnt.res.esens) are returned as
+    read-only memory maps (contiguous datasets) or as chunk-read inca_h5array views
+    (chunked/compressed datasets) instead of being read into memory.
+    The get_* methods return the same structures as inca_mat'''
+    def __init__(self, filename_I=None, mmap_size_I=4096):
+        self.filename = None;
+        self.file = None;
+        self.mmap_size = mmap_size_I; # numeric blocks of at least this many elements are not read into memory
+        if filename_I:
+            self.load(filename_I);
+    def load(self, filename_I, variable_names_I=None):
+        '''open the HDF5 file (variables are read lazily)
+        INPUT:
+        filename_I = string, name of the matlab file
+        variable_names_I = not used (for compatibility with inca_mat)'''
+        self.close();
+        self.filename = filename_I;
+        self.file = h5py.File(filename_I,'r');
+    def close(self):
+        '''close the HDF5 file'''
+        if self.file:
+            self.file.close();
+            self.file = None;
+    def get_variable(self, variable_name_I):
+        '''return the (unread) HDF5 group of a variable'''
+        return self.file[variable_name_I];
+    def get_options(self):
+        '''return the model options (m.options)
+        OUTPUT:
+        options_O = {}, option name: unwrapped value'''
+        options = self.get_variable('m')['options'];
+        options_O = {};
+        for field in options:
+            options_O[field] = self._unwrap(options[field]);
+        return options_O;
+    def get_fit(self):
+        '''return the fit statistics (f.Echi2, f.alf, f.chi2, f.dof)
+        OUTPUT:
+        fit_O = {}, Echi2 = [] of floats, alf/chi2/dof = float'''
+        f = self.get_variable('f');
+        fit_O = {'Echi2':[float(d) for d in self._read(f['Echi2']).ravel()],
+            'alf':float(self._unwrap(f['alf'])),
+            'chi2':float(self._unwrap(f['chi2'])),
+            'dof':float(self._unwrap(f['dof']))};
+        return fit_O;
+    def get_measurements(self):
+        '''return the measurement summaries (f.mnt)
+        OUTPUT:
+        mnt_O = {}, id/expt/type = [] of strings, sres = [] of floats'''
+        mnt = self.get_variable('f')['mnt'];
+        mnt_O = {'id':[self._unwrap(d) for d in self._elements(mnt,'id')],
+            'sres':[float(self._unwrap(d)) for d in self._elements(mnt,'sres')],
+            'expt':[self._unwrap(d) for d in self._elements(mnt,'expt')],
+            'type':[self._unwrap(d) for d in self._elements(mnt,'type')]};
+        return mnt_O;
+    def get_residuals(self, fields_I=['val','fit','type','id','std','time','expt','data','peak']):
+        '''return the first residual of each measurement (f.mnt.res)
+        INPUT:
+        fields_I = [], names of the f.mnt.res fields to extract
+        OUTPUT:
+        res_O = {}, val/fit/std/time/data = [] of floats, type/id/expt = [] of strings,
+            peak = [] of strings (None if empty), esens/msens = [] of lazy arrays'''
+        res_O = {field:[] for field in fields_I};
+        for res in self._elements(self.get_variable('f')['mnt'],'res'):
+            for field in fields_I:
+                d = self._elements(res,field)[0];
+                if field in ['esens','msens']:
+                    res_O[field].append(self._array(d));
+                elif field in ['type','id','expt','peak']:
+                    res_O[field].append(self._unwrap(d));
+                else:
+                    res_O[field].append(float(self._unwrap(d)));
+        return res_O;
+    def get_parameters(self, fields_I=['id','val','std','type','lb','ub','unit','alf','free']):
+        '''return the fitted parameters (f.par)
+        INPUT:
+        fields_I = [], names of the f.par fields to extract
+        OUTPUT:
+        par_O = {}, field: one entry per parameter;
+            numeric fields as float64 arrays (NaN for empty cells),
+            string fields as [] of strings (None for empty cells),
+            chi2s/cor/cov are returned as lazy arrays'''
+        par = self.get_variable('f')['par'];
+        par_O = {};
+        for field in fields_I:
+            if field in ['chi2s','cor','cov']:
+                par_O[field] = [self._array(d) for d in self._elements(par,field)];
+            elif field in ['id','type','unit']:
+                par_O[field] = [self._unwrap(d) for d in self._elements(par,field)];
+            else:
+                elements = self._elements(par,field);
+                par_O[field] = numpy.fromiter((numpy.nan if self._is_empty(d) else self._unwrap(d) for d in elements),
+                    dtype=numpy.float64, count=len(elements));
+        return par_O;
+    def _elements(self, struct_I, field_I):
+        '''return the datasets/groups of a field for each element of a struct (array)
+        Fields of struct arrays are stored as datasets of object references'''
+        field = struct_I[field_I];
+        if isinstance(field, h5py.Dataset) and not 'MATLAB_class' in field.attrs and \
+            h5py.check_ref_dtype(field.dtype):
+            return [self.file[ref] for ref in field[()].T.ravel()];
+        return [field];
+    def _is_empty(self, dataset_I):
+        '''check if a dataset is an empty matlab array'''
+        return bool(dataset_I.attrs.get('MATLAB_empty',0));
+    def _read(self, dataset_I):
+        '''read a numeric dataset in matlab (column-major) orientation'''
+        if self._is_empty(dataset_I):
+            return numpy.zeros(tuple(dataset_I[()]));
+        return dataset_I[()].T;
+    def _unwrap(self, dataset_I):
+        '''unwrap a matlab char array to a string or a numeric array to its first element'''
+        if self._is_empty(dataset_I):
+            return None;
+        matlab_class = dataset_I.attrs.get('MATLAB_class',b'');
+        if isinstance(matlab_class, bytes): matlab_class = matlab_class.decode('utf-8');
+        if matlab_class == 'char':
+            return dataset_I[()].T.astype('uint16').tobytes().decode('utf-16-le');
+        elif matlab_class == 'cell':
+            return self._unwrap(self.file[dataset_I[()].ravel()[0]]);
+        return dataset_I[()].ravel()[0];
+    def _array(self, dataset_I):
+        '''return a numeric dataset without reading large blocks into memory'''
+        if self._is_empty(dataset_I) or dataset_I.size < self.mmap_size:
+            return self._read(dataset_I);
+        offset = dataset_I.id.get_offset();
+        if dataset_I.chunks is None and dataset_I.compression is None and offset is not None:
+            return numpy.memmap(self.filename, dtype=dataset_I.dtype, mode='r',
+                offset=offset, shape=dataset_I.shape).T;
+        return inca_h5array(dataset_I);
+class inca_h5array():
+    '''chunk-read view of a MATLAB HDF5 dataset in matlab (column-major) orientation
+    Only the chunks needed for the requested slice are read'''
+    def __init__(self, dataset_I):
+        self.dataset = dataset_I;
+        self.shape = tuple(reversed(dataset_I.shape));
+        self.ndim = len(self.shape);
+        self.size = dataset_I.size;
+        self.dtype = dataset_I.dtype;
+    def __len__(self):
+        return self.shape[0];
+    def __getitem__(self, index_I):
+        if not isinstance(index_I, tuple):
+            index_I = (index_I,);
+        index = index_I + (slice(None),)*(self.ndim-len(index_I));
+        return numpy.asarray(self.dataset[tuple(reversed(index))]).T;
+    def __array__(self, dtype=None, copy=None):
+        array = self.dataset[()].T;
+        if dtype:
+            return array.astype(dtype);
+        return array;
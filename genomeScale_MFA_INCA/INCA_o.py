@@ -1,3 +1,314 @@
+# System
+import json
+import os
+import sqlite3
+from datetime import datetime
+from operator import itemgetter
+# Dependencies from 3rd party
+import numpy
+import h5py
 
+from .INCA_table import inca_table
 class inca_o():
-    pass
\ No newline at end of file
+    '''class of methods to persist the inca_i result tables
+    HDF5 store (write_tables_HDF5, read_simulation_HDF5, get_simulationIds_HDF5):
+    one group per table with one chunked, compressed, resizable dataset per column
+    (plus a boolean <column>__null mask for None values). Strings, datetimes, and objects
+    (e.g., lists, stored as JSON) are stored as int32 codes into a <column>__categories dataset.
+    The store is append-only: each write appends the rows of each simulation as one contiguous
+    block and records the block in the _index_simulation_id/_index_range datasets of the table,
+    so that a simulation is read back without scanning the rows of the other simulations
+    (the last block of a simulation is returned if it was written more than once).
+    SQLite export (write_tables_SQLite): one table per inca_i table, indexed on
+    (simulation_id, rxn_id/fragment_id, time_point), loaded with batched executemany calls in one transaction per table'''
+    # column kinds of the inca_i tables ('string', 'float', 'int', 'bool', 'datetime', or 'object')
+    _common = [('simulation_id','string'),('simulation_dateAndTime','datetime')];
+    _used = [('used_','bool'),('comment_','string')];
+    table_schemas = {
+        'simulationParameters':[('cont_alpha','float'),('cont_reltol','float'),('cont_steps','float'),
+            ('fit_nudge','float'),('fit_reinit','bool'),('fit_reltol','float'),('fit_starts','float'),('fit_tau','float'),
+            ('hpc_on','bool'),('int_maxstep','float'),('int_reltol','float'),('int_senstol','float'),('int_timeout','float'),
+            ('int_tspan','float'),('ms_correct','bool'),('oed_crit','string'),('oed_reinit','bool'),('oed_tolf','float'),
+            ('oed_tolx','float'),('sim_more','bool'),('sim_na','bool'),('sim_sens','bool'),('sim_ss','bool'),
+            ('sim_tunit','string'),('hpc_mcr','object'),('hpc_serve','string')] + _common + \
+            [('original_filename','string')] + _used,
+        'fittedData':_common + [('fitted_echi2','object'),('fitted_alf','float'),('fitted_chi2','float'),
+            ('fitted_dof','int')] + _used,
+        'fittedFluxes':_common + [('rxn_id','string'),('flux','float'),('flux_stdev','float'),('flux_lb','float'),
+            ('flux_ub','float'),('flux_units','string'),('fit_alf','float'),('fit_chi2s','int'),('fit_cor','int'),
+            ('fit_cov','int'),('free','bool')] + _used,
+        'fittedFragments':_common + [('experiment_id','string'),('sample_name_abbreviation','string'),
+            ('time_point','string'),('fragment_id','string'),('fragment_mass','float'),('fit_val','float'),
+            ('fit_stdev','float'),('fit_units','string'),('fit_alf','float'),('fit_cor','int'),('fit_cov','int'),
+            ('free','bool')] + _used,
+        'fittedMeasuredFluxes':_common + [('experiment_id','string'),('sample_name_abbreviation','string'),
+            ('rxn_id','string'),('fitted_sres','float')] + _used,
+        'fittedMeasuredFragments':_common + [('experiment_id','string'),('sample_name_abbreviation','string'),
+            ('fragment_id','string'),('fitted_sres','float')] + _used,
+        'fittedMeasuredFluxResiduals':_common + [('experiment_id','string'),('sample_name_abbreviation','string'),
+            ('time_point','string'),('rxn_id','string'),('res_data','float'),('res_fit','float'),('res_peak','string'),
+            ('res_stdev','float'),('res_val','float'),('res_msens','object'),('res_esens','object')] + _used,
+        'fittedMeasuredFragmentResiduals':_common + [('experiment_id','string'),('sample_name_abbreviation','string'),
+            ('time_point','string'),('fragment_id','string'),('fragment_mass','float'),('res_data','float'),
+            ('res_fit','float'),('res_peak','string'),('res_stdev','float'),('res_val','float'),('res_msens','object'),
+            ('res_esens','object')] + _used};
+    _sqlite_types = {'string':'TEXT','datetime':'TEXT','object':'TEXT','float':'REAL','int':'INTEGER','bool':'INTEGER'};
+    def __init__(self, chunk_size_I=4096, compression_I='gzip'):
+        self.chunk_size = chunk_size_I;
+        self.compression = compression_I;
+        # category codes of the categorical columns of the HDF5 stores written by this instance,
+        # so that appending to a store does not read its categories back
+        # (filename: (size and mtime of the file after the write, {} of (table, column): {} of category: code))
+        self.categories = {};
+    def write_tables_HDF5(self, filename_I, tables_I):
+        '''append the result tables to an HDF5 store (the file is created if needed)
+        INPUT:
+        filename_I = string, name of the HDF5 file
+        tables_I = {}, table name: [] of rows or inca_table (e.g., inca_i.get_tables())
+        OUTPUT:
+        rows_O = {}, table name: number of rows written'''
+        rows_O = {};
+        filename = os.path.abspath(filename_I);
+        # the cached codes are only used if the file was not changed since the last write of this instance
+        cached = self.categories.pop(filename, None);
+        categories = cached[1] if cached is not None and cached[0] == self._get_fileStat(filename) else {};
+        with h5py.File(filename_I,'a') as store:
+            for table,rows in tables_I.items():
+                if not table in self.table_schemas:
+                    raise ValueError('table ' + str(table) + ' not recognized');
+                rows_O[table] = self._append_table(store, table, rows, categories);
+        self.categories[filename] = (self._get_fileStat(filename), categories);
+        return rows_O;
+    def _get_fileStat(self, filename_I):
+        '''return the size and mtime of a file (None if the file does not exist)'''
+        try:
+            st = os.stat(filename_I);
+        except OSError:
+            return None;
+        return (st.st_size, st.st_mtime_ns);
+    def read_simulation_HDF5(self, filename_I, simulation_id_I, tables_I=None):
+        '''read the rows of a simulation from an HDF5 store
+        INPUT:
+        filename_I = string, name of the HDF5 file
+        simulation_id_I = string, simulation_id
+        tables_I = optional [], names of the tables to read (default: all tables)
+        OUTPUT:
+        tables_O = {}, table name: [] of row dicts (in the column order of the table schema)'''
+        tables_O = {};
+        with h5py.File(filename_I,'r') as store:
+            for table in (tables_I or list(self.table_schemas.keys())):
+                tables_O[table] = [];
+                if not table in store: continue;
+                group = store[table];
+                simulation_ids = self._read_strings(group['_index_simulation_id']);
+                blocks = [cnt for cnt,simulation_id in enumerate(simulation_ids) if simulation_id == simulation_id_I];
+                if not blocks: continue;
+                start,stop = [int(x) for x in group['_index_range'][blocks[-1]]];
+                columns = [];
+                for column,kind in self.table_schemas[table]:
+                    columns.append(self._read_column(group, column, kind, start, stop));
+                names = [column for column,kind in self.table_schemas[table]];
+                tables_O[table] = [dict(zip(names,row)) for row in zip(*columns)];
+        return tables_O;
+    def get_simulationIds_HDF5(self, filename_I):
+        '''return the simulation_ids in an HDF5 store (in the order they were first written)'''
+        simulation_ids_O = [];
+        with h5py.File(filename_I,'r') as store:
+            for table in self.table_schemas.keys():
+                if not table in store: continue;
+                for simulation_id in self._read_strings(store[table]['_index_simulation_id']):
+                    if not simulation_id in simulation_ids_O:
+                        simulation_ids_O.append(simulation_id);
+        return simulation_ids_O;
+    def write_tables_SQLite(self, filename_I, tables_I, batch_size_I=50000, replace_I=True, wal_I=False):
+        '''export the result tables to a SQLite database (the tables and indexes are created if needed)
+        INPUT:
+        filename_I = string, name of the SQLite file
+        tables_I = {}, table name: [] of rows or inca_table (e.g., inca_i.get_tables())
+        batch_size_I = int, number of rows inserted per executemany call
+            (the rows of each table are written in a single transaction)
+        replace_I = boolean, replace the rows of simulations that are already in the database
+            (i.e., upsert re-imported simulations; if False, the rows are added to the existing rows)
+        wal_I = boolean, switch the database to write-ahead logging (faster concurrent reads and writes;
+            the journal mode is a persistent property of the database file and is not restored)
+        OUTPUT:
+        rows_O = {}, table name: number of rows written'''
+        rows_O = {};
+        conn = sqlite3.connect(filename_I);
+        try:
+            if wal_I:
+                conn.execute('PRAGMA journal_mode=WAL');
+            conn.execute('PRAGMA synchronous=NORMAL');
+            for table,rows in tables_I.items():
+                if not table in self.table_schemas:
+                    raise ValueError('table ' + str(table) + ' not recognized');
+                self._create_table_SQLite(conn, table);
+                rows_O[table] = self._insert_table_SQLite(conn, table, rows, batch_size_I, replace_I);
+        finally:
+            conn.close();
+        return rows_O;
+    def _create_table_SQLite(self, conn_I, table_I):
+        '''create a table and its simulation_id index'''
+        schema = self.table_schemas[table_I];
+        columns = [column + ' ' + self._sqlite_types[kind] for column,kind in schema];
+        with conn_I:
+            conn_I.execute('CREATE TABLE IF NOT EXISTS "' + table_I + '" (' + ', '.join(columns) + ')');
+            names = [column for column,kind in schema];
+            index = ['simulation_id'] + [c for c in ['rxn_id','fragment_id','time_point'] if c in names];
+            conn_I.execute('CREATE INDEX IF NOT EXISTS "' + table_I + '_index" ON "' + table_I + '" (' + ', '.join(index) + ')');
+    def _insert_table_SQLite(self, conn_I, table_I, rows_I, batch_size_I, replace_I):
+        '''insert the rows of a table in a single transaction (in executemany calls of batch_size_I rows)'''
+        nrows = len(rows_I);
+        if not nrows: return 0;
+        schema = self.table_schemas[table_I];
+        columns = self._get_columns(table_I, rows_I);
+        values = [self._to_SQLite(kind, columns[column]) for column,kind in schema];
+        insert = 'INSERT INTO "' + table_I + '" VALUES (' + ', '.join(['?']*len(schema)) + ')';
+        rows = list(zip(*values));
+        # remove the previous rows of the simulations in the same transaction as the new rows,
+        # so that a failure leaves the previous rows of the table unchanged
+        with conn_I:
+            if replace_I:
+                simulation_ids = [(s,) for s in dict.fromkeys(values[[column for column,kind in schema].index('simulation_id')])];
+                conn_I.executemany('DELETE FROM "' + table_I + '" WHERE simulation_id = ?', simulation_ids);
+            for start in range(0, nrows, batch_size_I):
+                conn_I.executemany(insert, rows[start:start+batch_size_I]);
+        return nrows;
+    _sqlite_bound = {'float':(float,),'int':(int,),'bool':(bool,),'string':(str,),'datetime':(),'object':()};
+    def _to_SQLite(self, kind_I, values_I):
+        '''convert the values of a column to the types bound by sqlite3
+        (columns of python floats, ints, bools, or strings are passed as is)'''
+        types = set(map(type, values_I));
+        types.discard(type(None));
+        if all([issubclass(t, self._sqlite_bound[kind_I]) for t in types]):
+            return values_I;
+        elif kind_I == 'float':
+            return [None if v is None else float(v) for v in values_I];
+        elif kind_I in ['int','bool']:
+            return [None if v is None else int(v) for v in values_I];
+        elif kind_I == 'datetime':
+            # datetimes are repeated (one per simulation): convert each value once
+            isoformats = dict([(v, None if v is None else v.isoformat()) for v in set(values_I)]);
+            return [isoformats[v] for v in values_I];
+        elif kind_I == 'object':
+            return [None if v is None else json.dumps(v, default=self._to_json) for v in values_I];
+        return [None if v is None else str(v) for v in values_I];
+    def _get_columns(self, table_I, rows_I):
+        '''return the values of each schema column as a list (None for missing columns)'''
+        if isinstance(rows_I, inca_table):
+            rows_I.flush();
+            return dict([(column, rows_I._get_values(column) if column in rows_I.kinds else [None]*len(rows_I))
+                         for column,kind in self.table_schemas[table_I]]);
+        names = [column for column,kind in self.table_schemas[table_I]];
+        try:
+            # rows with all the schema columns: read all the columns of a row with one call
+            getter = itemgetter(*names);
+            columns = list(zip(*[getter(row) for row in rows_I]));
+        except KeyError:
+            columns = [[row.get(column) for row in rows_I] for column in names];
+        return dict(zip(names, [list(values) for values in columns]));
+    def _append_table(self, store_I, table_I, rows_I, categories_I=None):
+        '''append the rows of a table, one contiguous block per simulation
+        INPUT:
+        categories_I = optional {}, (table, column): {} of category: code of the store (updated)'''
+        nrows = len(rows_I);
+        if not nrows: return 0;
+        columns = self._get_columns(table_I, rows_I);
+        # order the rows by simulation (in order of first appearance)
+        simulations = {};
+        for cnt,simulation_id in enumerate(columns['simulation_id']):
+            simulations.setdefault(simulation_id,[]).append(cnt);
+        order = [cnt for indices in simulations.values() for cnt in indices];
+        if order != list(range(nrows)):
+            columns = dict([(column,[values[cnt] for cnt in order]) for column,values in columns.items()]);
+        group = store_I.require_group(table_I);
+        start = group['simulation_id'].shape[0] if 'simulation_id' in group else 0;
+        for column,kind in self.table_schemas[table_I]:
+            codes = None if categories_I is None else categories_I.setdefault((table_I,column), {});
+            values,null = self._encode(group, column, kind, columns[column], codes);
+            self._append(group, column, values);
+            self._append(group, column + '__null', null);
+        # index the blocks of the simulations
+        ranges = [];
+        for simulation_id,indices in simulations.items():
+            ranges.append([start, start + len(indices)]);
+            start += len(indices);
+        self._append(group, '_index_simulation_id', numpy.array([str(s) for s in simulations.keys()],dtype=object),
+                     dtype_I=h5py.string_dtype());
+        self._append(group, '_index_range', numpy.array(ranges,dtype=numpy.int64));
+        return nrows;
+    def _append(self, group_I, name_I, values_I, dtype_I=None):
+        '''append values to a resizable dataset (created on first use)'''
+        dtype = dtype_I if dtype_I is not None else values_I.dtype;
+        if not name_I in group_I:
+            shape = (0,) + values_I.shape[1:];
+            group_I.create_dataset(name_I, shape=shape, maxshape=(None,) + values_I.shape[1:], dtype=dtype,
+                chunks=(self.chunk_size,) + values_I.shape[1:], compression=self.compression);
+        dataset = group_I[name_I];
+        start = dataset.shape[0];
+        dataset.resize((start + len(values_I),) + values_I.shape[1:]);
+        dataset[start:] = values_I;
+    def _encode(self, group_I, column_I, kind_I, values_I, codes_I=None):
+        '''encode the values of a column
+        INPUT:
+        codes_I = optional {}, category: code of the column (read from the store if it does not match
+            the number of categories in the store; the new categories are added)
+        OUTPUT:
+        values_O = numpy array of the values (codes for string, datetime, and object columns)
+        null_O = numpy bool array, True for None values'''
+        null_O = numpy.array([v is None for v in values_I], dtype=numpy.bool_);
+        if kind_I == 'float':
+            return numpy.array([numpy.nan if v is None else v for v in values_I], dtype=numpy.float64), null_O;
+        elif kind_I == 'int':
+            return numpy.array([0 if v is None else v for v in values_I], dtype=numpy.int64), null_O;
+        elif kind_I == 'bool':
+            return numpy.array([False if v is None else v for v in values_I], dtype=numpy.bool_), null_O;
+        # categorical columns
+        name = column_I + '__categories';
+        codes = codes_I if codes_I is not None else {};
+        if len(codes) != (group_I[name].shape[0] if name in group_I else 0):
+            codes.clear();
+            codes.update([(category,cnt) for cnt,category in enumerate(self._read_strings(group_I[name]))]);
+        new = [];
+        values_O = numpy.zeros(len(values_I), dtype=numpy.int32);
+        for cnt,v in enumerate(values_I):
+            if v is None: continue;
+            if kind_I == 'datetime':
+                v = v.isoformat();
+            elif kind_I == 'object':
+                v = json.dumps(v, default=self._to_json);
+            else:
+                v = str(v);
+            code = codes.get(v);
+            if code is None:
+                code = len(codes);
+                codes[v] = code;
+                new.append(v);
+            values_O[cnt] = code;
+        if new or not name in group_I:
+            self._append(group_I, name, numpy.array(new, dtype=object), dtype_I=h5py.string_dtype());
+        return values_O, null_O;
+    def _read_column(self, group_I, column_I, kind_I, start_I, stop_I):
+        '''read (and decode) the values of a column in [start_I, stop_I)'''
+        values = group_I[column_I][start_I:stop_I];
+        null = group_I[column_I + '__null'][start_I:stop_I];
+        if kind_I in ['float','int','bool']:
+            values = values.tolist();
+        else:
+            categories = self._read_strings(group_I[column_I + '__categories']);
+            if kind_I == 'datetime':
+                categories = [datetime.fromisoformat(v) for v in categories];
+            elif kind_I == 'object':
+                categories = [json.loads(v) for v in categories];
+            values = [categories[code] if categories else None for code in values.tolist()];
+        return [None if n else v for v,n in zip(values, null.tolist())];
+    def _read_strings(self, dataset_I):
+        '''read a dataset of variable-length strings'''
+        return [v.decode('utf-8') if isinstance(v,bytes) else v for v in dataset_I[()]];
+    def _to_json(self, value_I):
+        '''convert numpy values for json'''
+        if isinstance(value_I, numpy.ndarray):
+            return value_I.tolist();
+        if isinstance(value_I, numpy.generic):
+            return value_I.item();
+        raise TypeError(str(type(value_I)) + ' is not JSON serializable');
@@ -0,0 +1,100 @@
+# System
+import time
+from contextlib import contextmanager, nullcontext
+
+class inca_profiler():
+    '''opt-in stage-level profiler of the INCA script writers and importer
+    Records the wall time, the number of calls, and the number of items (e.g., reactions,
+    fragments, or residuals) of each named stage (e.g., import.loadmat or model.reactions).
+    e.g.,
+        profiler = inca_profiler();
+        with profiler.attach(api, importer):
+            api.write_isotopomerExperiment_INCA(...);
+            importer.import_isotopomerSimulationResults_INCA(...);
+        report = profiler.get_report();
+    inca_api and inca_i use the shared null_profiler (whose methods do nothing)
+    unless a profiler is attached; stages in worker processes are not recorded'''
+    enabled = True;
+    def __init__(self):
+        self.stages = {}; # stage: {'seconds','calls','items'} (in the order the stages are first seen)
+        self.starts = {}; # stage: start time of a running stage
+    def start(self, stage_I):
+        '''start timing a stage'''
+        self.starts[stage_I] = time.perf_counter();
+    def stop(self, stage_I, items_I=0):
+        '''stop timing a stage
+        INPUT:
+        items_I = int, number of items processed by the stage'''
+        self._add(stage_I, time.perf_counter() - self.starts.pop(stage_I), 1, items_I);
+    @contextmanager
+    def stage(self, stage_I, items_I=0):
+        '''context manager that times a stage'''
+        start = time.perf_counter();
+        try:
+            yield self;
+        finally:
+            self._add(stage_I, time.perf_counter() - start, 1, items_I);
+    def count(self, stage_I, items_I=1):
+        '''add items to a stage without timing it (e.g., cache misses)'''
+        self._add(stage_I, 0.0, 0, items_I);
+    def iter_stage(self, stage_I, chunks_I, items_I=0):
+        '''time a generator of script chunks
+        (only the time spent generating the chunks is recorded, not the time spent by the consumer)'''
+        seconds = 0.0;
+        chunks = iter(chunks_I);
+        try:
+            while True:
+                start = time.perf_counter();
+                try:
+                    chunk = next(chunks);
+                except StopIteration:
+                    seconds += time.perf_counter() - start;
+                    return;
+                seconds += time.perf_counter() - start;
+                yield chunk;
+        finally:
+            self._add(stage_I, seconds, 1, items_I);
+    @contextmanager
+    def attach(self, *objects_I):
+        '''attach the profiler to inca_api/inca_i objects for the duration of the context'''
+        for obj in objects_I:
+            obj.set_profiler(self);
+        try:
+            yield self;
+        finally:
+            for obj in objects_I:
+                obj.set_profiler(None);
+    def get_report(self):
+        '''return the recorded stages
+        OUTPUT:
+        report_O = [], of {} stage, seconds, calls, items'''
+        return [dict(stage=stage, **values) for stage,values in self.stages.items()];
+    def reset(self):
+        '''clear the recorded stages'''
+        self.stages = {};
+        self.starts = {};
+    def _add(self, stage_I, seconds_I, calls_I, items_I):
+        values = self.stages.get(stage_I);
+        if values is None:
+            values = {'seconds':0.0,'calls':0,'items':0};
+            self.stages[stage_I] = values;
+        values['seconds'] += seconds_I;
+        values['calls'] += calls_I;
+        values['items'] += items_I;
+class inca_nullProfiler():
+    '''profiler that records nothing (used when no profiler is attached)'''
+    enabled = False;
+    _stage = nullcontext();
+    def start(self, stage_I):
+        pass;
+    def stop(self, stage_I, items_I=0):
+        pass;
+    def stage(self, stage_I, items_I=0):
+        return self._stage;
+    def count(self, stage_I, items_I=1):
+        pass;
+    def iter_stage(self, stage_I, chunks_I, items_I=0):
+        return chunks_I;
+    def get_report(self):
+        return [];
+null_profiler = inca_nullProfiler();
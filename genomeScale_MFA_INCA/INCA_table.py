@@ -0,0 +1,170 @@
+# System
+from numbers import Number
+# Dependencies from 3rd party
+import numpy
+class inca_table():
+    '''columnar table of inca_i results
+    Each column is stored as one typed numpy array:
+    bool, int and float columns as bool/int64/float64 arrays,
+    columns of strings and other repeated identifiers (e.g., simulation_id,
+    simulation_dateAndTime, rxn_id, fragment_id, or None) as int32 codes
+    into a lookup table of categories, and all other columns as object arrays.
+    Rows are buffered on append and converted to the columns on first access.
+    The table supports len(), iteration over the rows, append(), extend(), and to_dicts()
+    so that it can be used in place of a list of row dicts'''
+    def __init__(self, rows_I=None):
+        self.columns = []; # column names in order
+        self.kinds = {}; # column: 'bool', 'int', 'float', 'category', or 'object'
+        self.arrays = {}; # column: numpy array (codes for category columns)
+        self.categories = {}; # column: [] of category values
+        self.category_codes = {}; # column: {} of category value: code
+        self.nrows = 0;
+        self.pending = []; # rows (tuples in column order) that have not been converted
+        if rows_I:
+            self.extend(rows_I);
+    def __len__(self):
+        return self.nrows + len(self.pending);
+    def __iter__(self):
+        return iter(self.to_dicts());
+    def __getitem__(self, index_I):
+        '''return a column (by name) or a row (by index)'''
+        if isinstance(index_I, str):
+            return self.get_column(index_I);
+        return self.to_dicts()[index_I];
+    def append(self, row_I):
+        '''append a row
+        INPUT:
+        row_I = {}, column: value'''
+        for column in row_I:
+            if not column in self.columns:
+                self.columns.append(column);
+        self.pending.append(tuple([row_I.get(column) for column in self.columns]));
+    def extend(self, rows_I):
+        '''append rows
+        INPUT:
+        rows_I = inca_table or [] of row dicts'''
+        if isinstance(rows_I, inca_table):
+            self._extend_table(rows_I);
+        else:
+            for row in rows_I:
+                self.append(row);
+    def flush(self):
+        '''convert the buffered rows to the column arrays'''
+        if not self.pending: return;
+        for cnt,column in enumerate(self.columns):
+            values = [row[cnt] if cnt < len(row) else None for row in self.pending];
+            self._extend_column(column, values);
+        self.nrows += len(self.pending);
+        self.pending = [];
+    def get_column(self, column_I):
+        '''return the (decoded) values of a column as a numpy array'''
+        self.flush();
+        if self.kinds[column_I] == 'category':
+            categories = numpy.empty(len(self.categories[column_I]), dtype=object);
+            for cnt,value in enumerate(self.categories[column_I]):
+                categories[cnt] = value;
+            return categories[self.arrays[column_I]];
+        return self.arrays[column_I];
+    def get_codes(self, column_I):
+        '''return the codes and the categories of a category column
+        OUTPUT:
+        codes_O = numpy array of int32 codes
+        categories_O = [] of category values'''
+        self.flush();
+        return self.arrays[column_I], self.categories[column_I];
+    def to_dicts(self):
+        '''return the table as a list of row dicts (python scalars)'''
+        self.flush();
+        values = [self._get_values(column) for column in self.columns];
+        return [dict(zip(self.columns, row)) for row in zip(*values)];
+    def _get_values(self, column_I):
+        '''return the values of a column as a list of python objects'''
+        if self.kinds[column_I] == 'category':
+            categories = self.categories[column_I];
+            return [categories[code] for code in self.arrays[column_I].tolist()];
+        elif self.kinds[column_I] == 'object':
+            return list(self.arrays[column_I]);
+        return self.arrays[column_I].tolist();
+    def _get_kind(self, values_I):
+        '''determine the storage kind of a list of values'''
+        types = set([type(v) for v in values_I]);
+        if all([issubclass(t, (bool, numpy.bool_)) for t in types]):
+            return 'bool';
+        elif all([issubclass(t, (int, numpy.integer)) and not issubclass(t, bool) for t in types]):
+            return 'int';
+        elif all([issubclass(t, Number) and not issubclass(t, (bool, numpy.bool_)) for t in types]):
+            return 'float';
+        elif not any([issubclass(t, (Number, numpy.bool_, list, dict, set, numpy.ndarray)) for t in types]):
+            return 'category';
+        return 'object';
+    def _encode(self, column_I, values_I, kind_I):
+        '''encode a list of values as a numpy array of the given kind'''
+        if kind_I == 'bool':
+            return numpy.array(values_I, dtype=bool);
+        elif kind_I == 'int':
+            return numpy.array(values_I, dtype=numpy.int64);
+        elif kind_I == 'float':
+            return numpy.array(values_I, dtype=numpy.float64);
+        elif kind_I == 'category':
+            categories = self.categories.setdefault(column_I, []);
+            category_codes = self.category_codes.setdefault(column_I, {});
+            codes = numpy.empty(len(values_I), dtype=numpy.int32);
+            for cnt,value in enumerate(values_I):
+                code = category_codes.get(value);
+                if code is None:
+                    code = len(categories);
+                    category_codes[value] = code;
+                    categories.append(value);
+                codes[cnt] = code;
+            return codes;
+        array = numpy.empty(len(values_I), dtype=object);
+        for cnt,value in enumerate(values_I):
+            array[cnt] = value;
+        return array;
+    def _extend_column(self, column_I, values_I):
+        '''append a list of values to a column, changing the kind of the column if needed'''
+        if not column_I in self.kinds:
+            # new column: fill the rows that were stored before the column existed
+            values_I = [None]*self.nrows + values_I;
+            old_kind = None;
+        else:
+            old_kind = self.kinds[column_I];
+        kind = self._get_kind(values_I);
+        if old_kind and old_kind != kind:
+            # re-encode the column with a kind that fits all values
+            values_I = self._get_values(column_I) + values_I;
+            kind = self._get_kind(values_I);
+            self.categories.pop(column_I, None);
+            self.category_codes.pop(column_I, None);
+            old_kind = None;
+        array = self._encode(column_I, values_I, kind);
+        if old_kind:
+            array = numpy.concatenate([self.arrays[column_I], array]);
+        self.kinds[column_I] = kind;
+        self.arrays[column_I] = array;
+    def _extend_table(self, table_I):
+        '''append the rows of another inca_table column by column'''
+        self.flush();
+        table_I.flush();
+        for column in table_I.columns:
+            if not column in self.columns:
+                self.columns.append(column);
+        for column in self.columns:
+            if not column in table_I.kinds:
+                self._extend_column(column, [None]*table_I.nrows);
+            elif column in self.kinds and self.kinds[column] == 'category' and table_I.kinds[column] == 'category':
+                # map the codes of the other table onto the categories of this table
+                categories = self.categories[column];
+                category_codes = self.category_codes[column];
+                remap = numpy.empty(len(table_I.categories[column]), dtype=numpy.int32);
+                for cnt,value in enumerate(table_I.categories[column]):
+                    code = category_codes.get(value);
+                    if code is None:
+                        code = len(categories);
+                        category_codes[value] = code;
+                        categories.append(value);
+                    remap[cnt] = code;
+                self.arrays[column] = numpy.concatenate([self.arrays[column], remap[table_I.arrays[column]]]);
+            else:
+                self._extend_column(column, table_I._get_values(column));
+        self.nrows += table_I.nrows;
@@ -0,0 +1,64 @@
+# System
+import os
+import tempfile
+import unittest
+
+from genomeScale_MFA_INCA.INCA_benchmark import inca_benchmark
+from genomeScale_MFA_INCA.INCA_cache import inca_importCache
+from genomeScale_MFA_INCA.INCA_covariance import inca_covariance
+from genomeScale_MFA_INCA.INCA_i import inca_i
+
+class test_importCache(unittest.TestCase):
+    '''import of INCA result files with an import cache and a parameter store'''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory();
+        self.addCleanup(self.directory.cleanup);
+        benchmark = inca_benchmark();
+        parameters = benchmark.scales['toy'];
+        model = benchmark.make_model(parameters['n_reactions'],parameters['n_metabolites']);
+        experiments = benchmark.make_experiments(model,parameters['n_experiments'],parameters['n_fragments'],
+                                                 parameters['n_time_points']);
+        self.filename = os.path.join(self.directory.name,'results.mat');
+        self.simulation_info = benchmark.make_INCAResults(self.filename,model,experiments,parameters['n_parameters']);
+    def import_results(self, importCache_I, parameterStore_I=None):
+        importer = inca_i();
+        importer.import_isotopomerSimulationResults_INCA('simulation_1',self.filename,self.simulation_info,
+            parameterStore_I=parameterStore_I,importCache_I=importCache_I);
+        return importer;
+    def test_cacheHit(self):
+        cache = inca_importCache(os.path.join(self.directory.name,'cache'));
+        reference = self.import_results(cache);
+        importer = self.import_results(cache);
+        self.assertEqual(cache.get_statistics()['hits'],1);
+        self.assertEqual(importer.fittedFluxes,reference.fittedFluxes);
+    def test_cacheThenStore(self):
+        cache = inca_importCache(os.path.join(self.directory.name,'cache'));
+        self.import_results(cache);
+        store = inca_covariance(os.path.join(self.directory.name,'store.h5'));
+        importer = self.import_results(cache,store);
+        self.assertEqual(store.get_simulationIds(),['simulation_1']);
+        self.assertIsNotNone(importer.fittedFluxes[0]['fit_cov']);
+    def test_storeThenCache(self):
+        cache = inca_importCache(os.path.join(self.directory.name,'cache'));
+        store = inca_covariance(os.path.join(self.directory.name,'store.h5'));
+        self.import_results(cache,store);
+        # the cached rows reference the matrices of the store
+        importer = self.import_results(cache,store);
+        self.assertEqual(cache.get_statistics()['hits'],1);
+        self.assertIsNotNone(importer.fittedFluxes[0]['fit_cov']);
+        importer = self.import_results(cache);
+        self.assertEqual(cache.get_statistics()['hits'],1);
+        self.assertIsNone(importer.fittedFluxes[0]['fit_cov']);
+    def test_storeWithoutSimulation(self):
+        cache = inca_importCache(os.path.join(self.directory.name,'cache'));
+        store = inca_covariance(os.path.join(self.directory.name,'store.h5'));
+        self.import_results(cache,store);
+        # the cache is not used for a store that does not hold the matrices of the simulation
+        os.remove(store.path);
+        importer = self.import_results(cache,store);
+        self.assertEqual(cache.get_statistics()['hits'],0);
+        self.assertEqual(store.get_simulationIds(),['simulation_1']);
+        self.assertIsNotNone(importer.fittedFluxes[0]['fit_cov']);
+
+if __name__ == '__main__':
+    unittest.main();
@@ -0,0 +1,125 @@
+# System
+import math
+import random
+import re
+import unittest
+
+from genomeScale_MFA_INCA.INCA_api import inca_api
+
+_cell_assignment = re.compile(r"m\.expts\((\d+)\)\.data_ms\((\d+)\)\.mdvs\.(val|std|id|time)\((\d+),(\d+)\) = (.*);$");
+_matrix_assignment = re.compile(r"m\.expts\((\d+)\)\.data_ms\((\d+)\)\.mdvs\.(val|std|id|time) = (.*);$");
+def _parse_number(value_I):
+    return float('nan') if value_I == 'NaN' else float(value_I);
+def run_cellAssignments(script_I):
+    '''run the element-wise mdvs.val/std/id/time(i,j) = ... assignments of a 'cell' script
+    with matlab growth semantics (numeric arrays are padded with 0, cell arrays with [] (None))
+    OUTPUT:
+    fields_O = {}, (experiment, fragment, field): [] of rows'''
+    elements = {};
+    for line in script_I.split('\n'):
+        match = _cell_assignment.match(line);
+        if not match: continue;
+        experiment,fragment,field,row,column,value = match.groups();
+        if field == 'id':
+            # e.g., {'frag0_2_0_e1'}
+            value = value[2:-2];
+        else:
+            value = _parse_number(value);
+        elements.setdefault((int(experiment),int(fragment),field),{})[(int(row),int(column))] = value;
+    fields_O = {};
+    for key,values in elements.items():
+        nrows = max([row for row,column in values.keys()]);
+        ncolumns = max([column for row,column in values.keys()]);
+        fill = None if key[2] == 'id' else 0.0;
+        fields_O[key] = [[values.get((row,column),fill) for column in range(1,ncolumns+1)] for row in range(1,nrows+1)];
+    return fields_O;
+def run_matrixAssignments(script_I):
+    '''run the mdvs.val/std/id/time = [...] literal assignments of a 'matrix' script
+    OUTPUT:
+    fields_O = {}, (experiment, fragment, field): [] of rows'''
+    fields_O = {};
+    for line in script_I.split('\n'):
+        match = _matrix_assignment.match(line);
+        if not match: continue;
+        experiment,fragment,field,value = match.groups();
+        if field == 'id':
+            # e.g., {'frag0_2_0_e1',[],'frag0_3_2_e1'}
+            value = [[None if name == '[]' else name[1:-1] for name in value[1:-1].split(',')]];
+        else:
+            value = [[_parse_number(v) for v in row.split(',')] for row in value[1:-1].split(';')];
+        fields_O[(int(experiment),int(fragment),field)] = value;
+    return fields_O;
+def make_experiments(seed_I, shared_experiment_id_I=False, n_fragments_I=6, n_time_points_I=4):
+    '''make the model, measured fluxes, MS data, and tracers of two parallel labeling experiments
+    with missing time points, MS records without measurements, and duplicate records'''
+    rand = random.Random(seed_I);
+    experiments = [('e1','s1'),('e1','s2')] if shared_experiment_id_I else [('e1','s1'),('e2','s2')];
+    modelReaction_data = [{'rxn_id':'R%d' %(cnt),'rxn_equation':'1.0*A%d (C1:a) -> 1.0*B%d (C1:a)' %(cnt,cnt),
+        'lower_bound':0.0,'upper_bound':1000.0,'flux_val':1.0} for cnt in range(10)];
+    modelMetabolite_data = [{'met_id':'M%d_c' %(cnt),'met_atompositions':[0,1,2],'met_elements':['C']*3,
+        'met_symmetry_atompositions':[],'met_symmetry_elements':[]} for cnt in range(n_fragments_I)];
+    measuredFluxes_data = []; experimentalMS_data = []; tracer = [];
+    for experiment_id,sample_name_abbreviation in experiments:
+        measuredFluxes_data.append({'experiment_id':experiment_id,'sample_name_abbreviation':sample_name_abbreviation,
+            'rxn_id':'R1','flux_lb':0.5,'flux_ub':1.5,'flux_average':1.0,'flux_stdev':0.1});
+        tracer.append({'experiment_id':experiment_id,'sample_name_abbreviation':sample_name_abbreviation,
+            'met_name':'[1-13C]glc','met_id':'glc_DASH_D_e','met_atompositions':[1],'met_elements':['C'],'ratio':1.0});
+        for fragment in range(n_fragments_I):
+            for time in range(n_time_points_I):
+                # missing time points (including leading and trailing ones)
+                if rand.random() < 0.3: continue;
+                n_mdvs = rand.randint(2,5);
+                average = [rand.choice([0.0,1e-7,rand.random()]) for cnt in range(n_mdvs)];
+                stdev = [rand.choice([0.0,1e-4,rand.random()*0.1]) for cnt in range(n_mdvs)];
+                if rand.random() < 0.1:
+                    # not measured (to be added/simulated later)
+                    average = [];
+                experimentalMS_data.append({'experiment_id':experiment_id,'sample_name_abbreviation':sample_name_abbreviation,
+                    'fragment_id':'frag%d' %(fragment),'met_id':'M%d_c' %(fragment),'time_point':str(time*0.5),
+                    'met_atompositions':[0,1,2],'met_elements':['C']*3,
+                    'intensity_normalized_average':average,'intensity_normalized_stdev':stdev});
+    # duplicate records of the same fragment and time point (with fewer MDV elements)
+    for row in rand.sample(experimentalMS_data,5):
+        experimentalMS_data.append(dict(row,intensity_normalized_average=row['intensity_normalized_average'][:2]));
+    return modelReaction_data,modelMetabolite_data,measuredFluxes_data,experimentalMS_data,tracer;
+class test_mdvFormat(unittest.TestCase):
+    '''the 'matrix' MDV format is numerically identical to the element-wise 'cell' format'''
+    def assertFieldsEqual(self, cell_I, matrix_I):
+        self.assertEqual(sorted(cell_I.keys()), sorted(matrix_I.keys()));
+        for key in cell_I.keys():
+            cell,matrix = cell_I[key],matrix_I[key];
+            self.assertEqual([len(row) for row in cell], [len(row) for row in matrix], key);
+            for cell_row,matrix_row in zip(cell,matrix):
+                for cell_value,matrix_value in zip(cell_row,matrix_row):
+                    if isinstance(cell_value,float) and math.isnan(cell_value):
+                        self.assertTrue(math.isnan(matrix_value), key);
+                    else:
+                        self.assertEqual(cell_value, matrix_value, key);
+    def test_cellAndMatrixFormats(self):
+        api = inca_api();
+        for seed in range(8):
+            for parallel in ['experiment_id','sample_name_abbreviation']:
+                with self.subTest(seed=seed, parallel=parallel):
+                    experiments = make_experiments(seed, shared_experiment_id_I=seed%2==1);
+                    cell = api.writeScript_experiment_INCA(*experiments,parallel_I=parallel,mdv_format_I='cell');
+                    matrix = api.writeScript_experiment_INCA(*experiments,parallel_I=parallel,mdv_format_I='matrix');
+                    cell_fields = run_cellAssignments(cell);
+                    matrix_fields = run_matrixAssignments(matrix);
+                    self.assertTrue(cell_fields);
+                    self.assertFieldsEqual(cell_fields, matrix_fields);
+    def test_unmeasuredTimePoints(self):
+        '''time points without measurements are [] in the id cell and 0 in time (as the padding of matlab)'''
+        api = inca_api();
+        experiments = make_experiments(0, n_fragments_I=1, n_time_points_I=3);
+        ms_data = [dict(experiments[3][0],experiment_id='e1',sample_name_abbreviation='s1',time_point=time_point)
+                   for time_point in ['0.0','1.0']];
+        ms_data[0]['intensity_normalized_average'] = [0.25,0.75];
+        ms_data[1]['intensity_normalized_average'] = [0.5,0.5];
+        experiments = experiments[:3] + (ms_data + [dict(ms_data[0],time_point='0.5',intensity_normalized_average=[])],) + experiments[4:];
+        cell = run_cellAssignments(api.writeScript_experiment_INCA(*experiments,mdv_format_I='cell'));
+        matrix = run_matrixAssignments(api.writeScript_experiment_INCA(*experiments,mdv_format_I='matrix'));
+        self.assertFieldsEqual(cell, matrix);
+        self.assertEqual(matrix[(1,1,'id')], [['frag0_1_0_e1',None,'frag0_1_2_e1']]);
+        self.assertEqual(matrix[(1,1,'time')], [[0.0,0.0,1.0]]);
+if __name__ == '__main__':
+    unittest.main();